@@ -1,4 +1,5 @@
 from .dataframe import DataFrame
+from .assets.numba_kernels import warmup
 
 from ._version import get_versions
 
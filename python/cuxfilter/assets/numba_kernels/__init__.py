@@ -1,6 +1,12 @@
 from .gpu_histogram import (
     calc_value_counts,
+    calc_value_counts_by_edges,
+    calc_bin_edges,
+    calc_min_max_columns,
     calc_groupby,
+    calc_fused_aggregates,
+    is_fused_aggregate,
     aggregated_column_unique,
 )
 from .gpu_datatile import calc_data_tile
+from .warmup import warmup
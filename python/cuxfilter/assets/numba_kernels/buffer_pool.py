@@ -0,0 +1,122 @@
+import threading
+from collections import OrderedDict
+
+import numba
+import numpy as np
+from numba import cuda
+
+# on-disk caching of the compiled CUDA kernels, supported from numba 0.55
+CUDA_JIT_OPTIONS = (
+    {"cache": True}
+    if tuple(int(i) for i in numba.__version__.split(".")[:2]) >= (0, 55)
+    else {}
+)
+
+
+@cuda.jit(**CUDA_JIT_OPTIONS)
+def fill(x, value):
+    """
+    description:
+        cuda jit to set every element of a 1d array to value
+    input:
+        - x -> single col nd-array
+        - value -> fill value
+    """
+    start = cuda.grid(1)
+    s = cuda.gridsize(1)
+    for i in range(start, x.shape[0], s):
+        x[i] = value
+
+
+class BufferPool:
+    """
+    Pool of device scratch buffers reused across kernel launches, keyed by
+    name, shape and dtype.
+
+    The buffers of each thread are kept apart, so that concurrent
+    callbacks never share a buffer. A buffer is only valid until the next
+    request for the same key on the same thread, callers copy results to
+    the host before returning them. At most max_buffers buffers holding
+    at most max_bytes are kept per thread, the least recently used ones
+    are released first. Buffers larger than max_bytes are not pooled.
+    """
+
+    max_buffers: int = 64
+    max_bytes: int = 2**28
+
+    def __init__(self, max_buffers=64, max_bytes=2**28):
+        self.max_buffers = max_buffers
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+
+    @property
+    def _buffers(self):
+        if not hasattr(self._local, "buffers"):
+            self._local.buffers = OrderedDict()
+            self._local.nbytes = 0
+        return self._local.buffers
+
+    @property
+    def nbytes(self):
+        """
+        size in bytes of the buffers kept for the current thread
+        """
+        return getattr(self._local, "nbytes", 0)
+
+    def device_array(self, name, shape, dtype):
+        """
+        uninitialized device array of shape and dtype
+        """
+        if isinstance(shape, int):
+            shape = (shape,)
+        key = (name, tuple(int(i) for i in shape), np.dtype(dtype).str)
+        nbytes = int(np.prod(key[1])) * np.dtype(dtype).itemsize
+        if nbytes > self.max_bytes:
+            return cuda.device_array(key[1], dtype=dtype)
+        buffers = self._buffers
+        if key in buffers:
+            buffers.move_to_end(key)
+        else:
+            buffers[key] = cuda.device_array(key[1], dtype=dtype)
+            self._local.nbytes += nbytes
+            while (
+                len(buffers) > self.max_buffers
+                or self._local.nbytes > self.max_bytes
+            ):
+                _, buffer = buffers.popitem(last=False)
+                self._local.nbytes -= buffer.size * buffer.dtype.itemsize
+        return buffers[key]
+
+    def full(self, name, shape, dtype, value):
+        """
+        device array of shape and dtype with every element set to value
+        """
+        buffer = self.device_array(name, shape, dtype)
+        if buffer.size > 0:
+            fill[64, 64](buffer.reshape(buffer.size), value)
+        return buffer
+
+    def zeros(self, name, shape, dtype):
+        """
+        device array of shape and dtype filled with zeros
+        """
+        return self.full(name, shape, dtype, 0)
+
+    def to_device(self, name, array):
+        """
+        device copy of the host array
+        """
+        array = np.ascontiguousarray(array)
+        buffer = self.device_array(name, array.shape, array.dtype)
+        buffer.copy_to_device(array)
+        return buffer
+
+    def clear(self):
+        """
+        release the buffers of the current thread
+        """
+        self._buffers.clear()
+        self._local.nbytes = 0
+
+
+buffer_pool = BufferPool()
@@ -1,16 +1,19 @@
+import math
 import numpy as np
 from numba import cuda
+import cudf
 import pyarrow as pa
 import pandas as pd
 import io
-import gc
 from bokeh.models import ColumnDataSource
 from typing import Type
 
 from ...charts.core.core_chart import BaseChart
+from ..quantile_sketch import QuantileSketch
+from .buffer_pool import CUDA_JIT_OPTIONS, buffer_pool, fill
 
 
-@cuda.jit
+@cuda.jit(**CUDA_JIT_OPTIONS)
 def calc_cumsum_data_tile(x, arr1):
     """
     description:
@@ -40,15 +43,66 @@ def calc_cumsum_data_tile(x, arr1):
                 arr1[col2_i][col1_i] = (arr1[col2_i][col1_i] + freq_i) / 2
 
 
-@cuda.jit
-def calc_binwise_reduced_column(x, stride, a_range):
+def get_kernel_column(a_gpu):
+    """
+    description:
+        view of a column in a dtype the kernels specialize on, datetime64
+        columns are viewed as int64 in their own time unit
+    input:
+        - a_gpu -> single col nd-array
+    output:
+        - single col nd-array, without copying a_gpu
+    """
+    if a_gpu.dtype.kind == "M":
+        return a_gpu.view(np.int64)
+    return a_gpu
+
+
+def get_kernel_dtype(dtype):
+    """
+    description:
+        dtype of the ranges and statistics passed to the kernels along a
+        column of dtype, int64 for integer and datetime columns so that
+        differences to the range are exact, float64 otherwise
+    input:
+        - dtype
+    output:
+        - np.int64 or np.float64
+    """
+    return np.int64 if np.dtype(dtype).kind in "iuM" else np.float64
+
+
+def get_kernel_range(a_gpu, a_min, a_max, name="bin_range"):
+    """
+    description:
+        device (min, max) array in the kernel dtype of a_gpu, see
+        get_kernel_dtype. Ranges with a fraction fall back to float64
+    input:
+        - a_gpu -> single col nd-array the range applies to
+        - a_min, a_max -> range values
+        - name -> buffer pool key
+    output:
+        - device ndarray => shape(2,)
+    """
+    values = np.array([a_min, a_max])
+    if a_gpu.dtype.kind == "M":
+        values = values.astype(a_gpu.dtype).astype(np.int64)
+    dtype = get_kernel_dtype(a_gpu.dtype)
+    if dtype == np.int64 and not np.all(np.mod(values, 1) == 0):
+        dtype = np.float64
+    return buffer_pool.to_device(name, values.astype(dtype))
+
+
+@cuda.jit(**CUDA_JIT_OPTIONS)
+def calc_binwise_reduced_column(x, stride, a_range, out):
     """
     description:
         cuda jit for creating a full-lenth column with only binned values
     input:
-        - x -> single col nd-array
+        - x -> single col nd-array of any numeric dtype
         - stride -> stride value
         - a_range -> min-max values (ndarray => shape(2,))
+        - out -> int32 nd-array of the bin codes, same length as x
     """
     a_min = a_range[0]
     a_max = a_range[1]
@@ -56,25 +110,113 @@ def calc_binwise_reduced_column(x, stride, a_range):
     s = cuda.gridsize(1)
     for i in range(start, x.shape[0], s):
         if x[i] >= a_min and x[i] <= a_max:
-            x[i] = np.int32(round((x[i] - a_min) / stride))
+            out[i] = np.int32(round((x[i] - a_min) / stride))
         else:
-            x[i] = -1
+            out[i] = -1
 
 
 def get_binwise_reduced_column(a_gpu, stride, a_range):
     """
     description:
         calls the cuda jit function calc_binwise_reduced_column and
-        returns the result
+        returns the result, a_gpu is left unchanged
     input:
         - a_gpu -> single col nd-array
         - stride -> stride value
-        - a_range -> min-max values (ndarray => shape(2,))
+        - a_range -> min-max values (ndarray => shape(2,)), in the dtype
+            returned by get_kernel_range for exact integer binning
     output:
-        - a_gpu -> single col resulting nd-array
+        - int32 single col resulting nd-array
     """
-    calc_binwise_reduced_column[64, 64](a_gpu, np.float64(stride), a_range)
-    return a_gpu
+    out = cuda.device_array(a_gpu.shape[0], dtype=np.int32)
+    calc_binwise_reduced_column[64, 64](
+        get_kernel_column(a_gpu), np.float64(stride), a_range, out
+    )
+    return out
+
+
+@cuda.jit(**CUDA_JIT_OPTIONS)
+def calc_binwise_reduced_column_by_edges(x, edges, out):
+    """
+    description:
+        cuda jit for creating a full-lenth column with only binned values,
+        found by a binary search over sorted bin edges
+    input:
+        - x -> single col nd-array of any numeric dtype
+        - edges -> sorted bin edges (ndarray => shape(bins + 1,))
+        - out -> int32 nd-array of the bin codes, same length as x
+    """
+    last = edges.shape[0] - 1
+    start = cuda.grid(1)
+    s = cuda.gridsize(1)
+    for i in range(start, x.shape[0], s):
+        if x[i] >= edges[0] and x[i] <= edges[last]:
+            # last edge <= x[i], the last bin is closed on both ends
+            low = 0
+            high = last
+            while high - low > 1:
+                mid = (low + high) // 2
+                if edges[mid] <= x[i]:
+                    low = mid
+                else:
+                    high = mid
+            out[i] = low
+        else:
+            out[i] = -1
+
+
+def get_binwise_reduced_column_by_edges(a_gpu, bin_edges):
+    """
+    description:
+        calls the cuda jit function calc_binwise_reduced_column_by_edges and
+        returns the result, a_gpu is left unchanged
+    input:
+        - a_gpu -> single col nd-array
+        - bin_edges -> sorted bin edges
+    output:
+        - int32 single col resulting nd-array
+    """
+    out = cuda.device_array(a_gpu.shape[0], dtype=np.int32)
+    calc_binwise_reduced_column_by_edges[64, 64](
+        get_kernel_column(a_gpu),
+        cuda.to_device(np.asarray(bin_edges, dtype=np.float64)),
+        out,
+    )
+    return out
+
+
+def get_binned_column(a_gpu, chart: Type[BaseChart], stride=None):
+    """
+    description:
+        bin a column along the bins of chart, by its bin_edges for
+        non-linear binning, else by stride
+    input:
+        - a_gpu -> single col nd-array
+        - chart -> chart class
+        - stride -> stride value, defaults to chart.stride
+    output:
+        - int32 single col resulting nd-array
+    """
+    if chart.bin_edges is not None:
+        return get_binwise_reduced_column_by_edges(a_gpu, chart.bin_edges)
+    a_range = get_kernel_range(a_gpu, chart.min_value, chart.max_value)
+    return get_binwise_reduced_column(a_gpu, stride or chart.stride, a_range)
+
+
+def get_bin_count(chart: Type[BaseChart], stride=None):
+    """
+    description:
+        number of bins of chart, see get_binned_column
+    input:
+        - chart -> chart class
+        - stride -> stride value, defaults to chart.stride
+    output:
+        - int
+    """
+    if chart.bin_edges is not None:
+        return len(chart.bin_edges) - 1
+    stride = stride or chart.stride
+    return int((chart.max_value - chart.min_value) / stride) + 1
 
 
 def get_arrow_stream(record_batch):
@@ -111,21 +253,31 @@ def calc_data_tile_for_size(
     stride_1,
     cumsum: bool = True,
     return_format="pandas",
+    bin_edges=None,
 ):
-    a1_range = cuda.to_device(np.asarray([min_1, max_1], dtype=np.float64))
-    df.add_column(
-        col_1 + "_mod",
-        get_binwise_reduced_column(
-            df[col_1].copy().to_gpu_array(), stride_1, a1_range
-        ),
-    )
+    if bin_edges is not None:
+        df.add_column(
+            col_1 + "_mod",
+            get_binwise_reduced_column_by_edges(
+                df[col_1].to_gpu_array(), bin_edges
+            ),
+        )
+        max_s = len(bin_edges) - 1
+    else:
+        a_gpu = df[col_1].to_gpu_array()
+        df.add_column(
+            col_1 + "_mod",
+            get_binwise_reduced_column(
+                a_gpu, stride_1, get_kernel_range(a_gpu, min_1, max_1)
+            ),
+        )
+        max_s = int((max_1 - min_1) / stride_1) + 1
     groupby_result = (
         df[[col_1 + "_mod"]]
         .groupby(col_1 + "_mod", method="hash", as_index=True)
         .agg({col_1 + "_mod": "count"})
     )
 
-    max_s = int((max_1 - min_1) / stride_1) + 1
     min_s = 1
 
     result = np.zeros(shape=(min_s, max_s)).astype(np.float64)[0]
@@ -161,7 +313,7 @@ def calc_data_tile(
         cuda jit function calculate the data tile with cumulative sums for a
         2-col ndarray
     input:
-        - df -> cudf dataframe
+        - df -> cudf dataframe, left unchanged
         - active_view -> chart class
         - passive_view -> chart class
         - aggregate_dict
@@ -171,60 +323,113 @@ def calc_data_tile(
         - pyarrow(2d-numpy array) -> data-tile data structure
     """
 
-    col_1, min_1, max_1, stride_1 = (
-        active_view.x,
-        active_view.min_value,
-        active_view.max_value,
-        active_view.stride,
-    )
-    col_2, min_2, max_2, stride_2 = (
-        passive_view.x,
-        passive_view.min_value,
-        passive_view.max_value,
-        passive_view.stride,
-    )
+    col_1, stride_1 = active_view.x, active_view.tile_stride
+    col_2, stride_2 = passive_view.x, passive_view.stride
 
     key = passive_view.y if passive_view.y is not None else passive_view.x
     if len(aggregate_fn) == 0:
         aggregate_fn = passive_view.aggregate_fn
 
     if aggregate_fn == "mean":
-        aggregate_dict = {key: ["sum", "count"]}
+        aggregate_fns = ["sum", "count"]
     else:
-        aggregate_dict = {key: [aggregate_fn]}
+        aggregate_fns = [aggregate_fn]
+
+    max_s = get_bin_count(active_view, stride_1)
+    min_s = get_bin_count(passive_view, stride_2)
+
+    if (
+        all(fn in DENSE_AGGREGATES for fn in aggregate_fns)
+        and min_s * max_s <= DENSE_AGGREGATE_MAX_BINS
+    ):
+        # aggregate the values of key exactly in their own dtype, without
+        # a groupby and a round trip through pandas
+        codes = [
+            get_binned_column(
+                df[col_2].to_gpu_array(), passive_view, stride_2
+            ),
+            get_binned_column(df[col_1].to_gpu_array(), active_view, stride_1),
+        ]
+        values = df[key].to_gpu_array()
+        passive_counts, _ = calc_dense_aggregate(codes[0], min_s)
+        list_of_indices = list(np.nonzero(passive_counts)[0])
+        results_np = [
+            calc_dense_groupby(codes, (min_s, max_s), values, fn)
+            for fn in aggregate_fns
+        ]
+    else:
+        results_np, list_of_indices = calc_data_tile_by_groupby(
+            df, active_view, passive_view, key, aggregate_fns
+        )
+
+    results = []
+    for result_np in results_np:
+        if cumsum:
+            result_np = np.cumsum(result_np, axis=1)
+
+        result_temp = format_result(result_np, return_format)
+
+        results.append(result_temp[result_temp.index.isin(list_of_indices)])
+
+    if len(results) == 1:
+        return results[0]
+
+    return results
+
+
+def calc_data_tile_by_groupby(
+    df,
+    active_view: Type[BaseChart],
+    passive_view: Type[BaseChart],
+    key: str,
+    aggregate_fns: list,
+):
+    """
+    description:
+        data tiles of calc_data_tile for aggregates without a dense
+        implementation, through a cudf hash groupby
+    input:
+        - df -> cudf dataframe, left unchanged
+        - active_view -> chart class
+        - passive_view -> chart class
+        - key -> column to aggregate
+        - aggregate_fns -> list of groupby aggregations
+    output:
+        - list of ndarray data tiles without cumulative sums, one per
+            aggregation, list of the passive bins with data
+    """
+    col_1, stride_1 = active_view.x, active_view.tile_stride
+    col_2, stride_2 = passive_view.x, passive_view.stride
+    df = df.copy(deep=False)
 
-    a1_range = cuda.to_device(np.asarray([min_1, max_1], dtype=np.float64))
-    a2_range = cuda.to_device(np.asarray([min_2, max_2], dtype=np.float64))
     check_list = []
     if key == col_1 and col_1 + "_mod" not in df.columns:
         df.add_column(
             col_1 + "_mod",
-            get_binwise_reduced_column(
-                df[col_1].copy().to_gpu_array(), stride_1, a1_range
-            ),
+            get_binned_column(df[col_1].to_gpu_array(), active_view, stride_1),
         )
         check_list.append(col_1 + "_mod")
     else:
-        df[col_1] = get_binwise_reduced_column(
-            df[col_1].copy().to_gpu_array(), stride_1, a1_range
+        df[col_1] = get_binned_column(
+            df[col_1].to_gpu_array(), active_view, stride_1
         )
         check_list.append(col_1)
     if key == col_2 and col_2 + "_mod" not in df.columns:
         df.add_column(
             col_2 + "_mod",
-            get_binwise_reduced_column(
-                df[col_2].copy().to_gpu_array(), stride_2, a2_range
+            get_binned_column(
+                df[col_2].to_gpu_array(), passive_view, stride_2
             ),
         )
         check_list.append(col_2 + "_mod")
     else:
-        df[col_2] = get_binwise_reduced_column(
-            df[col_2].copy().to_gpu_array(), stride_2, a2_range
+        df[col_2] = get_binned_column(
+            df[col_2].to_gpu_array(), passive_view, stride_2
         )
         check_list.append(col_2)
 
     groupby_results = []
-    for i in aggregate_dict[key]:
+    for i in aggregate_fns:
         agg = {key: i}
         groupby_results.append(
             df.groupby(
@@ -233,9 +438,8 @@ def calc_data_tile(
         )
 
     del df
-    gc.collect()
 
-    results = []
+    results_np = []
     for groupby_result in groupby_results:
 
         list_of_indices = list(
@@ -246,24 +450,332 @@ def calc_data_tile(
         )
 
         del groupby_result
-        gc.collect()
-        max_s = int((max_1 - min_1) / stride_1) + 1
-        min_s = int((max_2 - min_2) / stride_2) + 1
-        result = cuda.to_device(
-            np.zeros(shape=(min_s, max_s)).astype(np.float64)
-        )
+        max_s = get_bin_count(active_view, stride_1)
+        min_s = get_bin_count(passive_view, stride_2)
+        result = buffer_pool.zeros("data_tile", (min_s, max_s), np.float64)
 
         calc_cumsum_data_tile[64, 64](groupby_as_ndarray, result)
-        if not cumsum:
-            result_np = result.copy_to_host()
-        else:
-            result_np = np.cumsum(result.copy_to_host(), axis=1)
+        results_np.append(result.copy_to_host())
 
-        result_temp = format_result(result_np, return_format)
+    return results_np, list_of_indices
 
-        results.append(result_temp[result_temp.index.isin(list_of_indices)])
+
+DENSE_AGGREGATES = {"count": 0, "sum": 1, "mean": 1, "min": 2, "max": 3}
+# largest number of dense bins aggregated with atomics, groupbys over more
+# bins than this use the cudf hash groupby
+DENSE_AGGREGATE_MAX_BINS = 1 << 24
+# host memory budget of a quantile sketch data tile, sketches with fewer
+# value bins are used for tiles with more cells than it allows
+QUANTILE_TILE_MAX_BYTES = 1 << 28
+# fewest value bins of the sketches of a quantile data tile
+QUANTILE_TILE_MIN_SKETCH_BINS = 2
+
+
+@cuda.jit(**CUDA_JIT_OPTIONS)
+def ravel_codes(linear_codes, codes, size, first):
+    """
+    description:
+        cuda jit to append a dimension of bin codes to row-major linear
+        codes, rows out of range in any dimension get a code of -1
+    input:
+        - linear_codes -> int64 nd-array, updated in place
+        - codes -> bin codes of the dimension
+        - size -> number of bins of the dimension
+        - first -> whether this is the first dimension, linear_codes is
+            then only written to
+    """
+    start = cuda.grid(1)
+    s = cuda.gridsize(1)
+    for i in range(start, linear_codes.shape[0], s):
+        if codes[i] < 0 or codes[i] >= size:
+            linear_codes[i] = -1
+        elif first:
+            linear_codes[i] = codes[i]
+        elif linear_codes[i] >= 0:
+            linear_codes[i] = linear_codes[i] * size + codes[i]
+
+
+@cuda.jit(**CUDA_JIT_OPTIONS)
+def dense_aggregate(codes, values, agg_mode, out):
+    """
+    description:
+        cuda jit for a groupby over dense bin codes using atomics. Rows
+        with a code out of [0, bins) or a nan value are ignored
+    input:
+        - codes -> bin codes
+        - values -> values to aggregate
+        - agg_mode -> 0: count, 1: sum, 2: min, 3: max
+        - out -> float64 nd-array of shape (2, bins), row 0 is updated with
+            the counts, row 1 with the aggregates
+    """
+    bins = out.shape[1]
+    start = cuda.grid(1)
+    s = cuda.gridsize(1)
+    for i in range(start, codes.shape[0], s):
+        code = codes[i]
+        value = np.float64(values[i])
+        if code < 0 or code >= bins or math.isnan(value):
+            continue
+        cuda.atomic.add(out, (0, code), 1.0)
+        if agg_mode == 1:
+            cuda.atomic.add(out, (1, code), value)
+        elif agg_mode == 2:
+            cuda.atomic.min(out, (1, code), value)
+        elif agg_mode == 3:
+            cuda.atomic.max(out, (1, code), value)
+
+
+def calc_dense_aggregate(codes, bins, values=None, aggregate_fn="count"):
+    """
+    description:
+        groupby over dense bin codes in a single pass, without sorting or
+        hashing
+    input:
+        - codes -> gpu array of bin codes in [0, bins), other codes are
+            ignored
+        - bins -> number of bins
+        - values -> gpu array to aggregate, None for frequencies
+        - aggregate_fn -> one of DENSE_AGGREGATES
+    output:
+        - counts(ndarray), aggregates(ndarray) of shape (bins,), the
+            mean/min/max of empty bins are nan
+    """
+    agg_mode = DENSE_AGGREGATES[aggregate_fn]
+    out = buffer_pool.zeros("dense_aggregate", (2, bins), np.float64)
+    if agg_mode in (2, 3):
+        fill[64, 64](out[1], np.inf if agg_mode == 2 else -np.inf)
+    if codes.shape[0] > 0:
+        dense_aggregate[64, 64](
+            codes, codes if values is None else values, agg_mode, out
+        )
+    counts, aggregates = out.copy_to_host()
+
+    if aggregate_fn == "count":
+        return counts, counts
+    if aggregate_fn == "mean":
+        aggregates = np.divide(
+            aggregates,
+            counts,
+            out=np.full(counts.shape, np.nan),
+            where=counts > 0,
+        )
+    elif aggregate_fn in ("min", "max"):
+        aggregates[counts == 0] = np.nan
+    return counts, aggregates
+
+
+def calc_dense_groupby(codes, shape, values=None, aggregate_fn="count"):
+    """
+    description:
+        groupby over a list of binned code columns, scattered into a dense
+        ndarray indexed by the bin codes. Rows with a code of -1 (out of
+        range) in any of the columns are ignored
+    input:
+        - codes -> list of binned gpu arrays, one per dimension
+        - shape -> shape of the dense result, one entry per dimension
+        - values -> gpu array to aggregate, None for frequencies
+        - aggregate_fn -> groupby aggregation applied on values
+    output:
+        - ndarray of the given shape
+    """
+    bins = int(np.prod(shape))
+    if aggregate_fn in DENSE_AGGREGATES and bins <= DENSE_AGGREGATE_MAX_BINS:
+        linear_codes = cuda.device_array(codes[0].shape[0], dtype=np.int64)
+        for i, (code, size) in enumerate(zip(codes, shape)):
+            ravel_codes[64, 64](linear_codes, code, size, i == 0)
+        counts, aggregates = calc_dense_aggregate(
+            linear_codes, bins, values, aggregate_fn
+        )
+        return np.where(counts > 0, aggregates, 0).reshape(shape)
+
+    temp_df = cudf.DataFrame()
+    keys = []
+    for i, code in enumerate(codes):
+        keys.append("code_" + str(i))
+        temp_df.add_column(keys[-1], code)
+
+    if values is None:
+        values, aggregate_fn = codes[0], "count"
+    temp_df.add_column("value", values)
+
+    groupby_result = (
+        temp_df.groupby(keys, method="hash", as_index=False)
+        .agg({"value": aggregate_fn})
+        .to_pandas()
+    )
+    del temp_df
+
+    indices = groupby_result[keys].values.astype(int)
+    valid = (indices >= 0).all(axis=1) & (indices < shape).all(axis=1)
+
+    result = np.zeros(shape=shape, dtype=np.float64)
+    result[tuple(indices[valid].T)] = groupby_result["value"].values[valid]
+    return result
+
+
+def calc_quantile_data_tile(
+    df,
+    active_view: Type[BaseChart],
+    passive_view: Type[BaseChart],
+    sketch_bins: int = 128,
+    cumsum: bool = True,
+    max_bytes: int = QUANTILE_TILE_MAX_BYTES,
+):
+    """
+    description:
+        calculate a data tile of mergeable quantile sketches, one per
+        (active bin, passive bin) cell, over the passive_view.y column.
+        The number of value bins per sketch is lowered until the float64
+        tile fits in max_bytes, down to QUANTILE_TILE_MIN_SKETCH_BINS, and
+        the counts are kept as int32 where they fit
+    input:
+        - df -> cudf dataframe
+        - active_view -> chart class
+        - passive_view -> chart class
+        - sketch_bins -> maximum number of value bins per sketch
+        - cumsum: bool
+        - max_bytes -> host memory budget of the tile
+    output:
+        - QuantileSketch object
+    """
+    codes, shape = [], []
+    for view, stride in (
+        (active_view, active_view.tile_stride),
+        (passive_view, passive_view.stride),
+    ):
+        codes.append(
+            get_binned_column(df[view.x].to_gpu_array(), view, stride)
+        )
+        shape.append(get_bin_count(view, stride))
+
+    # the dense groupby is computed in float64, the tile keeps the counts as
+    # int32 where they fit
+    cell_bytes = int(np.prod(shape)) * np.dtype(np.float64).itemsize
+    count_dtype = np.int32 if len(df) <= np.iinfo(np.int32).max else np.int64
+    sketch_bins = max(
+        min(sketch_bins, max_bytes // max(cell_bytes, 1)),
+        QUANTILE_TILE_MIN_SKETCH_BINS,
+    )
+
+    value_min, value_max = df[passive_view.y].min(), df[passive_view.y].max()
+    value_stride = (value_max - value_min) / (sketch_bins - 1)
+    if value_stride == 0:
+        value_stride = 1.0
+    a_gpu = df[passive_view.y].to_gpu_array()
+    codes.append(
+        get_binwise_reduced_column(
+            a_gpu,
+            value_stride,
+            get_kernel_range(a_gpu, value_min, value_max),
+        )
+    )
+    shape.append(sketch_bins)
+
+    counts = calc_dense_groupby(codes, tuple(shape)).astype(count_dtype)
+    if cumsum:
+        counts = np.cumsum(counts, axis=0, out=counts)
+
+    return QuantileSketch(
+        counts, (value_min, value_max), value_stride, cumsum=cumsum
+    )
+
+
+def calc_box_data_tile(
+    df,
+    active_view: Type[BaseChart],
+    passive_view: Type[BaseChart],
+    aggregate_fn: str = "",
+    cumsum: bool = True,
+):
+    """
+    description:
+        calculate a 3d data tile (x bin, y bin, passive bin) for box
+        selections on active_view, stored as summed-area tables over the
+        x and y axes
+    input:
+        - df -> cudf dataframe
+        - active_view -> chart class with box selection (x, y)
+        - passive_view -> chart class
+        - aggregate_fn: count/mean
+        - cumsum: bool
+    output:
+        - ndarray data tile, list of [sum, count] data tiles for mean
+    """
+    bins = active_view.box_select_tile_bins
+    codes, shape = [], []
+    for col, (a_min, a_max) in (
+        (active_view.x, active_view.tile_x_range),
+        (active_view.y, active_view.tile_y_range),
+    ):
+        stride = (a_max - a_min) / (bins - 1)
+        if stride == 0:
+            stride = 1
+        a_gpu = df[col].to_gpu_array()
+        codes.append(
+            get_binwise_reduced_column(
+                a_gpu, stride, get_kernel_range(a_gpu, a_min, a_max)
+            )
+        )
+        shape.append(bins)
+
+    if passive_view.chart_type != "datasize_indicator":
+        codes.append(
+            get_binned_column(df[passive_view.x].to_gpu_array(), passive_view)
+        )
+        shape.append(get_bin_count(passive_view))
+
+    if len(aggregate_fn) == 0:
+        aggregate_fn = passive_view.aggregate_fn
+
+    shape = tuple(shape)
+    if aggregate_fn == "mean":
+        key = passive_view.y if passive_view.y is not None else passive_view.x
+        results = [
+            calc_dense_groupby(codes, shape, df[key].to_gpu_array(), "sum"),
+            calc_dense_groupby(codes, shape),
+        ]
+    else:
+        results = [calc_dense_groupby(codes, shape)]
+
+    if cumsum:
+        results = [
+            np.cumsum(np.cumsum(result, axis=0), axis=1) for result in results
+        ]
 
     if len(results) == 1:
         return results[0]
 
     return results
+
+
+def calc_data_cube(df, columns, ranges, strides, factors):
+    """
+    description:
+        calculate a dense N-dimensional cube of frequencies over the binned
+        columns, each dimension coarsened by an integer factor
+    input:
+        - df -> cudf dataframe
+        - columns -> list of column names, one per dimension
+        - ranges -> list of (min, max) tuples
+        - strides -> list of bin widths
+        - factors -> list of coarsening factors (bins merged per cell)
+    output:
+        - ndarray of frequencies with one axis per column
+    """
+    codes, shape = [], []
+    for col, (a_min, a_max), stride, factor in zip(
+        columns, ranges, strides, factors
+    ):
+        a_gpu = df[col].to_gpu_array()
+        code = cudf.Series(
+            get_binwise_reduced_column(
+                a_gpu, stride, get_kernel_range(a_gpu, a_min, a_max)
+            )
+        )
+        if factor > 1:
+            # floor division keeps out of range rows at -1
+            code = code // factor
+        codes.append(code.to_gpu_array())
+        shape.append(-(-(int((a_max - a_min) / stride) + 1) // factor))
+
+    return calc_dense_groupby(codes, tuple(shape))
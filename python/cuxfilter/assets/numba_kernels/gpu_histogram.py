@@ -2,13 +2,26 @@ import numpy as np
 from numba import cuda
 import cudf
 import numba
-import gc
 from typing import Type
 
 from ...charts.core.core_chart import BaseChart
-
-
-@numba.jit(nopython=True, parallel=True)
+from ..quantile_sketch import QUANTILE_AGGREGATES, QuantileSketch
+from .buffer_pool import CUDA_JIT_OPTIONS, buffer_pool
+from .gpu_datatile import (
+    DENSE_AGGREGATES,
+    DENSE_AGGREGATE_MAX_BINS,
+    calc_dense_aggregate,
+    calc_dense_groupby,
+    get_bin_count,
+    get_binwise_reduced_column,
+    get_binwise_reduced_column_by_edges,
+    get_kernel_column,
+    get_kernel_dtype,
+    get_kernel_range,
+)
+
+
+@numba.jit(nopython=True, parallel=True, cache=True)
 def compute_bin(x, n, xmin, xmax):
     """
     description:
@@ -24,12 +37,9 @@ def compute_bin(x, n, xmin, xmax):
         return n - 1  # a_max always in last bin
 
     # SPEEDTIP: Remove the float64 casts if you don't need to exactly
-    # reproduce NumPy
-    bin = np.int32(
-        n
-        * (np.float64(x) - np.float64(xmin))
-        / (np.float64(xmax) - np.float64(xmin))
-    )
+    # reproduce NumPy. The differences are taken before the casts, so that
+    # they are exact for int64 columns and ranges
+    bin = np.int32(n * np.float64(x - xmin) / np.float64(xmax - xmin))
 
     if bin < 0 or bin >= n:
         return None
@@ -37,7 +47,7 @@ def compute_bin(x, n, xmin, xmax):
         return bin
 
 
-@cuda.jit
+@cuda.jit(**CUDA_JIT_OPTIONS)
 def min_max(x, min_max_array):
     """
     description:
@@ -45,7 +55,7 @@ def min_max(x, min_max_array):
     input:
         - x: ndarray
         - min_max_array: cuda.to_device(np.array([dtype_max, dtype_min],
-        dtype=np.float32))
+        dtype=get_kernel_dtype(x.dtype)))
     """
     start = cuda.grid(1)
     stride = cuda.gridsize(1)
@@ -65,7 +75,35 @@ def min_max(x, min_max_array):
     cuda.atomic.max(min_max_array, 1, local_max)
 
 
-@cuda.jit
+@cuda.jit(**CUDA_JIT_OPTIONS)
+def min_max_ignore_nan(x, min_max_array):
+    """
+    description:
+        cuda jit to calculate the min and max values for the ndarray, NaN
+        values are ignored
+    input:
+        - x: ndarray
+        - min_max_array: cuda.to_device(np.array([dtype_max, dtype_min],
+        dtype=get_kernel_dtype(x.dtype)))
+    """
+    start = cuda.grid(1)
+    stride = cuda.gridsize(1)
+
+    local_min = min_max_array[0]
+    local_max = min_max_array[1]
+
+    for i in range(start, x.shape[0], stride):
+        element = x[i]
+        if element < local_min:
+            local_min = element
+        if element > local_max:
+            local_max = element
+
+    cuda.atomic.min(min_max_array, 0, local_min)
+    cuda.atomic.max(min_max_array, 1, local_max)
+
+
+@cuda.jit(**CUDA_JIT_OPTIONS)
 def histogram(x, x_range, histogram_out):
     """
     description:
@@ -89,6 +127,47 @@ def histogram(x, x_range, histogram_out):
             cuda.atomic.add(histogram_out, bin_number, 1)
 
 
+@cuda.jit(**CUDA_JIT_OPTIONS)
+def fused_aggregates(
+    matrix, x_index, y_index, bin_modes, ranges, strides, offsets, out
+):
+    """
+    description:
+        calculate the binned frequencies and sums of several charts in a
+        single pass over the rows
+    input:
+        matrix -> ndarray(rows, columns) of every column used by the charts
+        x_index, y_index -> column of each chart to bin / to sum
+        bin_modes -> 0: data_points equal width bins (histogram),
+                    1: bins of width stride (groupby)
+        ranges -> (min, max) of each chart
+        strides -> stride of each chart
+        offsets -> start of each chart's bins in out, plus the total
+        out -> cuda.to_device array(np.zeros(shape=(2, total))) storing the
+        frequencies and sums
+    """
+    start = cuda.grid(1)
+    stride = cuda.gridsize(1)
+    for i in range(start, matrix.shape[0], stride):
+        for j in range(x_index.shape[0]):
+            x = matrix[i, x_index[j]]
+            xmin = ranges[j, 0]
+            xmax = ranges[j, 1]
+            nbins = offsets[j + 1] - offsets[j]
+            if x >= xmin and x <= xmax:
+                if bin_modes[j] == 0:
+                    bin_number = compute_bin(x, nbins, xmin, xmax)
+                else:
+                    bin_number = int(round((x - xmin) / strides[j]))
+                if bin_number >= 0 and bin_number < nbins:
+                    cuda.atomic.add(out, (0, offsets[j] + bin_number), 1.0)
+                    cuda.atomic.add(
+                        out,
+                        (1, offsets[j] + bin_number),
+                        matrix[i, y_index[j]],
+                    )
+
+
 def dtype_min_max(dtype):
     """
        description:
@@ -103,7 +182,7 @@ def dtype_min_max(dtype):
     return info.min, info.max
 
 
-@cuda.jit
+@cuda.jit(**CUDA_JIT_OPTIONS)
 def get_bin_edges(a_range, bin_edges):
     """
     description:
@@ -122,70 +201,260 @@ def get_bin_edges(a_range, bin_edges):
     bin_edges[-1] = a_max  # Avoid roundoff error on last point
 
 
-@cuda.jit
-def calc_binwise_reduced_column(x, stride, a_range):
+def calc_value_counts(a_gpu, bins, x_range=None):
     """
     description:
-        cuda jit for creating a full-lenth column with only binned values
+        main function to calculate histograms
     input:
-        - x -> single col nd-array
-        - stride -> stride value
-        - a_range -> min-max values (ndarray => shape(2,))
+        - a_gpu: gpu array(cuda ndarray) -> 1-column only
+        - bins: number of bins
+        - x_range: (min, max) of the bins, computed from a_gpu if None.
+            A fixed range skips the min_max pass and keeps the bins stable
+            when a_gpu is filtered
+    output:
+        frequencies(ndarray), bin_edge_values(ndarray)
     """
-    a_min = a_range[0]
-    a_max = a_range[1]
-    start = cuda.grid(1)
-    s = cuda.gridsize(1)
-    for i in range(start, x.shape[0], s):
-        if x[i] >= a_min and x[i] <= a_max:
-            x[i] = np.int32(round((x[i] - a_min) / stride))
-        else:
-            x[i] = -1
+    if x_range is not None:
+        # converted along the dtype of a_gpu, datetime ranges are cast to
+        # its time unit before the int64 view
+        min_max_array_gpu = get_kernel_range(a_gpu, *x_range, name="min_max")
+    a_gpu = get_kernel_column(a_gpu)
+    if x_range is None:
+        # Find min and max value in array, exactly in the kernel dtype of
+        # a_gpu
+        dtype = get_kernel_dtype(a_gpu.dtype)
+        dtype_min, dtype_max = dtype_min_max(dtype)
+        # Put them in the array in reverse order so that they will be
+        # replaced by the first element in the array
+        min_max_array_gpu = buffer_pool.to_device(
+            "min_max", np.array([dtype_max, dtype_min], dtype=dtype)
+        )
+        # min_max[64, 64](a_gpu,index_gpu, min_max_array_gpu)
+        min_max[64, 64](a_gpu, min_max_array_gpu)
+    # every bin edge is written by get_bin_edges
+    bin_edges = buffer_pool.device_array("bin_edges", bins, np.float64)
+
+    get_bin_edges[64, 64](min_max_array_gpu, bin_edges)
+
+    # Bin the data into a histogram
+    histogram_out = buffer_pool.zeros("histogram", bins, np.int32)
+    histogram[64, 64](a_gpu, min_max_array_gpu, histogram_out)
+    return bin_edges.copy_to_host(), histogram_out.copy_to_host()
 
 
-def get_binwise_reduced_column(a_gpu, stride, a_range):
+def calc_min_max_columns(data, columns):
     """
     description:
-        calls the cuda jit function calc_binwise_reduced_column and resturns
-        the result
+        calculate the min and max values of several numeric columns, nulls
+        are ignored. Each column is reduced in place in its kernel dtype,
+        see get_kernel_dtype, so that int64 values are exact. Columns with
+        nulls are reduced by cudf
     input:
-        - a_gpu -> single col nd-array
-        - stride -> stride value
-        - a_range -> min-max values (ndarray => shape(2,))
+        - data: cudf DataFrame
+        - columns: list of numeric column names
     output:
-        - a_gpu -> single col resulting nd-array
+        list of (min, max) per column, in the kernel dtype of the column,
+        nan for columns without values
     """
-    calc_binwise_reduced_column[64, 64](a_gpu, np.float32(stride), a_range)
-    return a_gpu
+    result = []
+    for col in columns:
+        column = data[col]
+        if column.null_count == len(column):
+            result.append((np.nan, np.nan))
+        elif (
+            column.null_count > 0
+            or column.dtype.kind not in "iuf"
+            # uint64 does not fit the int64 kernel dtype
+            or column.dtype == np.uint64
+        ):
+            result.append((column.min(), column.max()))
+        else:
+            a_gpu = column.to_gpu_array()
+            dtype = get_kernel_dtype(a_gpu.dtype)
+            if dtype == np.float64:
+                dtype_min, dtype_max = -np.inf, np.inf
+            else:
+                dtype_min, dtype_max = dtype_min_max(dtype)
+            min_max_array_gpu = buffer_pool.to_device(
+                "min_max", np.array([dtype_max, dtype_min], dtype=dtype)
+            )
+            min_max_ignore_nan[64, 64](a_gpu, min_max_array_gpu)
+            col_min, col_max = min_max_array_gpu.copy_to_host()
+            if col_min > col_max:
+                # only NaN values
+                col_min, col_max = np.nan, np.nan
+            result.append((col_min, col_max))
+    return result
+
+
+def calc_bin_edges(column, binning, bins):
+    """
+    description:
+        calculate the bin edges of a column for non-linear binning
+    input:
+        - column: cudf Series
+        - binning: "linear", "quantile", "log" or a sequence of bin edges
+        - bins: number of bins
+    output:
+        sorted unique bin edges(ndarray), None for linear binning
+    """
+    if isinstance(binning, str):
+        if binning == "linear":
+            return None
+        a_min, a_max = float(column.min()), float(column.max())
+        if binning == "quantile":
+            bin_edges = np.asarray(
+                column.quantile(list(np.linspace(0, 1, bins + 1))).to_array()
+            )
+        elif binning == "log":
+            # log spaced offsets from the min value, valid for any sign
+            offsets = np.geomspace(1, a_max - a_min + 1, bins + 1)
+            bin_edges = a_min - 1 + offsets
+        else:
+            raise ValueError(
+                "binning must be one of 'linear', 'quantile', 'log' or a "
+                "sequence of bin edges"
+            )
+    else:
+        bin_edges = np.asarray(binning)
 
+    bin_edges = np.unique(bin_edges.astype(np.float64))
+    if bin_edges.size < 2:
+        raise ValueError("at least two distinct bin edges are required")
+    return bin_edges
 
-def calc_value_counts(a_gpu, bins):
+
+def calc_value_counts_by_edges(a_gpu, bin_edges):
     """
     description:
-        main function to calculate histograms
+        calculate histograms over non-uniform bins
     input:
         - a_gpu: gpu array(cuda ndarray) -> 1-column only
-        - bins: number of bins
+        - bin_edges: sorted bin edges
     output:
-        frequencies(ndarray), bin_edge_values(ndarray)
+        bin_indices(ndarray), frequencies(ndarray)
     """
-    # Find min and max value in array
-    dtype_min, dtype_max = dtype_min_max(a_gpu.dtype)
-    # Put them in the array in reverse order so that they will be replaced by
-    # the first element in the array
-    min_max_array_gpu = cuda.to_device(
-        np.array([dtype_max, dtype_min], dtype=np.float32)
+    bins = len(bin_edges) - 1
+    frequencies = calc_dense_groupby(
+        [get_binwise_reduced_column_by_edges(a_gpu, bin_edges)], (bins,)
     )
-    # min_max[64, 64](a_gpu,index_gpu, min_max_array_gpu)
-    min_max[64, 64](a_gpu, min_max_array_gpu)
-    bin_edges = cuda.to_device(np.zeros(shape=(bins,), dtype=np.float64))
+    return np.arange(bins, dtype=np.float64), frequencies
 
-    get_bin_edges[64, 64](min_max_array_gpu, bin_edges)
 
-    # Bin the data into a histogram
-    histogram_out = cuda.to_device(np.zeros(shape=(bins,), dtype=np.int32))
-    histogram[64, 64](a_gpu, min_max_array_gpu, histogram_out)
-    return bin_edges.copy_to_host(), histogram_out.copy_to_host()
+def get_chart_binned_column(chart: Type[BaseChart], data):
+    """
+    description:
+        bin data[chart.x] along the bins of chart
+    input:
+        - chart
+        - data
+    output:
+        single col nd-array of bin indices
+    """
+    if chart.bin_edges is not None:
+        return get_binwise_reduced_column_by_edges(
+            data[chart.x].to_gpu_array(), chart.bin_edges
+        )
+    a_gpu = data[chart.x].to_gpu_array()
+    return get_binwise_reduced_column(
+        a_gpu,
+        chart.stride,
+        get_kernel_range(a_gpu, chart.min_value, chart.max_value),
+    )
+
+
+def is_fused_aggregate(chart: Type[BaseChart]):
+    """
+    description:
+        whether the source of chart can be calculated by
+        calc_fused_aggregates
+    input:
+        - chart
+    output:
+        bool
+    """
+    if not (
+        chart.chart_type in ("bar", "line")
+        and chart.use_data_tiles
+        and chart.bin_edges is None
+        and chart.stride is not None
+        and (chart.y in (None, chart.x) or chart.aggregate_fn == "mean")
+    ):
+        return False
+    if chart.y in (None, chart.x):
+        return True
+    # the source of a mean chart only holds its non-empty bins, the fused
+    # means, one per bin, line up with it only if no bin was empty
+    source_y = chart.get_source_y_axis()
+    return source_y is not None and len(source_y) == get_bin_count(chart)
+
+
+def calc_fused_aggregates(charts, data):
+    """
+    description:
+        calculate the y values of several histogram and mean charts with a
+        single scan of data, using the bins of each chart's stored range
+    input:
+        - charts: list of charts, see is_fused_aggregate
+        - data
+    output:
+        list of frequencies or means(ndarray), one per chart
+    """
+    columns, x_index, y_index, bin_modes, offsets = [], [], [], [], [0]
+    for chart in charts:
+        is_histogram = chart.y in (None, chart.x)
+        for col in (chart.x, chart.x if is_histogram else chart.y):
+            if col not in columns:
+                columns.append(col)
+        x_index.append(columns.index(chart.x))
+        y_index.append(columns.index(chart.x if is_histogram else chart.y))
+        bin_modes.append(0 if is_histogram else 1)
+        if is_histogram:
+            offsets.append(offsets[-1] + chart.data_points)
+        else:
+            offsets.append(offsets[-1] + get_bin_count(chart))
+
+    out = buffer_pool.zeros("fused_aggregates", (2, offsets[-1]), np.float64)
+    if data.shape[0] > 0:
+        temp_df = cudf.DataFrame()
+        for col in columns:
+            temp_df.add_column(col, data[col].astype("float64"))
+        matrix = temp_df.as_gpu_matrix(order="C")
+        del temp_df
+        fused_aggregates[64, 64](
+            matrix,
+            cuda.to_device(np.asarray(x_index, dtype=np.int32)),
+            cuda.to_device(np.asarray(y_index, dtype=np.int32)),
+            cuda.to_device(np.asarray(bin_modes, dtype=np.int32)),
+            cuda.to_device(
+                np.asarray(
+                    [[chart.min_value, chart.max_value] for chart in charts],
+                    dtype=np.float64,
+                )
+            ),
+            cuda.to_device(
+                np.asarray([chart.stride for chart in charts], np.float64)
+            ),
+            cuda.to_device(np.asarray(offsets, dtype=np.int32)),
+            out,
+        )
+    counts, sums = out.copy_to_host()
+
+    results = []
+    for j, bin_mode in enumerate(bin_modes):
+        count = counts[offsets[j] : offsets[j + 1]]
+        if bin_mode == 0:
+            results.append(count)
+        else:
+            results.append(
+                np.divide(
+                    sums[offsets[j] : offsets[j + 1]],
+                    count,
+                    out=np.full(count.shape, np.nan),
+                    where=count > 0,
+                )
+            )
+    return results
 
 
 def calc_groupby(chart: Type[BaseChart], data, agg=None):
@@ -199,19 +468,28 @@ def calc_groupby(chart: Type[BaseChart], data, agg=None):
         frequencies(ndarray), bin_edge_values(ndarray)
     """
 
-    a_x_range = cuda.to_device(
-        np.asarray([chart.min_value, chart.max_value], dtype=np.float32)
-    )
+    if agg is None and chart.aggregate_fn in QUANTILE_AGGREGATES:
+        return calc_groupby_quantile(chart, data)
+
+    if (
+        agg is None
+        and chart.aggregate_fn in DENSE_AGGREGATES
+        and get_bin_count(chart) <= DENSE_AGGREGATE_MAX_BINS
+    ):
+        # bins are dense integers, aggregate them in place of a groupby
+        counts, aggregates = calc_dense_aggregate(
+            get_chart_binned_column(chart, data),
+            get_bin_count(chart),
+            data[chart.y].to_gpu_array(),
+            chart.aggregate_fn,
+        )
+        bins = np.nonzero(counts)[0]
+        return np.array([bins.astype(np.float64), aggregates[bins]])
 
     if agg is None:
         temp_df = cudf.DataFrame()
 
-        temp_df.add_column(
-            chart.x,
-            get_binwise_reduced_column(
-                data[chart.x].copy().to_gpu_array(), chart.stride, a_x_range
-            ),
-        )
+        temp_df.add_column(chart.x, get_chart_binned_column(chart, data))
         temp_df.add_column(chart.y, data[chart.y].copy().to_gpu_array())
 
         groupby_res = (
@@ -220,7 +498,6 @@ def calc_groupby(chart: Type[BaseChart], data, agg=None):
             .to_pandas()
         )
         del temp_df
-        gc.collect()
     else:
         groupby_res = (
             data.groupby(by=[chart.x], as_index=False).agg(agg).to_pandas()
@@ -228,6 +505,47 @@ def calc_groupby(chart: Type[BaseChart], data, agg=None):
     return groupby_res.to_numpy().transpose()
 
 
+def calc_groupby_quantile(chart: Type[BaseChart], data):
+    """
+    description:
+        calculate approximate per-bin quantiles of chart.y using the same
+        mergeable sketches as the quantile data tiles. Every bin is
+        returned, nan for empty bins, in the layout of the quantile data
+        tile queries
+    input:
+        - chart
+        - data
+    output:
+        bin_values(ndarray), quantiles(ndarray)
+    """
+    value_min, value_max = data[chart.y].min(), data[chart.y].max()
+    value_stride = (value_max - value_min) / (chart.sketch_bins - 1)
+    if value_stride == 0:
+        value_stride = 1.0
+    a_gpu = data[chart.y].to_gpu_array()
+    codes = [
+        get_chart_binned_column(chart, data),
+        get_binwise_reduced_column(
+            a_gpu,
+            value_stride,
+            get_kernel_range(a_gpu, value_min, value_max, name="value_range"),
+        ),
+    ]
+    shape = (get_bin_count(chart), chart.sketch_bins)
+    sketch = QuantileSketch(
+        calc_dense_groupby(codes, shape),
+        (value_min, value_max),
+        value_stride,
+        cumsum=False,
+    )
+    return np.array(
+        [
+            np.arange(shape[0], dtype=np.float64),
+            sketch.get_quantile(sketch.counts, chart.quantile),
+        ]
+    )
+
+
 def aggregated_column_unique(chart: Type[BaseChart], data):
     """
     description:
@@ -239,12 +557,17 @@ def aggregated_column_unique(chart: Type[BaseChart], data):
         list_of_unique_values
     """
 
-    a_range = cuda.to_device(np.array([chart.min_value, chart.max_value]))
-    temp_df = cudf.DataFrame()
-    temp_df.add_column(
-        chart.x,
-        get_binwise_reduced_column(
-            data[chart.x].copy().to_gpu_array(), chart.stride, a_range
-        ),
+    a_gpu = data[chart.x].to_gpu_array()
+    codes = get_binwise_reduced_column(
+        a_gpu,
+        chart.stride,
+        get_kernel_range(a_gpu, chart.min_value, chart.max_value),
     )
+    bins = int((chart.max_value - chart.min_value) / chart.stride) + 1
+    if bins <= DENSE_AGGREGATE_MAX_BINS:
+        counts, _ = calc_dense_aggregate(codes, bins)
+        return np.nonzero(counts)[0].tolist()
+
+    temp_df = cudf.DataFrame()
+    temp_df.add_column(chart.x, codes)
     return temp_df[chart.x].unique().to_pandas().tolist()
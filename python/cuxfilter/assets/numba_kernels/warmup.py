@@ -0,0 +1,74 @@
+import numpy as np
+from numba import cuda
+import cudf
+
+from . import gpu_datatile, gpu_histogram
+from .buffer_pool import buffer_pool
+
+# int8 and int16 columns are produced by DataFrame.optimize_dtypes
+WARMUP_DTYPES = (
+    np.int8,
+    np.int16,
+    np.int32,
+    np.int64,
+    np.float32,
+    np.float64,
+)
+
+_warmed_up = set()
+
+
+def warmup(dtypes=WARMUP_DTYPES):
+    """
+    description:
+        compile the binning, histogram and aggregation kernels for the
+        column dtypes by launching them on a few rows, so that the first
+        dashboard interaction does not pay the JIT latency. With numba
+        0.55 or later the compiled kernels are cached on disk and loaded by
+        later processes, dtypes already warmed up in this process are
+        skipped
+    input:
+        - dtypes -> column dtypes to compile the kernels for
+    """
+    dtypes = [np.dtype(dtype) for dtype in dtypes]
+    dtypes = [dtype for dtype in dtypes if dtype not in _warmed_up]
+    if len(dtypes) == 0:
+        return
+
+    codes = cuda.to_device(np.arange(4, dtype=np.int32))
+    for dtype in dtypes:
+        column = cuda.to_device(np.arange(4, dtype=dtype))
+        gpu_histogram.calc_value_counts(column, 4)
+        gpu_histogram.calc_value_counts(column, 4, x_range=(0, 3))
+        gpu_histogram.calc_min_max_columns(
+            cudf.DataFrame({"x": np.arange(4, dtype=dtype)}), ["x"]
+        )
+        # integral ranges are passed in the column's kernel dtype,
+        # fractional ones as float64
+        for a_max in (3, 2.5):
+            gpu_datatile.get_binwise_reduced_column(
+                column, 1, gpu_datatile.get_kernel_range(column, 0, a_max)
+            )
+        gpu_datatile.get_binwise_reduced_column_by_edges(
+            column, [0.0, 1.0, 3.0]
+        )
+        for aggregate_fn in ("count", "sum", "min", "max"):
+            gpu_datatile.calc_dense_aggregate(codes, 4, column, aggregate_fn)
+        _warmed_up.add(dtype)
+
+    gpu_datatile.calc_dense_groupby([codes, codes], (4, 4))
+    gpu_datatile.calc_cumsum_data_tile[64, 64](
+        cuda.to_device(np.zeros(shape=(1, 3))),
+        buffer_pool.zeros("warmup", (1, 1), np.float64),
+    )
+    matrix = cuda.to_device(np.arange(4, dtype=np.float64).reshape(4, 1))
+    gpu_histogram.fused_aggregates[64, 64](
+        matrix,
+        cuda.to_device(np.zeros(1, dtype=np.int32)),
+        cuda.to_device(np.zeros(1, dtype=np.int32)),
+        cuda.to_device(np.zeros(1, dtype=np.int32)),
+        cuda.to_device(np.array([[0.0, 3.0]])),
+        cuda.to_device(np.ones(1)),
+        cuda.to_device(np.array([0, 4], dtype=np.int32)),
+        buffer_pool.zeros("warmup", (2, 4), np.float64),
+    )
@@ -0,0 +1,89 @@
+import numpy as np
+
+QUANTILE_AGGREGATES = ("median", "quantile")
+
+
+class QuantileSketch:
+    """
+    Mergeable per-cell quantile sketch data tile.
+
+    Each (active bin, passive bin) cell holds a fixed-width histogram of the
+    aggregated column over value_range, so merging cells is an addition and
+    a cumulative sum over the active axis answers any slider range with two
+    lookups. Quantile estimates are accurate to within one value_stride.
+    """
+
+    counts: np.ndarray = None
+    value_range: tuple = (0.0, 0.0)
+    value_stride: float = 1.0
+    cumsum: bool = True
+
+    def __init__(self, counts, value_range, value_stride, cumsum=True):
+        """
+        Parameters
+        ----------
+        counts: ndarray of shape (active_bins, passive_bins, sketch_bins)
+        value_range: (min, max) of the aggregated column
+        value_stride: width of a single sketch bin
+        cumsum: whether counts are cumulative along the active axis
+        """
+        self.counts = counts
+        self.value_range = value_range
+        self.value_stride = value_stride
+        self.cumsum = cumsum
+
+    def query_by_range(self, min_index, max_index):
+        """
+        merge the sketches of all active bins in [min_index, max_index],
+        returns an ndarray of shape (passive_bins, sketch_bins)
+        """
+        max_index = min(max_index, self.counts.shape[0] - 1)
+        if not self.cumsum:
+            return self.counts[max(min_index, 0) : max_index + 1].sum(axis=0)
+        if min_index <= 0:
+            return self.counts[max_index]
+        return self.counts[max_index] - self.counts[min_index - 1]
+
+    def query_by_indices(self, indices):
+        """
+        merge the sketches of the active bins listed in indices, returns an
+        ndarray of shape (passive_bins, sketch_bins)
+        """
+        counts = self.counts
+        if self.cumsum:
+            counts = np.diff(counts, axis=0, prepend=0)
+        if len(indices) == 0:
+            return counts.sum(axis=0)
+        indices = [i for i in indices if 0 <= i < counts.shape[0]]
+        return counts[indices].sum(axis=0)
+
+    def get_quantile(self, counts, q):
+        """
+        estimate the q-th quantile for each row of merged sketch counts,
+        linearly interpolated within the sketch bin. Rows without any
+        values are returned as nan
+        """
+        counts = np.atleast_2d(counts).astype(np.float64)
+        rows = np.arange(counts.shape[0])
+        cum_counts = np.cumsum(counts, axis=1)
+        total = cum_counts[:, -1]
+        target = np.maximum(q * total, np.finfo(np.float64).tiny)
+
+        bucket = (cum_counts < target[:, None]).sum(axis=1)
+        bucket = np.minimum(bucket, counts.shape[1] - 1)
+        prev_count = np.where(
+            bucket > 0, cum_counts[rows, np.maximum(bucket - 1, 0)], 0
+        )
+        bucket_count = counts[rows, bucket]
+        fraction = np.divide(
+            target - prev_count,
+            bucket_count,
+            out=np.full(bucket_count.shape, 0.5),
+            where=bucket_count > 0,
+        )
+
+        value_min, value_max = self.value_range
+        result = value_min + (bucket - 0.5 + fraction) * self.value_stride
+        result = np.clip(result, value_min, value_max)
+        result[total == 0] = np.nan
+        return result
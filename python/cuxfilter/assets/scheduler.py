@@ -0,0 +1,341 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent import futures
+from contextlib import contextmanager
+from functools import partial
+
+from bokeh.io import curdoc
+
+_executor = None
+_executor_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_executor():
+    """
+    executor shared by the dashboards of the process to compute updates
+    off the bokeh event loop
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = futures.ThreadPoolExecutor(
+                thread_name_prefix="cuxfilter"
+            )
+    return _executor
+
+
+def server_call_later(delay, callback):
+    """
+    schedule callback on the current bokeh server document after delay
+    seconds, returns False outside of a bokeh server session
+    """
+    doc = curdoc()
+    if doc is None or doc.session_context is None:
+        return False
+    doc.add_timeout_callback(callback, int(delay * 1000))
+    return True
+
+
+def server_next_tick():
+    """
+    function(callback) scheduling callback on the next tick of the current
+    bokeh server document, safe to call from any thread. None outside of a
+    bokeh server session
+    """
+    doc = curdoc()
+    if doc is None or doc.session_context is None:
+        return None
+    return doc.add_next_tick_callback
+
+
+def _computing():
+    """
+    whether the current thread is computing a scheduled update
+    """
+    return getattr(_local, "deferred", None) is not None
+
+
+@contextmanager
+def hold_document(policy="combine"):
+    """
+    hold the change events of the current bokeh server document until the
+    outermost hold exits, and send them to the browser as one message.
+    No-op outside of a bokeh server session and while computing a
+    scheduled update, whose changes are applied under a hold
+    """
+    doc = curdoc()
+    if (
+        getattr(_local, "holding", False)
+        or _computing()
+        or doc is None
+        or doc.session_context is None
+    ):
+        yield
+        return
+    doc.hold(policy)
+    _local.holding = True
+    try:
+        yield
+    finally:
+        _local.holding = False
+        doc.unhold()
+
+
+def defer(callback, *args, supersedable=False, merge_key=None):
+    """
+    run callback(*args) on the event loop once the scheduled update
+    computing on the current thread is applied, at once anywhere else.
+
+    Document and model changes go through defer, bokeh models may only be
+    changed on the event loop. supersedable callbacks are dropped if a
+    newer update of the same chart was scheduled in the meantime. Of the
+    callbacks deferred with the same merge_key within an update, each
+    replacing the state changed by the others, only the latest one runs
+    """
+    if _computing():
+        _local.deferred.append((callback, args, supersedable, merge_key))
+    else:
+        callback(*args)
+
+
+def submit(compute, apply, next_tick=server_next_tick):
+    """
+    run compute() on the executor and apply(result) on the next tick of the
+    current bokeh server document. Outside of a bokeh server session both
+    run at once, on the thread of a scheduled update apply(result) is
+    deferred until the update is applied
+    """
+    if _computing():
+        defer(apply, compute())
+        return
+    post = next_tick()
+    if post is None:
+        apply(compute())
+        return
+    get_executor().submit(compute).add_done_callback(
+        lambda future: post(partial(_apply_result, future, apply))
+    )
+
+
+def _apply_result(future, apply):
+    apply(future.result())
+
+
+class _Update:
+    """
+    scheduled update computing on the executor
+    """
+
+    def __init__(self, key, generation):
+        self.key = key
+        self.generation = generation
+        self.future = None
+        self.deferred = []
+        self.error = None
+        self.applied = False
+
+
+class CallbackScheduler:
+    """
+    Coalesces the interaction events of the charts of a dashboard.
+
+    Each chart runs at most one update per interval. Events arriving
+    within the interval replace the pending update of their chart (the
+    latest value wins) instead of queueing one update each, and the pending
+    update runs once the interval has elapsed. Updates of different charts
+    keep their order, an event of one chart first runs the updates pending
+    for the others. Outside of a bokeh server session there is no event
+    loop to defer to, and updates run at once.
+
+    In a bokeh server session updates are computed on an executor, one at
+    a time per dashboard, so that a slow update does not block the event
+    loop shared by every session. The document changes of an update are
+    collected with defer while it computes and applied together on the
+    next tick of the event loop before the next update starts, under a
+    document hold so that they reach the browser as one message. Every
+    update of a chart carries a generation number: a queued update is
+    cancelled when a newer one of its chart arrives, and the supersedable
+    changes of an update computing meanwhile are discarded.
+
+    max_fps limits the rate at which updates are applied, the frames sent
+    to the browser. An update computed before its frame is due waits for
+    it, and since the next update only starts once it is applied, events
+    arriving meanwhile are coalesced instead of piling up in the websocket.
+    """
+
+    interval: float = 1 / 60
+    max_fps: float = None
+
+    def __init__(
+        self,
+        interval=1 / 60,
+        call_later=server_call_later,
+        next_tick=server_next_tick,
+        executor=None,
+        max_fps=None,
+    ):
+        """
+        Parameters
+        ----------
+        interval: minimum time in seconds between two updates of a chart
+        call_later: function(delay, callback) scheduling callback after
+            delay seconds, returning False if it can not
+        next_tick: function returning a thread-safe function(callback) to
+            run callback on the event loop, None if there is no event loop
+        executor: concurrent.futures.Executor computing the updates,
+            defaults to the executor shared by all dashboards
+        max_fps: maximum number of updates applied per second, unlimited
+            if None
+        """
+        self.interval = interval
+        self.max_fps = max_fps
+        self._call_later = call_later
+        self._next_tick = next_tick
+        self._executor = executor
+        self._pending = {}
+        self._last_run = {}
+        self._scheduled = set()
+        self._generation = {}
+        self._queue = OrderedDict()
+        self._running = None
+        self._last_frame = float("-inf")
+        self._lock = threading.Lock()
+
+    def schedule(self, key, callback, *args):
+        """
+        run callback(*args) as the next update of key, dropping the update
+        of key pending so far
+        """
+        for other_key in self.pending:
+            if other_key != key:
+                self._run(other_key)
+
+        with self._lock:
+            self._pending[key] = (callback, args)
+            if key in self._scheduled:
+                return
+            delay = (
+                self._last_run.get(key, float("-inf"))
+                + self.interval
+                - time.monotonic()
+            )
+            if delay > 0 and self._call_later(delay, partial(self._run, key)):
+                self._scheduled.add(key)
+                return
+        self._run(key)
+
+    def _run(self, key):
+        with self._lock:
+            self._scheduled.discard(key)
+            pending = self._pending.pop(key, None)
+            if pending is None:
+                return
+            self._last_run[key] = time.monotonic()
+        callback, args = pending
+        post = None if _computing() else self._next_tick()
+        if post is None:
+            callback(*args)
+            return
+
+        with self._lock:
+            generation = self._generation.get(key, 0) + 1
+            self._generation[key] = generation
+            # cancel the update of key waiting for the executor
+            self._queue.pop(key, None)
+            self._queue[key] = (generation, callback, args, post)
+            if self._running is not None:
+                return
+        self._start_next()
+
+    def _start_next(self):
+        with self._lock:
+            self._running = None
+            if len(self._queue) == 0:
+                return
+            key, (generation, callback, args, post) = self._queue.popitem(
+                last=False
+            )
+            update = _Update(key, generation)
+            self._running = update
+        executor = self._executor or get_executor()
+        update.future = executor.submit(
+            self._compute, update, callback, args, post
+        )
+
+    def _compute(self, update, callback, args, post):
+        _local.deferred = update.deferred
+        _local.key = update.key
+        try:
+            callback(*args)
+        except Exception as e:
+            update.error = e
+        finally:
+            _local.deferred = None
+            _local.key = None
+        post(partial(self._apply, update))
+
+    def _apply(self, update):
+        if update.applied:
+            return
+        # wait for the next frame, the next update waits with it
+        delay = self._frame_delay()
+        if delay > 0 and self._call_later(delay, partial(self._apply, update)):
+            return
+        try:
+            self._apply_changes(update)
+        finally:
+            self._start_next()
+
+    def _frame_delay(self):
+        """
+        seconds until the next frame may be sent
+        """
+        if not self.max_fps:
+            return 0
+        return self._last_frame + 1 / self.max_fps - time.monotonic()
+
+    def _apply_changes(self, update):
+        update.applied = True
+        self._last_frame = time.monotonic()
+        stale = update.generation != self._generation.get(update.key)
+        changes = [
+            (callback, args, merge_key)
+            for callback, args, supersedable, merge_key in update.deferred
+            if not (stale and supersedable)
+        ]
+        latest = {merge_key: i for i, (_, _, merge_key) in enumerate(changes)}
+        with hold_document():
+            for i, (callback, args, merge_key) in enumerate(changes):
+                if merge_key is None or latest[merge_key] == i:
+                    callback(*args)
+        if update.error is not None:
+            raise update.error
+
+    def flush(self):
+        """
+        run every pending update now instead of after its interval.
+
+        On the event loop the updates are queued behind the update computing
+        on the executor, without waiting for it, and applied in order as
+        usual. Outside of a bokeh server session they run at once. While
+        computing an update, only the pending updates of the other keys run
+        """
+        for key in self.pending:
+            if not (_computing() and key == _local.key):
+                self._run(key)
+
+    @property
+    def pending(self):
+        """
+        keys with an update waiting to run
+        """
+        return list(self._pending)
+
+    @property
+    def busy(self):
+        """
+        whether an update is computing or waiting for the executor
+        """
+        return self._running is not None or len(self._queue) > 0
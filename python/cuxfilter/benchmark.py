@@ -0,0 +1,318 @@
+import argparse
+import importlib
+import json
+import time
+from collections import defaultdict
+from functools import wraps
+
+import cudf
+import numpy as np
+from numba import cuda
+from pandas.api.types import is_integer_dtype
+
+from . import __version__, charts
+from .assets.numba_kernels import warmup
+from .dataframe import DataFrame
+
+# stage -> [(owner of the timed functions, timed functions)], the owner is
+# the dashboard, its charts, or a module whose functions take the source of
+# a chart as first argument
+STAGES = {
+    "view_switch": [("dashboard", ["_reset_current_view"])],
+    "tile_build": [("dashboard", ["_calc_data_tiles"])],
+    "query": [
+        (
+            "chart",
+            [
+                "query_chart_by_range",
+                "query_chart_by_indices",
+                "query_chart_by_box",
+                "reload_chart",
+            ],
+        )
+    ],
+    "patch": [
+        ("chart", ["format_source_data", "reset_chart"]),
+        ("cuxfilter.charts.bokeh.plots", ["patch_source_column"]),
+    ],
+}
+
+
+def synthetic_data(rows, columns, seed=0):
+    """
+    description:
+        cudf DataFrame of uniformly distributed random values
+    input:
+        - rows -> number of rows
+        - columns -> dict of column name -> {"dtype", "min", "max"}, the
+            bounds are inclusive for integer dtypes
+        - seed -> random seed
+    output:
+        - cudf.DataFrame
+    """
+    rng = np.random.RandomState(seed)
+    data = {}
+    for name, column in columns.items():
+        dtype = np.dtype(column.get("dtype", "float64"))
+        low, high = column.get("min", 0), column.get("max", 1)
+        if is_integer_dtype(dtype):
+            values = rng.randint(low, high + 1, size=rows)
+        else:
+            values = rng.uniform(low, high, size=rows)
+        data[name] = values.astype(dtype)
+    return cudf.DataFrame(data)
+
+
+def build_chart(chart_spec):
+    """
+    description:
+        chart described by chart_spec
+    input:
+        - chart_spec -> dict with "type", the chart function as
+            "<library>.<chart>" (e.g. "bokeh.bar"), and the optional "args"
+            and "kwargs" of the chart function
+    output:
+        - chart object
+    """
+    library, chart_type = chart_spec["type"].split(".")
+    chart_fn = getattr(getattr(charts, library), chart_type)
+    return chart_fn(
+        *chart_spec.get("args", []), **chart_spec.get("kwargs", {})
+    )
+
+
+class StageTimer:
+    """
+    Records the time spent in each stage of the dashboard interactions,
+    by wrapping the functions of STAGES on the dashboard, chart and module
+    objects.
+
+    Stage times are inclusive, a view switch includes the reload of the
+    charts it triggers. A call made from within a timed call of the same
+    stage and chart is not timed again. The GPU is synchronized before a
+    timed function returns, so that asynchronous kernel launches are
+    accounted to the stage that issued them.
+    """
+
+    def __init__(self, dashboard):
+        self.timings = defaultdict(list)
+        self._running = set()
+        self._wrapped = []
+        sources = {
+            id(chart.source): name
+            for name, chart in dashboard.charts.items()
+            if getattr(chart, "source", None) is not None
+        }
+        for stage, owners in STAGES.items():
+            for owner, functions in owners:
+                if owner == "dashboard":
+                    targets = [(dashboard, lambda *args: None)]
+                elif owner == "chart":
+                    targets = [
+                        (chart, lambda *args, name=name: name)
+                        for name, chart in dashboard.charts.items()
+                    ]
+                else:
+                    targets = [
+                        (
+                            importlib.import_module(owner),
+                            lambda source, *args: sources.get(
+                                id(source), "other"
+                            ),
+                        )
+                    ]
+                for obj, get_name in targets:
+                    for function in functions:
+                        if hasattr(obj, function):
+                            self._wrap(obj, function, stage, get_name)
+
+    def _wrap(self, obj, function, stage, get_name):
+        original = getattr(obj, function)
+
+        @wraps(original)
+        def timed(*args, **kwargs):
+            key = (stage, get_name(*args))
+            if key in self._running:
+                return original(*args, **kwargs)
+            self._running.add(key)
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                cuda.synchronize()
+                self.timings[key].append(time.perf_counter() - start)
+                self._running.discard(key)
+
+        self._wrapped.append((obj, function, original))
+        setattr(obj, function, timed)
+
+    def reset(self):
+        """
+        drop the recorded timings, returning them
+        """
+        timings, self.timings = self.timings, defaultdict(list)
+        return timings
+
+    def restore(self):
+        """
+        unwrap the timed functions
+        """
+        for obj, function, original in reversed(self._wrapped):
+            setattr(obj, function, original)
+        self._wrapped = []
+
+
+def interact(dashboard, chart, interaction):
+    """
+    description:
+        trigger interaction on chart through the callbacks a user triggers
+    input:
+        - dashboard -> cuxfilter.DashBoard
+        - chart -> chart of the dashboard
+        - interaction -> dict with "action" and "value":
+            - "value": set the value of the range slider of a bar or line
+                chart, or of a widget (slider, dropdown, multiselect)
+            - "select": select the row indices of the source of a
+                choropleth chart
+            - "box": box select (xmin, xmax, ymin, ymax) on a scatter chart
+    """
+    action, value = interaction["action"], interaction["value"]
+    if action == "value":
+        widget = getattr(chart, "filter_widget", None)
+        if widget is None:
+            widget = chart.chart
+        if isinstance(widget.value, tuple):
+            value = tuple(value)
+        widget.value = value
+    elif action == "select":
+        chart.source.selected.indices = list(value)
+    elif action == "box":
+        chart.get_selection_geometry_callback(dashboard)(*value)
+    else:
+        raise ValueError("unknown interaction action " + str(action))
+
+
+def summarize(durations):
+    """
+    count, min, median, mean and max of durations in milliseconds
+    """
+    durations = np.asarray(durations) * 1000
+    return {
+        "count": len(durations),
+        "min": float(durations.min()),
+        "median": float(np.median(durations)),
+        "mean": float(durations.mean()),
+        "max": float(durations.max()),
+    }
+
+
+def run(spec):
+    """
+    description:
+        build the dashboard described by spec over synthetic data, replay
+        its interactions and report the latency of every interaction and
+        of its stages
+    input:
+        - spec -> dict with:
+            - "rows", "columns" and "seed": arguments of synthetic_data
+            - "charts": list of chart specs, see build_chart
+            - "dashboard": keyword arguments of DataFrame.dashboard
+            - "interactions": list of interactions, see interact, each
+                with the index of its chart in "charts" as "chart"
+            - "repeat": number of times the interactions are replayed
+            - "warmup": whether to compile the kernels first, default True
+    output:
+        - dict of results, serializable as JSON
+    """
+    if spec.get("warmup", True):
+        warmup()
+    cux_df = DataFrame.from_dataframe(
+        synthetic_data(spec["rows"], spec["columns"], spec.get("seed", 0))
+    )
+    chart_list = [build_chart(chart_spec) for chart_spec in spec["charts"]]
+    dashboard = cux_df.dashboard(chart_list, **spec.get("dashboard", {}))
+    timer = StageTimer(dashboard)
+
+    totals = defaultdict(list)
+    stages = defaultdict(lambda: defaultdict(list))
+    try:
+        for _ in range(spec.get("repeat", 1)):
+            for i, interaction in enumerate(spec["interactions"]):
+                chart = chart_list[interaction["chart"]]
+                timer.reset()
+                start = time.perf_counter()
+                interact(dashboard, chart, interaction)
+                cuda.synchronize()
+                totals[i].append(time.perf_counter() - start)
+                for key, durations in timer.reset().items():
+                    stages[i][key].append(sum(durations))
+    finally:
+        timer.restore()
+
+    results = []
+    for i, interaction in enumerate(spec["interactions"]):
+        result = {
+            "chart": chart_list[interaction["chart"]].name,
+            "action": interaction["action"],
+            "value": interaction["value"],
+            "total": summarize(totals[i]),
+            "stages": {},
+        }
+        for (stage, name), durations in sorted(
+            stages[i].items(), key=lambda item: (item[0][0], str(item[0][1]))
+        ):
+            if name is None:
+                result["stages"][stage] = summarize(durations)
+            else:
+                result["stages"].setdefault(stage, {})[name] = summarize(
+                    durations
+                )
+        results.append(result)
+
+    gpu = cuda.get_current_device().name
+    if isinstance(gpu, bytes):
+        gpu = gpu.decode()
+    return {
+        "cuxfilter_version": __version__,
+        "gpu": gpu,
+        "rows": spec["rows"],
+        "repeat": spec.get("repeat", 1),
+        "interactions": results,
+    }
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description="Measure the latency of scripted dashboard interactions"
+        " without a browser"
+    )
+    parser.add_argument("spec", help="JSON file of the benchmark spec")
+    parser.add_argument(
+        "-o", "--output", help="JSON file to write the results to"
+    )
+    parser.add_argument(
+        "--rows", type=int, help="number of rows, overrides the spec"
+    )
+    parser.add_argument(
+        "--repeat", type=int, help="number of replays, overrides the spec"
+    )
+    args = parser.parse_args(args)
+
+    with open(args.spec) as f:
+        spec = json.load(f)
+    if args.rows is not None:
+        spec["rows"] = args.rows
+    if args.repeat is not None:
+        spec["repeat"] = args.repeat
+
+    results = run(spec)
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
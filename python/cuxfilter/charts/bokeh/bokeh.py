@@ -11,6 +11,9 @@ def bar(
     height=400,
     step_size=None,
     step_size_type=int,
+    quantile=0.5,
+    tile_resolution=None,
+    binning="linear",
     **library_specific_params,
 ):
     """
@@ -25,7 +28,13 @@ def bar(
 
     add_interaction: {True, False},  default True
 
-    aggregate_fn: {'count', 'mean'},  default 'count'
+    aggregate_fn: {'count', 'mean', 'median', 'quantile'},  default 'count'
+        'median' and 'quantile' are approximated using mergeable
+        per-bin sketches of the y column, fixed-width histograms of
+        sketch_bins (128) value bins over [min, max] of the y column. Their
+        error is up to (max - min) / 127, which is large for long-tailed
+        columns such as latencies. Fewer value bins are used if a datatile
+        would exceed its memory budget, increasing the error
 
     width: int,  default 400
 
@@ -35,6 +44,23 @@ def bar(
 
     step_size_type: {int, float},  default int
 
+    quantile: float,  default 0.5
+        quantile of the y column to compute in each bin, used when
+        aggregate_fn='quantile'
+
+    tile_resolution: int,  default None
+        number of bins along x of the datatiles computed when this chart is
+        the active view. When set, the range slider steps at this finer
+        resolution and queries ending mid-bin are answered exactly, without
+        increasing data_points. Defaults to the displayed bins
+
+    binning: {'linear', 'quantile', 'log'} or list of bin edges,
+        default 'linear'
+        'quantile' creates up to data_points bins of similar row counts,
+        'log' creates data_points logarithmically spaced bins from the min
+        value, useful for skewed columns. Non-linear bins are labelled with
+        their edges and tile_resolution is not used
+
     x_label_map: dict,  default None
         label maps for x axis
         {value: mapped_str}
@@ -64,6 +90,9 @@ def bar(
         height,
         step_size,
         step_size_type,
+        quantile,
+        tile_resolution,
+        binning,
         **library_specific_params,
     )
 
@@ -78,6 +107,9 @@ def line(
     height=400,
     step_size=None,
     step_size_type=int,
+    quantile=0.5,
+    tile_resolution=None,
+    binning="linear",
     **library_specific_params,
 ):
     """
@@ -93,7 +125,13 @@ def line(
 
     add_interaction: {True, False},  default True
 
-    aggregate_fn: {'count', 'mean'},  default 'count'
+    aggregate_fn: {'count', 'mean', 'median', 'quantile'},  default 'count'
+        'median' and 'quantile' are approximated using mergeable
+        per-bin sketches of the y column, fixed-width histograms of
+        sketch_bins (128) value bins over [min, max] of the y column. Their
+        error is up to (max - min) / 127, which is large for long-tailed
+        columns such as latencies. Fewer value bins are used if a datatile
+        would exceed its memory budget, increasing the error
 
     width: int,  default 400
 
@@ -103,6 +141,23 @@ def line(
 
     step_size_type: {int, float},  default int
 
+    quantile: float,  default 0.5
+        quantile of the y column to compute in each bin, used when
+        aggregate_fn='quantile'
+
+    tile_resolution: int,  default None
+        number of bins along x of the datatiles computed when this chart is
+        the active view. When set, the range slider steps at this finer
+        resolution and queries ending mid-bin are answered exactly, without
+        increasing data_points. Defaults to the displayed bins
+
+    binning: {'linear', 'quantile', 'log'} or list of bin edges,
+        default 'linear'
+        'quantile' creates up to data_points bins of similar row counts,
+        'log' creates data_points logarithmically spaced bins from the min
+        value, useful for skewed columns. Non-linear bins are labelled with
+        their edges and tile_resolution is not used
+
     x_label_map: dict,  default None
         label maps for x axis
         {value: mapped_str}
@@ -131,6 +186,9 @@ def line(
         height,
         step_size,
         step_size_type,
+        quantile,
+        tile_resolution,
+        binning,
         **library_specific_params,
     )
 
@@ -149,6 +207,7 @@ def choropleth(
     geoJSONProperty=None,
     geo_color_palette=None,
     tile_provider=None,
+    quantile=0.5,
     **library_specific_params,
 ):
     """
@@ -164,8 +223,14 @@ def choropleth(
 
     add_interaction: {True, False},  default True
 
-    aggregate_fn: {'count', 'mean'},  default 'count'
+    aggregate_fn: {'count', 'mean', 'median', 'quantile'},  default 'count'
         defaults to 'count'
+        'median' and 'quantile' are approximated using mergeable
+        per-bin sketches of the y column, fixed-width histograms of
+        sketch_bins (128) value bins over [min, max] of the y column. Their
+        error is up to (max - min) / 127, which is large for long-tailed
+        columns such as latencies. Fewer value bins are used if a datatile
+        would exceed its memory budget, increasing the error
     width: int,  default 800
 
     height: int,  default 400
@@ -174,6 +239,10 @@ def choropleth(
 
     step_size_type: {int, float},  default int
 
+    quantile: float,  default 0.5
+        quantile of the y column to compute in each bin, used when
+        aggregate_fn='quantile'
+
     x_label_map: dict,  default None
         label maps for x axis
         {value: mapped_str}
@@ -220,5 +289,6 @@ def choropleth(
         geoJSONProperty,
         geo_color_palette,
         tile_provider,
+        quantile,
         **library_specific_params,
     )
@@ -15,6 +15,100 @@ from bokeh.models import (
 )
 
 
+# fraction of the rows of a column above which the changed rows are patched
+# as one full patch instead of one slice per run of changed rows
+FULL_PATCH_FRACTION = 0.5
+
+
+def to_typed_array(values, exact=True):
+    """
+    Description:
+        values as a typed ndarray, which bokeh sends to the browser as a
+        binary buffer instead of a list of JSON numbers. Integers are sent
+        as int32 where they fit. Floats are sent as float32 if that keeps
+        them exact or, unless exact, if it keeps their integral values
+        (counts) exact, which suits displayed values such as means. float64
+        is kept otherwise
+    -------------------------------------------
+    Input:
+        values: array-like of numbers
+        exact: whether float values must survive the conversion unchanged
+    -------------------------------------------
+
+    Ouput:
+        ndarray
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in "iub":
+        info = np.iinfo(np.int32)
+        if values.size == 0 or (
+            values.min() >= info.min and values.max() <= info.max
+        ):
+            return values.astype(np.int32)
+        return values.astype(np.float64)
+    if values.dtype.kind != "f":
+        return values
+
+    finite = np.isfinite(values)
+    float32_values = values.astype(np.float32)
+    kept = float32_values[finite] == values[finite]
+    if not exact:
+        # non-integral values may round, values out of range may not
+        integral = values[finite] == np.round(values[finite])
+        kept |= ~integral & np.isfinite(float32_values[finite])
+    if kept.all():
+        return float32_values
+    return values.astype(np.float64)
+
+
+def patch_source_column(source, column, values):
+    """
+    Description:
+        patch column of source with values, sent as a typed array of the
+        column's dtype. Only the runs of rows whose value changed since the
+        last patch are sent, as one slice each, unless they exceed
+        FULL_PATCH_FRACTION of the rows, which are then patched at once
+    -------------------------------------------
+    Input:
+        source: ColumnDataSource
+        column: name of the column to patch
+        values: array-like of the new values of the first len(values) rows
+    -------------------------------------------
+
+    Ouput:
+    """
+    current = np.asarray(source.data[column])
+    values = np.asarray(values).astype(current.dtype)
+    size = values.size
+    if size > current.size:
+        source.patch({column: [(slice(size), values)]})
+        return
+
+    changed = values != current[:size]
+    if values.dtype.kind == "f":
+        changed &= ~(np.isnan(values) & np.isnan(current[:size]))
+    changed = np.flatnonzero(changed)
+    if changed.size == 0:
+        return
+
+    # runs of consecutive changed rows
+    breaks = np.flatnonzero(np.diff(changed) > 1)
+    starts = changed[np.concatenate(([0], breaks + 1))]
+    stops = changed[np.concatenate((breaks, [changed.size - 1]))] + 1
+    # each run costs its bounds on top of its values
+    if changed.size + 2 * starts.size > FULL_PATCH_FRACTION * size:
+        source.patch({column: [(slice(size), values)]})
+        return
+    source.patch(
+        {
+            column: [
+                (slice(int(start), int(stop)), values[start:stop])
+                for start, stop in zip(starts, stops)
+            ]
+        }
+    )
+
+
 class Bar(BaseBar):
     """
         Description:
@@ -32,14 +126,14 @@ class Bar(BaseBar):
         -----------
         source_dict: {'X': [], 'Y': []}
         """
-        range_x_origin = [round(x, 4) for x in source_dict["X"]]
+        range_x_origin = np.round(np.asarray(source_dict["X"]), 4)
         range_x = []
 
-        if self.max_value < 1:
+        if self.max_value < 1 and self.bin_edges is None:
             """
             handling labels in bokeh plots when max value is under 1
             """
-            range_x = [int(x * 100) for x in range_x_origin]
+            range_x = (range_x_origin * 100).astype(np.int64)
             if self.x_label_map is None:
                 temp_mapper_index = list(
                     range(
@@ -54,18 +148,17 @@ class Bar(BaseBar):
         else:
             range_x = range_x_origin
 
+        # float, so that patches may hold NaN for empty bins
+        range_y = to_typed_array(
+            np.asarray(source_dict["Y"], dtype=np.float64), exact=False
+        )
         if patch_update is False:
             self.source = ColumnDataSource(
-                dict(x=np.array(range_x), top=np.array(source_dict["Y"]))
+                dict(x=to_typed_array(range_x), top=range_y)
             )
             self.source_backup = self.source.to_df()
         else:
-            patch_dict = {
-                self.data_y_axis: [
-                    (slice(len(source_dict["Y"])), np.array(source_dict["Y"]))
-                ]
-            }
-            self.source.patch(patch_dict)
+            patch_source_column(self.source, self.data_y_axis, range_y)
 
     def get_source_y_axis(self):
         """
@@ -150,8 +243,7 @@ class Bar(BaseBar):
         x_axis_len = self.source.data[self.data_x_axis].size
         data = data[:x_axis_len]
 
-        patch_dict = {self.data_y_axis: [(slice(data.size), data)]}
-        self.source.patch(patch_dict)
+        patch_source_column(self.source, self.data_y_axis, data)
 
     def apply_theme(self, properties_dict):
         """
@@ -272,14 +364,14 @@ class Line(BaseLine):
         -----------
         source_dict: {'X': [], 'Y': []}
         """
-        range_x_origin = [round(x, 4) for x in source_dict["X"]]
+        range_x_origin = np.round(np.asarray(source_dict["X"]), 4)
         range_x = []
 
-        if self.max_value < 1:
+        if self.max_value < 1 and self.bin_edges is None:
             """
             handling labels in bokeh plots when max value is under 1
             """
-            range_x = [int(x * 100) for x in range_x_origin]
+            range_x = (range_x_origin * 100).astype(np.int64)
             if self.x_label_map is None:
                 temp_mapper_index = list(
                     range(
@@ -294,18 +386,17 @@ class Line(BaseLine):
         else:
             range_x = range_x_origin
 
+        # float, so that patches may hold NaN for empty bins
+        range_y = to_typed_array(
+            np.asarray(source_dict["Y"], dtype=np.float64), exact=False
+        )
         if patch_update is False:
             self.source = ColumnDataSource(
-                dict(x=np.array(range_x), y=np.array(source_dict["Y"]))
+                dict(x=to_typed_array(range_x), y=range_y)
             )
             self.source_backup = self.source.to_df()
         else:
-            patch_dict = {
-                self.data_y_axis: [
-                    (slice(len(source_dict["Y"])), np.array(source_dict["Y"]))
-                ]
-            }
-            self.source.patch(patch_dict)
+            patch_source_column(self.source, self.data_y_axis, range_y)
 
     def get_source_y_axis(self):
         """
@@ -381,8 +472,7 @@ class Line(BaseLine):
         x_axis_len = self.source.data[self.data_x_axis].size
         data = data[:x_axis_len]
 
-        patch_dict = {self.data_y_axis: [(slice(data.size), data)]}
-        self.source.patch(patch_dict)
+        patch_source_column(self.source, self.data_y_axis, data)
 
     def apply_theme(self, properties_dict):
         """
@@ -519,23 +609,18 @@ class Choropleth(BaseChoropleth):
                         rates.append(res_df.loc[res_df["X"] == i, "Y"].iloc[0])
                     else:
                         rates.append(np.nan)
-            rates = np.array(rates)
+            rates = to_typed_array(np.array(rates, dtype=np.float64), False)
 
+            # created with the typed columns, streaming them into empty
+            # columns would upcast them to float64
             self.source = ColumnDataSource(
                 {
-                    self.data_x_axis: np.array([]),
-                    "xs": np.array([]),
-                    "ys": np.array([]),
-                    self.data_y_axis: np.array([]),
+                    self.data_x_axis: to_typed_array(prop),
+                    "xs": np.array(lats),
+                    "ys": np.array(longs),
+                    self.data_y_axis: rates,
                 }
             )
-            data = {
-                self.data_x_axis: np.array(prop),
-                "xs": np.array(lats),
-                "ys": np.array(longs),
-                self.data_y_axis: rates,
-            }
-            self.source.stream(data)
 
         else:
             rates = []
@@ -546,9 +631,7 @@ class Choropleth(BaseChoropleth):
                     ] * len(self.geo_mapper[i])
 
                     rates = rates + temp_list
-            rates = np.array(rates)
-            patch_dict = {self.data_y_axis: [(slice(len(rates)), rates)]}
-            self.source.patch(patch_dict)
+            patch_source_column(self.source, self.data_y_axis, rates)
 
     def get_source_y_axis(self):
         """
@@ -666,7 +749,7 @@ class Choropleth(BaseChoropleth):
             update self.data_y_axis in self.source
         """
         if data.size == 0:
-            data = self.source_backup[self.data_y_axis].tolist()
+            data = np.asarray(self.source_backup[self.data_y_axis])
 
         # verifying length is same as x axis
         x_axis_len = self.source.data[self.data_x_axis].size
@@ -677,10 +760,7 @@ class Choropleth(BaseChoropleth):
             if i in self.geo_mapper:
                 temp_list = [data[i]] * len(self.geo_mapper[i])
                 rates = rates + temp_list
-        rates = np.array(rates)
-        patch_dict = {self.data_y_axis: [(slice(len(rates)), rates)]}
-
-        self.source.patch(patch_dict)
+        patch_source_column(self.source, self.data_y_axis, rates)
 
     def map_indices_to_values(self, indices: list):
         """
@@ -1,10 +1,39 @@
 import numpy as np
 from ..core_chart import BaseChart
+from ....assets.numba_kernels import calc_bin_edges
+from ....assets.quantile_sketch import QUANTILE_AGGREGATES
 
 
 class BaseAggregateChart(BaseChart):
 
     use_data_tiles = True
+    quantile: float = 0.5
+    sketch_bins: int = 128
+
+    def compute_bin_edges(self, data):
+        """
+        Description: compute bin_edges of non-linear binning and label the
+                    x axis bins with their edges
+        -------------------------------------------
+        Input:
+            1. data: cudf DataFrame
+        -------------------------------------------
+
+        Ouput:
+        """
+        self.bin_edges = calc_bin_edges(
+            data[self.x], self.binning, self.data_points
+        )
+        if self.bin_edges is None:
+            return
+        self.min_value, self.max_value = self.bin_edges[0], self.bin_edges[-1]
+        if not self.x_label_map:
+            self.x_label_map = {
+                i: "{:g}-{:g}".format(low, high)
+                for i, (low, high) in enumerate(
+                    zip(self.bin_edges[:-1], self.bin_edges[1:])
+                )
+            }
 
     def query_chart_by_range(self, active_chart, query_tuple, datatile):
         """
@@ -21,14 +50,17 @@ class BaseAggregateChart(BaseChart):
         Ouput:
         """
         min_val, max_val = query_tuple
-        datatile_index_min = int(
-            round((min_val - active_chart.min_value) / active_chart.stride)
-        )
-        datatile_index_max = int(
-            round((max_val - active_chart.min_value) / active_chart.stride)
-        )
-
-        if datatile_index_min == 0:
+        datatile_index_min = active_chart.value_to_tile_index(min_val)
+        datatile_index_max = active_chart.value_to_tile_index(max_val)
+
+        if self.aggregate_fn in QUANTILE_AGGREGATES:
+            datatile_result = datatile.get_quantile(
+                datatile.query_by_range(
+                    datatile_index_min, datatile_index_max
+                ),
+                self.quantile,
+            )
+        elif datatile_index_min == 0:
 
             if self.aggregate_fn == "mean":
                 datatile_result_sum = np.array(
@@ -59,6 +91,58 @@ class BaseAggregateChart(BaseChart):
                 datatile_result = np.array(datatile_max - datatile_min)
         self.reset_chart(datatile_result)
 
+    def get_box_sum(self, datatile, box_indices):
+        """
+        Description: sum of the summed-area datatile over a box, computed
+                    with four lookups per passive bin
+        -------------------------------------------
+        Input:
+            1. datatile: summed-area datatile [type: ndarray]
+            2. box_indices: (x_min, x_max, y_min, y_max) tile indices
+        -------------------------------------------
+
+        Ouput:
+        """
+        x_min, x_max, y_min, y_max = box_indices
+        result = np.array(datatile[x_max, y_max], dtype=np.float64)
+        if x_min > 0:
+            result -= datatile[x_min - 1, y_max]
+        if y_min > 0:
+            result -= datatile[x_max, y_min - 1]
+        if x_min > 0 and y_min > 0:
+            result += datatile[x_min - 1, y_min - 1]
+        return result
+
+    def query_chart_by_box(self, active_chart, box, datatile):
+        """
+        Description:
+
+        -------------------------------------------
+        Input:
+            1. active_chart: chart object of active_chart
+            2. box: (xmin, xmax, ymin, ymax) of the box selection
+            3. datatile: summed-area datatile of active chart for
+                        current chart[type: ndarray]
+        -------------------------------------------
+
+        Ouput:
+        """
+        box_indices = active_chart.get_box_tile_indices(*box)
+
+        if self.aggregate_fn == "mean":
+            if box_indices is None:
+                datatile_result = np.full(datatile[0].shape[-1], np.nan)
+            else:
+                datatile_result = self.get_box_sum(
+                    datatile[0], box_indices
+                ) / self.get_box_sum(datatile[1], box_indices)
+        elif box_indices is None:
+            datatile_result = np.zeros(datatile.shape[-1])
+        else:
+            datatile_result = self.get_box_sum(datatile, box_indices)
+
+        self.reset_chart(datatile_result)
+
     def query_chart_by_indices_for_mean(
         self,
         active_chart,
@@ -90,9 +174,7 @@ class BaseAggregateChart(BaseChart):
         value_count = np.zeros(shape=(len_y_axis,), dtype=np.float64)
 
         for index in new_indices:
-            index = int(
-                round((index - active_chart.min_value) / active_chart.stride)
-            )
+            index = active_chart.value_to_tile_index(index)
             value_sum += datatile[0][int(index)][: self.data_points]
             value_count += datatile[1][int(index)][: self.data_points]
 
@@ -100,6 +182,27 @@ class BaseAggregateChart(BaseChart):
 
         return datatile_result
 
+    def query_chart_by_indices_for_quantile(
+        self, active_chart, new_indices, datatile
+    ):
+        """
+        Description:
+
+        -------------------------------------------
+        Input:
+        -------------------------------------------
+
+        Ouput:
+        """
+        indices = [
+            active_chart.value_to_tile_index(index)
+            for index in new_indices
+            if index != ""
+        ]
+        return datatile.get_quantile(
+            datatile.query_by_indices(indices), self.quantile
+        )
+
     def query_chart_by_indices_for_count(
         self,
         active_chart,
@@ -132,17 +235,13 @@ class BaseAggregateChart(BaseChart):
             )[:len_y_axis]
 
         for index in calc_new:
-            index = int(
-                round((index - active_chart.min_value) / active_chart.stride)
-            )
+            index = active_chart.value_to_tile_index(index)
             datatile_result += np.array(
                 datatile[int(index)][: self.data_points]
             )
 
         for index in remove_old:
-            index = int(
-                round((index - active_chart.min_value) / active_chart.stride)
-            )
+            index = active_chart.value_to_tile_index(index)
             datatile_result -= np.array(
                 datatile[int(index)][: self.data_points]
             )
@@ -173,7 +272,11 @@ class BaseAggregateChart(BaseChart):
         if "" in remove_old:
             remove_old.remove("")
 
-        if self.aggregate_fn == "mean":
+        if self.aggregate_fn in QUANTILE_AGGREGATES:
+            datatile_result = self.query_chart_by_indices_for_quantile(
+                active_chart, new_indices, datatile
+            )
+        elif self.aggregate_fn == "mean":
             datatile_result = self.query_chart_by_indices_for_mean(
                 active_chart,
                 old_indices,
@@ -140,8 +140,8 @@ class Base3dChoropleth(BaseChart):
         Ouput:
 
         """
-        self.min_value = dashboard_cls._data[self.x].min()
-        self.max_value = dashboard_cls._data[self.x].max()
+        self.min_value = dashboard_cls._data_stats.min(self.x)
+        self.max_value = dashboard_cls._data_stats.max(self.x)
 
         if isinstance(self.geo_mapper, pd.DataFrame):
             self.geo_mapper, x_range, y_range = geo_json_mapper(
@@ -190,6 +190,20 @@ class Base3dChoropleth(BaseChart):
 
         Ouput:
         """
+        self.format_source_data(self.compute_source(data), patch_update)
+
+    def compute_source(self, data):
+        """
+        Description: source dict of the chart over data, computed
+                    without changing the bokeh models
+        -------------------------------------------
+        Input:
+        data = cudf.DataFrame
+        -------------------------------------------
+
+        Ouput:
+            dict_temp
+        """
         df = calc_groupby(self, data, agg=self.aggregate_dict)
 
         dict_temp = {
@@ -197,8 +211,7 @@ class Base3dChoropleth(BaseChart):
             self.color_column: list(df[1].astype(df[1].dtype)),
             self.elevation_column: list(df[2].astype(df[2].dtype)),
         }
-
-        self.format_source_data(dict_temp, patch_update)
+        return dict_temp
 
     def get_selection_callback(self, dashboard_cls):
         """
@@ -211,11 +224,24 @@ class Base3dChoropleth(BaseChart):
         Ouput:
         """
 
-        def selection_callback(old, new):
+        # selection the charts were last queried with
+        self._queried_indices = []
+
+        def query_indices(new):
             if dashboard_cls._active_view != self.name:
                 dashboard_cls._reset_current_view(new_active_view=self)
                 dashboard_cls._calc_data_tiles(cumsum=False)
-            dashboard_cls._query_datatiles_by_indices(old, new)
+                # the charts were reloaded without the selection
+                self._queried_indices = []
+            dashboard_cls._query_datatiles_by_indices(
+                self._queried_indices, new
+            )
+            self._queried_indices = new
+
+        def selection_callback(old, new):
+            # coalesce selections, the latest selection is queried from the
+            # selection queried last rather than from old
+            dashboard_cls._scheduler.schedule(self.name, query_indices, new)
 
         return selection_callback
 
@@ -269,12 +295,17 @@ class Base3dChoropleth(BaseChart):
         Ouput:
         """
 
-        def reset_callback(event):
+        def reset_chart():
             if dashboard_cls._active_view != self.name:
                 # reset previous active view and set current chart as
                 # active view
                 dashboard_cls._reset_current_view(new_active_view=self)
             dashboard_cls._reload_charts()
+            self._queried_indices = []
+
+        def reset_callback(event):
+            # replaces the pending selection of the chart
+            dashboard_cls._scheduler.schedule(self.name, reset_chart)
 
         # add callback to reset chart button
         self.add_event(self.reset_event, reset_callback)
@@ -324,12 +355,8 @@ class Base3dChoropleth(BaseChart):
             datatile = datatile_dict[key]
             datatile_result = None
             min_val, max_val = query_tuple
-            datatile_index_min = int(
-                round((min_val - active_chart.min_value) / active_chart.stride)
-            )
-            datatile_index_max = int(
-                round((max_val - active_chart.min_value) / active_chart.stride)
-            )
+            datatile_index_min = active_chart.value_to_tile_index(min_val)
+            datatile_index_max = active_chart.value_to_tile_index(max_val)
             if key == self.color_column:
                 temp_agg_function = self.color_aggregate_fn
             else:
@@ -410,9 +437,7 @@ class Base3dChoropleth(BaseChart):
         value_count = np.zeros(shape=(len_y_axis,), dtype=np.float64)
 
         for index in new_indices:
-            index = int(
-                round((index - active_chart.min_value) / active_chart.stride)
-            )
+            index = active_chart.value_to_tile_index(index)
             value_sum += np.array(datatile[0][int(index)][: self.data_points])
             value_count += np.array(
                 datatile[1][int(index)][: self.data_points]
@@ -454,17 +479,13 @@ class Base3dChoropleth(BaseChart):
             )[:len_y_axis]
 
         for index in calc_new:
-            index = int(
-                round((index - active_chart.min_value) / active_chart.stride)
-            )
+            index = active_chart.value_to_tile_index(index)
             datatile_result += np.array(
                 datatile[int(index)][: self.data_points]
             )
 
         for index in remove_old:
-            index = int(
-                round((index - active_chart.min_value) / active_chart.stride)
-            )
+            index = active_chart.value_to_tile_index(index)
             datatile_result -= np.array(
                 datatile[int(index)][: self.data_points]
             )
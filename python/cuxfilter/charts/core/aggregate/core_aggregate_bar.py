@@ -1,7 +1,13 @@
+import numpy as np
 import panel as pn
 
 from .core_aggregate import BaseAggregateChart
-from ....assets.numba_kernels import calc_value_counts, calc_groupby
+from ....assets.numba_kernels import (
+    calc_value_counts,
+    calc_value_counts_by_edges,
+    calc_groupby,
+)
+from ....assets.quantile_sketch import QUANTILE_AGGREGATES
 from ....layouts import chart_view
 
 
@@ -38,6 +44,9 @@ class BaseBar(BaseAggregateChart):
         height=400,
         step_size=None,
         step_size_type=int,
+        quantile=0.5,
+        tile_resolution=None,
+        binning="linear",
         **library_specific_params,
     ):
         """
@@ -54,6 +63,9 @@ class BaseBar(BaseAggregateChart):
             height
             step_size
             step_size_type
+            quantile
+            tile_resolution
+            binning
             x_label_map
             y_label_map
             **library_specific_params
@@ -67,10 +79,13 @@ class BaseBar(BaseAggregateChart):
         self.data_points = data_points
         self.add_interaction = add_interaction
         self.aggregate_fn = aggregate_fn
+        self.quantile = 0.5 if aggregate_fn == "median" else quantile
         self.height = height
         self.width = width
         self.stride = step_size
         self.stride_type = step_size_type
+        self.tile_resolution = tile_resolution
+        self.binning = binning
         self.library_specific_params = library_specific_params
 
     def initiate_chart(self, dashboard_cls):
@@ -85,8 +100,8 @@ class BaseBar(BaseAggregateChart):
         Ouput:
 
         """
-        self.min_value = dashboard_cls._data[self.x].min()
-        self.max_value = dashboard_cls._data[self.x].max()
+        self.min_value = dashboard_cls._data_stats.min(self.x)
+        self.max_value = dashboard_cls._data_stats.max(self.x)
         if self.data_points > dashboard_cls._data[self.x].shape[0]:
             self.data_points = dashboard_cls._data[self.x].shape[0]
 
@@ -102,6 +117,7 @@ class BaseBar(BaseAggregateChart):
                     (self.max_value - self.min_value) / self.data_points
                 )
 
+        self.compute_bin_edges(dashboard_cls._data)
         self.calculate_source(dashboard_cls._data)
         self.generate_chart()
         self.apply_mappers()
@@ -124,21 +140,42 @@ class BaseBar(BaseAggregateChart):
 
         Ouput:
         """
-        if self.y == self.x or self.y is None:
+        self.format_source_data(self.compute_source(data), patch_update)
+
+    def compute_source(self, data):
+        """
+        Description: source dict of the chart over data, computed
+                    without changing the bokeh models
+        -------------------------------------------
+        Input:
+        data = cudf.DataFrame
+        -------------------------------------------
+
+        Ouput:
+            dict_temp
+        """
+        if self.bin_edges is not None and (self.y == self.x or self.y is None):
+            # it's a histogram over non-uniform bins
+            df = calc_value_counts_by_edges(
+                data[self.x].to_gpu_array(), self.bin_edges
+            )
+        elif self.y == self.x or self.y is None:
             # it's a histogram
             df = calc_value_counts(
-                data[self.x].to_gpu_array(), self.data_points
+                data[self.x].to_gpu_array(),
+                self.data_points,
+                x_range=(self.min_value, self.max_value),
             )
         else:
-            self.aggregate_fn = "mean"
+            if self.aggregate_fn not in QUANTILE_AGGREGATES:
+                self.aggregate_fn = "mean"
             df = calc_groupby(self, data)
 
         dict_temp = {
-            "X": list(df[0].astype(df[0].dtype)),
-            "Y": list(df[1].astype(df[1].dtype)),
+            "X": np.asarray(df[0]),
+            "Y": np.asarray(df[1]),
         }
-
-        self.format_source_data(dict_temp, patch_update)
+        return dict_temp
 
     def add_range_slider_filter(self, dashboard_cls):
         """
@@ -162,17 +199,23 @@ class BaseBar(BaseAggregateChart):
             start=self.min_value,
             end=self.max_value,
             value=(self.min_value, self.max_value),
-            step=self.stride,
+            step=self.tile_stride,
             **{"width": self.width},
             sizing_mode="scale_width",
         )
 
-        def filter_widget_callback(event):
+        def query_range(query_tuple):
             if dashboard_cls._active_view != self.name:
                 dashboard_cls._reset_current_view(new_active_view=self)
                 dashboard_cls._calc_data_tiles()
 
-            dashboard_cls._query_datatiles_by_range(event.new)
+            dashboard_cls._query_datatiles_by_range(query_tuple)
+
+        def filter_widget_callback(event):
+            # coalesce slider drags, only the latest range is queried
+            dashboard_cls._scheduler.schedule(
+                self.name, query_range, event.new
+            )
 
         # add callback to filter_Widget on value change
         self.filter_widget.param.watch(
@@ -1,4 +1,5 @@
 from typing import Dict
+import numpy as np
 
 from .core_aggregate import BaseAggregateChart
 from ....assets.numba_kernels import calc_value_counts, calc_groupby
@@ -43,6 +44,7 @@ class BaseChoropleth(BaseAggregateChart):
         geoJSONProperty=None,
         geo_color_palette=None,
         tile_provider=None,
+        quantile=0.5,
         **library_specific_params,
     ):
         """
@@ -66,6 +68,7 @@ class BaseChoropleth(BaseAggregateChart):
             x_label_map
             y_label_map
             tile_provider
+            quantile
             **library_specific_params
         -------------------------------------------
 
@@ -77,6 +80,7 @@ class BaseChoropleth(BaseAggregateChart):
         self.data_points = data_points
         self.add_interaction = add_interaction
         self.aggregate_fn = aggregate_fn
+        self.quantile = 0.5 if aggregate_fn == "median" else quantile
 
         if geoJSONSource is None:
             print("geoJSONSource is required for the choropleth map")
@@ -119,8 +123,8 @@ class BaseChoropleth(BaseAggregateChart):
         Ouput:
 
         """
-        self.min_value = dashboard_cls._data[self.x].min()
-        self.max_value = dashboard_cls._data[self.x].max()
+        self.min_value = dashboard_cls._data_stats.min(self.x)
+        self.max_value = dashboard_cls._data_stats.max(self.x)
 
         if self.data_points > dashboard_cls._data[self.x].shape[0]:
             self.data_points = dashboard_cls._data[self.x].shape[0]
@@ -157,20 +161,35 @@ class BaseChoropleth(BaseAggregateChart):
 
         Ouput:
         """
+        self.format_source_data(self.compute_source(data), patch_update)
+
+    def compute_source(self, data):
+        """
+        Description: source dict of the chart over data, computed
+                    without changing the bokeh models
+        -------------------------------------------
+        Input:
+        data = cudf.DataFrame
+        -------------------------------------------
+
+        Ouput:
+            dict_temp
+        """
         if self.y == self.x or self.y is None:
             # it's a histogram
             df = calc_value_counts(
-                data[self.x].to_gpu_array(), self.data_points
+                data[self.x].to_gpu_array(),
+                self.data_points,
+                x_range=(self.min_value, self.max_value),
             )
         else:
             df = calc_groupby(self, data)
 
         dict_temp = {
-            "X": list(df[0].astype(df[0].dtype)),
-            "Y": list(df[1].astype(df[1].dtype)),
+            "X": np.asarray(df[0]),
+            "Y": np.asarray(df[1]),
         }
-
-        self.format_source_data(dict_temp, patch_update)
+        return dict_temp
 
     def get_selection_callback(self, dashboard_cls):
         """
@@ -183,11 +202,24 @@ class BaseChoropleth(BaseAggregateChart):
         Ouput:
         """
 
-        def selection_callback(old, new):
+        # selection the charts were last queried with
+        self._queried_indices = []
+
+        def query_indices(new):
             if dashboard_cls._active_view != self.name:
                 dashboard_cls._reset_current_view(new_active_view=self)
                 dashboard_cls._calc_data_tiles(cumsum=False)
-            dashboard_cls._query_datatiles_by_indices(old, new)
+                # the charts were reloaded without the selection
+                self._queried_indices = []
+            dashboard_cls._query_datatiles_by_indices(
+                self._queried_indices, new
+            )
+            self._queried_indices = new
+
+        def selection_callback(old, new):
+            # coalesce selections, the latest selection is queried from the
+            # selection queried last rather than from old
+            dashboard_cls._scheduler.schedule(self.name, query_indices, new)
 
         return selection_callback
 
@@ -241,12 +273,17 @@ class BaseChoropleth(BaseAggregateChart):
         Ouput:
         """
 
-        def reset_callback(event):
+        def reset_chart():
             if dashboard_cls._active_view != self.name:
                 # reset previous active view and set current chart as
                 # active view
                 dashboard_cls._reset_current_view(new_active_view=self)
             dashboard_cls._reload_charts()
+            self._queried_indices = []
+
+        def reset_callback(event):
+            # replaces the pending selection of the chart
+            dashboard_cls._scheduler.schedule(self.name, reset_chart)
 
         # add callback to reset chart button
         self.add_event(self.reset_event, reset_callback)
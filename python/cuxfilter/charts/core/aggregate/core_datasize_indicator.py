@@ -1,3 +1,5 @@
+import numpy as np
+
 from .core_aggregate import BaseAggregateChart
 from ....layouts import chart_view
 
@@ -57,9 +59,25 @@ class BaseDataSizeIndicator(BaseAggregateChart):
 
         Ouput:
         """
-        dict_temp = {"X": list([1]), "Y": list([data.shape[0]])}
+        self.format_source_data(self.compute_source(data), patch_update)
 
-        self.format_source_data(dict_temp, patch_update)
+    def compute_source(self, data):
+        """
+        Description: source dict of the chart over data, computed
+                    without changing the bokeh models
+        -------------------------------------------
+        Input:
+        data = cudf.DataFrame
+        -------------------------------------------
+
+        Ouput:
+            dict_temp
+        """
+        dict_temp = {
+            "X": np.asarray([1]),
+            "Y": np.asarray([data.shape[0]]),
+        }
+        return dict_temp
 
     def query_chart_by_range(self, active_chart, query_tuple, datatile):
         """
@@ -77,12 +95,8 @@ class BaseDataSizeIndicator(BaseAggregateChart):
         """
         min_val, max_val = query_tuple
 
-        datatile_index_min = int(
-            round((min_val - active_chart.min_value) / active_chart.stride)
-        )
-        datatile_index_max = int(
-            round((max_val - active_chart.min_value) / active_chart.stride)
-        )
+        datatile_index_min = active_chart.value_to_tile_index(min_val)
+        datatile_index_max = active_chart.value_to_tile_index(max_val)
 
         if datatile_index_min == 0:
             datatile_result = datatile.loc[datatile_index_max].values
@@ -94,6 +108,28 @@ class BaseDataSizeIndicator(BaseAggregateChart):
 
         self.reset_chart(datatile_result)
 
+    def query_chart_by_box(self, active_chart, box, datatile):
+        """
+        Description:
+
+        -------------------------------------------
+        Input:
+            1. active_chart: chart object of active_chart
+            2. box: (xmin, xmax, ymin, ymax) of the box selection
+            3. datatile: summed-area datatile of active chart for current
+                        chart[type: ndarray]
+        -------------------------------------------
+
+        Ouput:
+        """
+        box_indices = active_chart.get_box_tile_indices(*box)
+        if box_indices is None:
+            datatile_result = 0
+        else:
+            datatile_result = float(self.get_box_sum(datatile, box_indices))
+
+        self.reset_chart(datatile_result)
+
     def query_chart_by_indices_for_count(
         self,
         active_chart,
@@ -122,15 +158,11 @@ class BaseDataSizeIndicator(BaseAggregateChart):
             datatile_result = self.get_source_y_axis()
 
         for index in calc_new:
-            index = int(
-                round((index - active_chart.min_value) / active_chart.stride)
-            )
+            index = active_chart.value_to_tile_index(index)
             datatile_result += datatile.loc[int(index)][0]
 
         for index in remove_old:
-            index = int(
-                round((index - active_chart.min_value) / active_chart.stride)
-            )
+            index = active_chart.value_to_tile_index(index)
             datatile_result -= datatile.loc[int(index)][0]
 
         return datatile_result
@@ -1,4 +1,5 @@
 from typing import Dict
+import numpy as np
 
 
 class BaseChart:
@@ -22,6 +23,9 @@ class BaseChart:
     max_value: float = 0.0
     x_label_map = {}
     y_label_map = {}
+    tile_resolution: int = None
+    binning = "linear"
+    bin_edges = None
 
     @property
     def name(self):
@@ -52,6 +56,35 @@ class BaseChart:
                 )
             self._stride = value
 
+    @property
+    def tile_stride(self):
+        """
+        bin width of the datatiles along the active axis, finer than the
+        displayed bins when tile_resolution is set
+        """
+        if (
+            self.bin_edges is not None
+            or self.tile_resolution is None
+            or self.tile_resolution < 2
+            or self.max_value == self.min_value
+        ):
+            return self.stride
+        tile_stride = (self.max_value - self.min_value) / (
+            self.tile_resolution - 1
+        )
+        if self.stride_type == int:
+            tile_stride = max(int(tile_stride), 1)
+        return tile_stride
+
+    def value_to_tile_index(self, value):
+        """
+        index of value along the active axis of the datatiles
+        """
+        if self.bin_edges is not None:
+            index = np.searchsorted(self.bin_edges, value, side="right") - 1
+            return int(np.clip(index, 0, len(self.bin_edges) - 2))
+        return int(round((value - self.min_value) / self.tile_stride))
+
     @property
     def width(self):
         return self._width
@@ -110,6 +143,14 @@ class BaseChart:
         print("base calc source function, to over-ridden by delegated classes")
         return -1
 
+    def compute_source(self, data):
+        """
+        source of the chart over data, computed without changing the bokeh
+        models so that it can run off the event loop, None for charts that
+        only reload with reload_chart
+        """
+        return None
+
     def generate_chart(self):
         print("base calc source function, to over-ridden by delegated classes")
         return -1
@@ -122,6 +163,15 @@ class BaseChart:
         print("base calc source function, to over-ridden by delegated classes")
         return -1
 
+    def get_query_range(self):
+        """
+        (min, max) currently selected by the range filter widget of the
+        chart, None if the chart has no range filter
+        """
+        if self.filter_widget is None:
+            return None
+        return tuple(self.filter_widget.value)
+
     def reset_chart(self, data: list = []):
         print("base calc source function, to over-ridden by delegated classes")
         return -1
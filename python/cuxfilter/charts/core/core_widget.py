@@ -18,6 +18,8 @@ class BaseWidget:
     max_value: float = 0.0
     label_map: Dict[str, str] = None
     use_data_tiles = False
+    tile_resolution: int = None
+    bin_edges = None
 
     @property
     def name(self):
@@ -38,6 +40,31 @@ class BaseWidget:
                 value = self.stride_type(1.0)
             self._stride = value
 
+    @property
+    def tile_stride(self):
+        """
+        bin width of the datatiles along the active axis, finer than the
+        displayed bins when tile_resolution is set
+        """
+        if (
+            self.tile_resolution is None
+            or self.tile_resolution < 2
+            or self.max_value == self.min_value
+        ):
+            return self.stride
+        tile_stride = (self.max_value - self.min_value) / (
+            self.tile_resolution - 1
+        )
+        if self.stride_type == int:
+            tile_stride = max(int(tile_stride), 1)
+        return tile_stride
+
+    def value_to_tile_index(self, value):
+        """
+        index of value along the active axis of the datatiles
+        """
+        return int(round((value - self.min_value) / self.tile_stride))
+
     def __init__(
         self,
         x,
@@ -69,6 +96,9 @@ class BaseWidget:
         if "value" in params:
             self.value = params["value"]
             params.pop("value")
+        if "tile_resolution" in params:
+            self.tile_resolution = params["tile_resolution"]
+            params.pop("tile_resolution")
         if "label_map" in params:
             self.label_map = params["label_map"]
             self.label_map = {v: k for k, v in self.label_map.items()}
@@ -83,6 +113,13 @@ class BaseWidget:
     def compute_query_dict(self, query_dict):
         print("base calc source function, to over-ridden by delegated classes")
 
+    def get_query_range(self):
+        """
+        (min, max) currently selected by the widget, None if the widget does
+        not filter by range
+        """
+        return None
+
     def reload_chart(self, *args, **kwargs):
         # No reload functionality, added function for consistency
         # with other charts
@@ -79,8 +79,8 @@ class BaseLine(BaseNonAggregate):
         Ouput:
 
         """
-        self.min_value = dashboard_cls._data[self.x].min()
-        self.max_value = dashboard_cls._data[self.x].max()
+        self.min_value = dashboard_cls._data_stats.min(self.x)
+        self.max_value = dashboard_cls._data_stats.max(self.x)
 
         if self.data_points > dashboard_cls._data[self.x].shape[0]:
             self.data_points = dashboard_cls._data[self.x].shape[0]
@@ -130,17 +130,23 @@ class BaseLine(BaseNonAggregate):
             start=self.min_value,
             end=self.max_value,
             value=(self.min_value, self.max_value),
-            step=self.stride,
+            step=self.tile_stride,
             **{"width": self.width},
             sizing_mode="scale_width",
         )
 
-        def filter_widget_callback(event):
+        def query_range(query_tuple):
             if dashboard_cls._active_view != self.name:
                 dashboard_cls._reset_current_view(new_active_view=self)
                 dashboard_cls._calc_data_tiles()
 
-            dashboard_cls._query_datatiles_by_range(event.new)
+            dashboard_cls._query_datatiles_by_range(query_tuple)
+
+        def filter_widget_callback(event):
+            # coalesce slider drags, only the latest range is queried
+            dashboard_cls._scheduler.schedule(
+                self.name, query_range, event.new
+            )
 
         # add callback to filter_Widget on value change
         self.filter_widget.param.watch(
@@ -19,6 +19,10 @@ class BaseNonAggregate(BaseChart):
     y_range: Tuple = None
     aggregate_col = None
     use_data_tiles = False
+    datatile_loaded_state: bool = False
+    box_select_tile_bins: int = 0
+    tile_x_range: Tuple = None
+    tile_y_range: Tuple = None
 
     def initiate_chart(self, dashboard_cls):
         """
@@ -32,16 +36,20 @@ class BaseNonAggregate(BaseChart):
         Ouput:
 
         """
-        if self.x_range is None:
-            self.x_range = (
-                dashboard_cls._data[self.x].min(),
-                dashboard_cls._data[self.x].max(),
+        if self.x_range is None or self.box_select_tile_bins > 0:
+            self.tile_x_range = (
+                dashboard_cls._data_stats.min(self.x),
+                dashboard_cls._data_stats.max(self.x),
             )
-        if self.y_range is None:
-            self.y_range = (
-                dashboard_cls._data[self.y].min(),
-                dashboard_cls._data[self.y].max(),
+            if self.x_range is None:
+                self.x_range = self.tile_x_range
+        if self.y_range is None or self.box_select_tile_bins > 0:
+            self.tile_y_range = (
+                dashboard_cls._data_stats.min(self.y),
+                dashboard_cls._data_stats.max(self.y),
             )
+            if self.y_range is None:
+                self.y_range = self.tile_y_range
         self.calculate_source(dashboard_cls._data)
         self.generate_chart()
         self.add_events(dashboard_cls)
@@ -74,7 +82,7 @@ class BaseNonAggregate(BaseChart):
 
         """
 
-        def selection_callback(xmin, xmax, ymin, ymax):
+        def query_box(xmin, xmax, ymin, ymax):
             if dashboard_cls._active_view != self.name:
                 # reset previous active view and
                 # set current chart as active view
@@ -102,15 +110,61 @@ class BaseNonAggregate(BaseChart):
             temp_data = dashboard_cls._query(
                 dashboard_cls._query_str_dict[self.name]
             )
-            # reload all charts with new queried data (cudf.DataFrame only)
-            dashboard_cls._reload_charts(
-                data=temp_data, ignore_cols=[self.name]
-            )
+            if self.box_select_tile_bins > 0:
+                # update aggregate charts using summed-area datatiles,
+                # remaining charts are reloaded with temp_data
+                if not self.datatile_loaded_state:
+                    dashboard_cls._calc_data_tiles()
+                dashboard_cls._query_datatiles_by_box(
+                    (xmin, xmax, ymin, ymax), temp_data
+                )
+            else:
+                # reload all charts with new queried data (cudf.DataFrame)
+                dashboard_cls._reload_charts(
+                    data=temp_data, ignore_cols=[self.name]
+                )
             self.reload_chart(temp_data, False)
             del temp_data
 
+        def selection_callback(xmin, xmax, ymin, ymax):
+            # coalesce box selections, only the latest box is queried
+            dashboard_cls._scheduler.schedule(
+                self.name, query_box, xmin, xmax, ymin, ymax
+            )
+
         return selection_callback
 
+    def get_box_tile_indices(self, xmin, xmax, ymin, ymax):
+        """
+        Description: map a box selection to the (x, y) bin indices of the
+                    summed-area datatiles, None if the box does not
+                    overlap the data
+        -------------------------------------------
+        Input:
+
+        -------------------------------------------
+
+        Ouput:
+            (x_index_min, x_index_max, y_index_min, y_index_max)
+        """
+        indices = []
+        for (val_min, val_max), (a_min, a_max) in (
+            ((xmin, xmax), self.tile_x_range),
+            ((ymin, ymax), self.tile_y_range),
+        ):
+            stride = (a_max - a_min) / (self.box_select_tile_bins - 1)
+            if stride == 0:
+                stride = 1
+            index_min = max(int(round((val_min - a_min) / stride)), 0)
+            index_max = min(
+                int(round((val_max - a_min) / stride)),
+                self.box_select_tile_bins - 1,
+            )
+            if index_min > index_max:
+                return None
+            indices.extend([index_min, index_max])
+        return tuple(indices)
+
     def compute_query_dict(self, query_str_dict):
         """
         Description:
@@ -167,7 +221,7 @@ class BaseNonAggregate(BaseChart):
         Ouput:
         """
 
-        def reset_callback(event):
+        def reset_chart():
             if dashboard_cls._active_view != self.name:
                 # reset previous active view and set current
                 # chart as active view
@@ -177,6 +231,10 @@ class BaseNonAggregate(BaseChart):
             self.y_range = None
             dashboard_cls._reload_charts()
 
+        def reset_callback(event):
+            # replaces the pending box selection of the chart
+            dashboard_cls._scheduler.schedule(self.name, reset_chart)
+
         # add callback to reset chart button
         self.add_event(self.reset_event, reset_callback)
 
@@ -19,6 +19,7 @@ class BaseScatter(BaseNonAggregate):
     x_range: Tuple = None
     y_range: Tuple = None
     aggregate_col = None
+    box_select_tile_bins: int = 0
 
     def __init__(
         self,
@@ -37,6 +38,7 @@ class BaseScatter(BaseNonAggregate):
         pixel_spread="dynspread",
         width=800,
         height=400,
+        box_select_tile_bins=0,
         **library_specific_params,
     ):
         """
@@ -55,6 +57,7 @@ class BaseScatter(BaseNonAggregate):
             width
             height
             tile_provider
+            box_select_tile_bins
             **library_specific_params
         -------------------------------------------
 
@@ -81,4 +84,5 @@ class BaseScatter(BaseNonAggregate):
         self.pixel_shade_type = pixel_shade_type
         self.pixel_density = pixel_density
         self.pixel_spread = pixel_spread
+        self.box_select_tile_bins = box_select_tile_bins
         self.library_specific_params = library_specific_params
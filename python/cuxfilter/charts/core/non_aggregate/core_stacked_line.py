@@ -86,15 +86,14 @@ class BaseStackedLine(BaseChart):
         """
         if self.x_range is None:
             self.x_range = (
-                dashboard_cls._data[self.x].min(),
-                dashboard_cls._data[self.x].max(),
+                dashboard_cls._data_stats.min(self.x),
+                dashboard_cls._data_stats.max(self.x),
             )
         if self.y_range is None:
-            # cudf_df[['a','b','c']].min().min() gives min value
-            # between all values in columns a,b and c
+            # min and max values between all values in columns self.y
             self.y_range = (
-                dashboard_cls._data[self.y].min().min(),
-                dashboard_cls._data[self.y].max().max(),
+                min(dashboard_cls._data_stats.min(col) for col in self.y),
+                max(dashboard_cls._data_stats.max(col) for col in self.y),
             )
         self.calculate_source(dashboard_cls._data)
         self.generate_chart()
@@ -128,7 +127,7 @@ class BaseStackedLine(BaseChart):
 
         """
 
-        def selection_callback(xmin, xmax, ymin, ymax):
+        def query_box(xmin, xmax, ymin, ymax):
             if dashboard_cls._active_view != self.name:
                 # reset previous active view and
                 # set current chart as active view
@@ -148,6 +147,12 @@ class BaseStackedLine(BaseChart):
             # self.reload_chart(temp_data, False)
             del temp_data
 
+        def selection_callback(xmin, xmax, ymin, ymax):
+            # coalesce box selections, only the latest box is queried
+            dashboard_cls._scheduler.schedule(
+                self.name, query_box, xmin, xmax, ymin, ymax
+            )
+
         return selection_callback
 
     def compute_query_dict(self, query_str_dict):
@@ -200,7 +205,7 @@ class BaseStackedLine(BaseChart):
         Ouput:
         """
 
-        def reset_callback(event):
+        def reset_chart():
             if dashboard_cls._active_view != self.name:
                 # reset previous active view and
                 # set current chart as active view
@@ -210,6 +215,10 @@ class BaseStackedLine(BaseChart):
             self.y_range = None
             dashboard_cls._reload_charts()
 
+        def reset_callback(event):
+            # replaces the pending box selection of the chart
+            dashboard_cls._scheduler.schedule(self.name, reset_chart)
+
         # add callback to reset chart button
         self.add_event(self.reset_event, reset_callback)
 
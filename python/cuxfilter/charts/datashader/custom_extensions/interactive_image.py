@@ -9,6 +9,8 @@ import time
 from bokeh.document import Document
 from bokeh.models import ColumnDataSource
 
+from ....assets.scheduler import submit
+
 bokeh_version = LooseVersion(bokeh.__version__)
 
 if bokeh_version > "0.12.9":
@@ -101,6 +103,7 @@ class InteractiveImage(object):
         self.update_image(dict_temp)
 
     _callbacks = {}
+    _generation = 0
 
     def __init__(self, bokeh_plot, callback, delay=200, timeout=0.4, **kwargs):
         self.p = bokeh_plot
@@ -145,25 +148,37 @@ class InteractiveImage(object):
 
     def update_image(self, ranges):
         """
-        Updates image with data returned by callback
+        Updates image with data returned by callback. The image is rendered
+        off the event loop in a bokeh server session, renders superseded by
+        a later update are discarded
         """
         x_range = (ranges["xmin"], ranges["xmax"])
         y_range = (ranges["ymin"], ranges["ymax"])
         dh = y_range[1] - y_range[0]
         dw = x_range[1] - x_range[0]
-
-        image = self.callback(
-            x_range, y_range, ranges["w"], ranges["h"], **self.kwargs
-        )
-        new_data = dict(
-            image=[image.data],
-            x=[x_range[0]],
-            y=[y_range[0]],
-            dw=[dw],
-            dh=[dh],
-        )
-
-        self.ds.data.update(new_data)
+        kwargs = dict(self.kwargs)
+        self._generation += 1
+        generation = self._generation
+
+        def render():
+            return self.callback(
+                x_range, y_range, ranges["w"], ranges["h"], **kwargs
+            )
+
+        def apply(image):
+            if generation != self._generation:
+                return
+            new_data = dict(
+                image=[image.data],
+                x=[x_range[0]],
+                y=[y_range[0]],
+                dw=[dw],
+                dh=[dh],
+            )
+
+            self.ds.data.update(new_data)
+
+        submit(render, apply)
 
     def _repr_html_(self):
         self.doc = Document()
@@ -18,6 +18,7 @@ def scatter_geo(
     width=800,
     height=400,
     tile_provider="CARTODBPOSITRON",
+    box_select_tile_bins=0,
     **library_specific_params,
 ):
     """
@@ -72,6 +73,13 @@ def scatter_geo(
         Underlying map type.See
         https://bokeh.pydata.org/en/latest/docs/reference/tile_providers.html
 
+    box_select_tile_bins: int, default 0
+        Number of bins per axis of the datatiles computed for box
+        selections. If 0, box selections query the data exactly. Else box
+        selections are answered from datatiles, with their edges rounded to
+        a grid of box_select_tile_bins points over the range of the data,
+        trading accuracy for speed.
+
     title: str,
 
         chart title
@@ -102,6 +110,7 @@ def scatter_geo(
         width,
         height,
         tile_provider,
+        box_select_tile_bins,
         **library_specific_params,
     )
 
@@ -122,6 +131,7 @@ def scatter(
     pixel_spread="dynspread",
     width=800,
     height=400,
+    box_select_tile_bins=0,
     **library_specific_params,
 ):
     """
@@ -172,6 +182,13 @@ def scatter(
 
     height: int,  default 400
 
+    box_select_tile_bins: int, default 0
+        Number of bins per axis of the datatiles computed for box
+        selections. If 0, box selections query the data exactly. Else box
+        selections are answered from datatiles, with their edges rounded to
+        a grid of box_select_tile_bins points over the range of the data,
+        trading accuracy for speed.
+
     title: str,
 
         chart title
@@ -201,6 +218,7 @@ def scatter(
         pixel_spread,
         width,
         height,
+        box_select_tile_bins,
         **library_specific_params,
     )
 
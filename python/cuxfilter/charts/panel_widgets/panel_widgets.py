@@ -39,6 +39,10 @@ def range_slider(
 
     step_size_type: {int, float},  default int
 
+    tile_resolution: int,  default None
+        number of bins of the datatiles computed when this widget is the
+        active view, decoupling the slider precision from step_size
+
     **params:
         additional arguments to be passed to the function. See panel
         documentation for more info
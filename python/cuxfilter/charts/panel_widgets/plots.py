@@ -1,6 +1,5 @@
 from ..core import BaseWidget
 from ..core.aggregate import BaseDataSizeIndicator
-from ...assets.numba_kernels import aggregated_column_unique
 
 import panel as pn
 
@@ -26,8 +25,8 @@ class RangeSlider(BaseWidget):
         """
         initiate chart on dashboard creation
         """
-        self.min_value = dashboard_cls._data[self.x].min()
-        self.max_value = dashboard_cls._data[self.x].max()
+        self.min_value = dashboard_cls._data_stats.min(self.x)
+        self.max_value = dashboard_cls._data_stats.max(self.x)
         self.generate_widget()
         self.add_events(dashboard_cls)
 
@@ -49,7 +48,7 @@ class RangeSlider(BaseWidget):
                 start=self.min_value,
                 end=self.max_value,
                 value=(self.min_value, self.max_value),
-                step=self.stride,
+                step=self.tile_stride,
                 **self.params,
             )
 
@@ -69,12 +68,18 @@ class RangeSlider(BaseWidget):
         add events
         """
 
-        def widget_callback(event):
+        def query_range(query_tuple):
             if dashboard_cls._active_view != self.name:
                 dashboard_cls._reset_current_view(new_active_view=self)
                 dashboard_cls._calc_data_tiles()
 
-            dashboard_cls._query_datatiles_by_range(event.new)
+            dashboard_cls._query_datatiles_by_range(query_tuple)
+
+        def widget_callback(event):
+            # coalesce slider drags, only the latest range is queried
+            dashboard_cls._scheduler.schedule(
+                self.name, query_range, event.new
+            )
 
         # add callback to filter_Widget on value change
         self.chart.param.watch(widget_callback, ["value"], onlychanged=False)
@@ -96,6 +101,12 @@ class RangeSlider(BaseWidget):
                 str(min_temp) + "<=" + str(self.x) + "<=" + str(max_temp)
             )
 
+    def get_query_range(self):
+        """
+        (min, max) currently selected by the range slider
+        """
+        return tuple(self.chart.value)
+
 
 class IntSlider(BaseWidget):
     chart_type: str = "widget_int_slider"
@@ -119,8 +130,8 @@ class IntSlider(BaseWidget):
         """
         initiate chart on dashboard creation
         """
-        self.min_value = int(dashboard_cls._data[self.x].min())
-        self.max_value = int(dashboard_cls._data[self.x].max())
+        self.min_value = int(dashboard_cls._data_stats.min(self.x))
+        self.max_value = int(dashboard_cls._data_stats.max(self.x))
         self.generate_widget()
         self.add_events(dashboard_cls)
 
@@ -156,13 +167,27 @@ class IntSlider(BaseWidget):
         """
         add events
         """
+        # value the charts were last queried with, "" for none
+        self._queried_value = ""
 
-        def widget_callback(event):
+        def query_value(value):
             if dashboard_cls._active_view != self.name:
                 dashboard_cls._reset_current_view(new_active_view=self)
                 dashboard_cls._calc_data_tiles(cumsum=False)
+                # the charts were reloaded without the value of the slider
+                self._queried_value = ""
 
-            dashboard_cls._query_datatiles_by_indices([event.old], [event.new])
+            dashboard_cls._query_datatiles_by_indices(
+                [self._queried_value], [value]
+            )
+            self._queried_value = value
+
+        def widget_callback(event):
+            # coalesce slider drags, the latest value is queried from the
+            # value queried last
+            dashboard_cls._scheduler.schedule(
+                self.name, query_value, event.new
+            )
 
         # add callback to filter_Widget on value change
         self.chart.param.watch(widget_callback, ["value"], onlychanged=False)
@@ -203,8 +228,8 @@ class FloatSlider(BaseWidget):
         """
         initiate chart on dashboard creation
         """
-        self.min_value = dashboard_cls._data[self.x].min()
-        self.max_value = dashboard_cls._data[self.x].max()
+        self.min_value = dashboard_cls._data_stats.min(self.x)
+        self.max_value = dashboard_cls._data_stats.max(self.x)
         self.generate_widget()
         self.add_events(dashboard_cls)
 
@@ -251,13 +276,27 @@ class FloatSlider(BaseWidget):
         """
         add events
         """
+        # value the charts were last queried with, "" for none
+        self._queried_value = ""
 
-        def widget_callback(event):
+        def query_value(value):
             if dashboard_cls._active_view != self.name:
                 dashboard_cls._reset_current_view(new_active_view=self)
                 dashboard_cls._calc_data_tiles(cumsum=False)
+                # the charts were reloaded without the value of the slider
+                self._queried_value = ""
 
-            dashboard_cls._query_datatiles_by_indices([event.old], [event.new])
+            dashboard_cls._query_datatiles_by_indices(
+                [self._queried_value], [value]
+            )
+            self._queried_value = value
+
+        def widget_callback(event):
+            # coalesce slider drags, the latest value is queried from the
+            # value queried last
+            dashboard_cls._scheduler.schedule(
+                self.name, query_value, event.new
+            )
 
         # add callback to filter_Widget on value change
         self.chart.param.watch(widget_callback, ["value"], onlychanged=False)
@@ -284,8 +323,8 @@ class DropDown(BaseWidget):
         """
         initiate chart on dashboard creation
         """
-        self.min_value = dashboard_cls._data[self.x].min()
-        self.max_value = dashboard_cls._data[self.x].max()
+        self.min_value = dashboard_cls._data_stats.min(self.x)
+        self.max_value = dashboard_cls._data_stats.max(self.x)
 
         if self.stride is None:
             if self.max_value < 1 and self.stride_type == int:
@@ -294,18 +333,22 @@ class DropDown(BaseWidget):
                 (self.max_value - self.min_value) / self.data_points
             )
 
-        self.calc_list_of_values(dashboard_cls._data)
+        self.calc_list_of_values(dashboard_cls._data_stats)
         self.generate_widget()
         self.add_events(dashboard_cls)
 
-    def calc_list_of_values(self, data):
+    def calc_list_of_values(self, data_stats):
         """
-        calculate unique list of values to be included in the drop down menu
+        calculate unique list of values to be included in the drop down
+        menu, from the cached category index of the column
         """
         if self.label_map is None:
-            self.list_of_values = data[self.x].unique().to_pandas().tolist()
+            categories = data_stats.categories(self.x)
+            self.list_of_values = categories["values"].tolist()
             if len(self.list_of_values) > self.data_points:
-                self.list_of_values = aggregated_column_unique(self, data)
+                self.list_of_values = data_stats.binned_categories(
+                    self.x, self.min_value, self.stride
+                ).tolist()
 
             if len(self.list_of_values) > 500:
                 print(
@@ -355,11 +398,17 @@ class DropDown(BaseWidget):
         add events
         """
 
-        def widget_callback(event):
+        def query_value(value):
             if dashboard_cls._active_view != self.name:
                 dashboard_cls._reset_current_view(new_active_view=self)
                 dashboard_cls._calc_data_tiles(cumsum=False)
-            dashboard_cls._query_datatiles_by_indices([], [event.new])
+            dashboard_cls._query_datatiles_by_indices([], [value])
+
+        def widget_callback(event):
+            # coalesce selections, only the latest value is queried
+            dashboard_cls._scheduler.schedule(
+                self.name, query_value, event.new
+            )
 
         # add callback to filter_Widget on value change
         self.chart.param.watch(widget_callback, ["value"], onlychanged=False)
@@ -389,28 +438,28 @@ class MultiSelect(BaseWidget):
         """
         initiate chart on dashboard creation
         """
-        self.min_value = dashboard_cls._data[self.x].min()
-        self.max_value = dashboard_cls._data[self.x].max()
+        self.min_value = dashboard_cls._data_stats.min(self.x)
+        self.max_value = dashboard_cls._data_stats.max(self.x)
 
         if self.stride is None:
             if self.max_value < 1 and self.stride_type == int:
                 self.stride_type = float
             self.stride = self.stride_type(1)
 
-        self.calc_list_of_values(dashboard_cls._data)
+        self.calc_list_of_values(dashboard_cls._data_stats)
 
         self.generate_widget()
 
         self.add_events(dashboard_cls)
 
-    def calc_list_of_values(self, data):
+    def calc_list_of_values(self, data_stats):
         """
-        calculate unique list of values to be included in the multiselect menu
+        calculate unique list of values to be included in the multiselect
+        menu, from the cached category index of the column
         """
         if self.label_map is None:
-            self.list_of_values = data[self.x].unique().to_pandas().tolist()
-            # if len(self.list_of_values) > self.data_points:
-            #     self.list_of_values = aggregated_column_unique(self, data)
+            categories = data_stats.categories(self.x)
+            self.list_of_values = categories["values"].tolist()
 
             if len(self.list_of_values) > 500:
                 print(
@@ -462,12 +511,26 @@ class MultiSelect(BaseWidget):
         """
         add events
         """
+        # values the charts were last queried with
+        self._queried_value = []
 
-        def widget_callback(event):
+        def query_value(value):
             if dashboard_cls._active_view != self.name:
                 dashboard_cls._reset_current_view(new_active_view=self)
                 dashboard_cls._calc_data_tiles(cumsum=False)
-            dashboard_cls._query_datatiles_by_indices(event.old, event.new)
+                # the charts were reloaded without the selected values
+                self._queried_value = []
+            dashboard_cls._query_datatiles_by_indices(
+                self._queried_value, value
+            )
+            self._queried_value = value
+
+        def widget_callback(event):
+            # coalesce selections, the latest values are queried from the
+            # values queried last
+            dashboard_cls._scheduler.schedule(
+                self.name, query_value, event.new
+            )
 
         # add callback to filter_Widget on value change
         self.chart.param.watch(widget_callback, ["value"], onlychanged=False)
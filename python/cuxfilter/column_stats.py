@@ -0,0 +1,154 @@
+import numpy as np
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+from .assets.numba_kernels import calc_min_max_columns
+
+
+class ColumnStats:
+    """
+    Cache of per-column statistics of a cudf DataFrame, shared by every
+    chart and widget built on it.
+
+    Columns are added lazily on first request. The min and max of the
+    numeric columns requested together are computed exactly in their own
+    dtype, without copying them, count and null_count are read from the column metadata, and
+    distinct counts are only computed when asked for.
+
+    The category index of a column, its sorted unique values with the
+    frequency of each value, is built on first request with one
+    value_counts pass and reused by every dropdown and multiselect widget.
+    It is a cache of the unfiltered data, the counts are not maintained
+    incrementally as filters change.
+
+    label_maps holds the code -> label mapping of the dictionary encoded
+    columns of the DataFrame, used to label charts and widgets over them.
+    """
+
+    _data = None
+    _stats: dict = None
+    _categories: dict = None
+    label_maps: dict = None
+
+    def __init__(self, data, label_maps=None):
+        """
+        Parameters
+        ----------
+        data: cudf.DataFrame
+        label_maps: dict of column name -> {code: label} of the dictionary
+            encoded columns of data
+        """
+        self._data = data
+        self._stats = {}
+        self._categories = {}
+        self.label_maps = {} if label_maps is None else label_maps
+
+    def __contains__(self, column):
+        return column in self._stats
+
+    def __getitem__(self, column):
+        """
+        dict of the statistics computed for column
+        """
+        self.compute([column])
+        return self._stats[column]
+
+    def compute(self, columns, distinct=False):
+        """
+        compute the statistics of every column in columns missing from the
+        cache, in one pass
+
+        Parameters
+        ----------
+        columns: list of column names, unknown columns are ignored
+        distinct: whether to compute the distinct counts as well
+        """
+        columns = [
+            col for col in dict.fromkeys(columns) if col in self._data.columns
+        ]
+        missing = [col for col in columns if col not in self._stats]
+        numeric = [
+            col
+            for col in missing
+            if is_numeric_dtype(self._data[col].dtype)
+            and not is_bool_dtype(self._data[col].dtype)
+        ]
+
+        if len(numeric) > 0:
+            min_max = calc_min_max_columns(self._data, numeric)
+            for col, (col_min, col_max) in zip(numeric, min_max):
+                self._stats[col] = {
+                    "min": self._cast(col_min, self._data[col].dtype),
+                    "max": self._cast(col_max, self._data[col].dtype),
+                }
+
+        for col in missing:
+            if col not in self._stats:
+                self._stats[col] = {
+                    "min": self._data[col].min(),
+                    "max": self._data[col].max(),
+                }
+            null_count = self._data[col].null_count
+            self._stats[col]["count"] = len(self._data[col]) - null_count
+            self._stats[col]["null_count"] = null_count
+
+        if distinct:
+            for col in columns:
+                if "distinct_count" not in self._stats[col]:
+                    self._stats[col]["distinct_count"] = self._data[
+                        col
+                    ].nunique()
+
+    def _cast(self, value, dtype):
+        """
+        cast a statistic to a python int for integer columns and a python
+        float otherwise. Statistics are not kept in the dtype of
+        their column, arithmetic on the min and max of a narrow integer
+        column would wrap around
+        """
+        if np.isnan(value):
+            return value
+        if np.dtype(dtype).kind in "iu":
+            return int(value)
+        return float(value)
+
+    def min(self, column):
+        return self[column]["min"]
+
+    def max(self, column):
+        return self[column]["max"]
+
+    def count(self, column):
+        return self[column]["count"]
+
+    def null_count(self, column):
+        return self[column]["null_count"]
+
+    def distinct_count(self, column):
+        self.compute([column], distinct=True)
+        return self._stats[column]["distinct_count"]
+
+    def categories(self, column):
+        """
+        category index of column, a dict with the sorted unique non-null
+        values and the count of each value, as host ndarrays
+        """
+        if column not in self._categories:
+            value_counts = (
+                self._data[column].value_counts().sort_index().to_pandas()
+            )
+            self._categories[column] = {
+                "values": value_counts.index.values,
+                "counts": value_counts.values,
+            }
+            self.compute([column])
+            self._stats[column]["distinct_count"] = len(value_counts)
+        return self._categories[column]
+
+    def binned_categories(self, column, min_value, stride):
+        """
+        unique bin values of column binned at stride from min_value,
+        derived on the host from the category index of column
+        """
+        values = self.categories(column)["values"].astype(np.float64)
+        codes = np.unique(np.round((values - min_value) / stride))
+        return min_value + codes * stride
@@ -0,0 +1,165 @@
+import io
+import multiprocessing
+import threading
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from .datatile import DataTile
+from .multiprocess import SharedDataFrame
+
+CHART_ATTRIBUTES = (
+    "name",
+    "chart_type",
+    "x",
+    "y",
+    "aggregate_fn",
+    "min_value",
+    "max_value",
+    "stride",
+    "tile_stride",
+    "bin_edges",
+    "sketch_bins",
+    "box_select_tile_bins",
+    "tile_x_range",
+    "tile_y_range",
+    "color_column",
+    "color_aggregate_fn",
+    "elevation_column",
+    "elevation_aggregate_fn",
+)
+
+
+class ChartSpec:
+    """
+    Picklable snapshot of the chart attributes read by the datatile
+    kernels, sent to the compute worker in place of the chart, whose bokeh
+    models can not leave the UI process.
+    """
+
+    def __init__(self, chart):
+        for attr in CHART_ATTRIBUTES:
+            setattr(self, attr, getattr(chart, attr, None))
+
+
+def to_arrow(result):
+    """
+    Arrow IPC stream of every pandas DataFrame in a datatile, the other
+    values of the datatile are left to pickle
+    """
+    if isinstance(result, pd.DataFrame):
+        batch = pa.RecordBatch.from_pandas(result, preserve_index=True)
+        sink = io.BytesIO()
+        writer = pa.RecordBatchStreamWriter(sink, batch.schema)
+        writer.write_batch(batch)
+        writer.close()
+        return sink.getvalue()
+    if isinstance(result, list):
+        return [to_arrow(value) for value in result]
+    if isinstance(result, dict):
+        return {key: to_arrow(value) for key, value in result.items()}
+    return result
+
+
+def from_arrow(result):
+    """
+    datatile serialized by to_arrow
+    """
+    if isinstance(result, bytes):
+        frame = pa.RecordBatchStreamReader(result).read_pandas()
+        # arrow stores the integer bin columns of the datatile as strings
+        frame.columns = frame.columns.astype(np.int64)
+        return frame
+    if isinstance(result, list):
+        return [from_arrow(value) for value in result]
+    if isinstance(result, dict):
+        return {key: from_arrow(value) for key, value in result.items()}
+    return result
+
+
+def _run_worker(conn, shared):
+    """
+    compute the datatiles requested on conn until it is closed, in the
+    worker process
+    """
+    data = shared.read().data
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        active_chart, passive_chart, query_str, cumsum, dimensions = request
+        try:
+            filtered = data.query(query_str) if len(query_str) > 0 else data
+            data_tile = DataTile(
+                active_chart,
+                passive_chart,
+                dtype="pandas",
+                dimensions=dimensions,
+                cumsum=cumsum,
+            ).calc_data_tile(filtered)
+            conn.send((True, to_arrow(data_tile)))
+        except Exception as e:
+            conn.send((False, e))
+
+
+class ComputeWorker:
+    """
+    Process computing the datatiles of the dashboards of a DataFrame.
+
+    Datatile computations are the heaviest work of an interaction, and run
+    in the UI process they compete for the GIL with the bokeh server, which
+    then stalls websocket traffic until they complete. The worker holds its
+    own copy of the data, mapped from a SharedDataFrame, and receives the
+    query and the ChartSpec of the active and passive chart of each
+    datatile over a pipe. It returns the datatile with its pandas frames as
+    Arrow streams, while the waiting UI thread releases the GIL.
+
+    Requests are served one at a time, in the order they are sent.
+    """
+
+    def __init__(self, dataframe):
+        """
+        Parameters
+        ----------
+        dataframe: cuxfilter.DataFrame
+        """
+        self._shared = SharedDataFrame.create(dataframe)
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(
+            target=_run_worker, args=(child_conn, self._shared), daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+        self._lock = threading.Lock()
+
+    def calc_data_tile(
+        self, active_chart, passive_chart, query_str, cumsum, dimensions
+    ):
+        """
+        datatile of passive_chart over active_chart, computed by the worker
+        on the data filtered by query_str
+        """
+        request = (
+            ChartSpec(active_chart),
+            ChartSpec(passive_chart),
+            query_str,
+            cumsum,
+            dimensions,
+        )
+        with self._lock:
+            self._conn.send(request)
+            ok, result = self._conn.recv()
+        if not ok:
+            raise result
+        return from_arrow(result)
+
+    def stop(self):
+        """
+        stop the worker process and remove its shared data
+        """
+        self._conn.close()
+        self._process.join()
+        self._shared.unlink()
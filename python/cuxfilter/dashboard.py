@@ -1,3 +1,4 @@
+import copy
 from typing import Dict, Type
 import bokeh.embed.util as u
 import panel as pn
@@ -8,9 +9,18 @@ import re
 
 from .charts.core.core_chart import BaseChart
 from .datatile import DataTile
+from .datacube import DataCube
+from .tile_cache import TileCache
+from .column_stats import ColumnStats
 from .layouts import single_feature
 from .charts.panel_widgets import data_size_indicator
 from .assets import screengrab, get_open_port
+from .assets.scheduler import CallbackScheduler, defer, hold_document
+from .assets.numba_kernels import (
+    calc_fused_aggregates,
+    is_fused_aggregate,
+    warmup,
+)
 from .themes import light
 
 _server_info = (
@@ -86,7 +96,13 @@ class DashBoard:
     """
 
     _charts: Dict[str, Type[BaseChart]]
+    _chart_snapshots: Dict[str, Type[BaseChart]]
     _data_tiles: Dict[str, Type[DataTile]]
+    _data_cube: Type[DataCube] = None
+    _data_cube_memory_budget: int = 0
+    _data_stats: Type[ColumnStats] = None
+    _tile_cache: Type[TileCache] = None
+    _compute_worker = None
     _query_str_dict: Dict[str, str]
     _active_view: str = ""
     _dashboard = None
@@ -101,12 +117,27 @@ class DashBoard:
         title="Dashboard",
         data_size_widget=True,
         warnings=False,
+        data_cube_memory_budget=0,
+        data_stats=None,
+        tile_cache=None,
+        compute_worker=None,
     ):
         self._backup_data = data
+        self._data_cube = None
+        self._data_cube_memory_budget = data_cube_memory_budget
+        if data_stats is None:
+            data_stats = ColumnStats(data)
+        self._data_stats = data_stats
+        if tile_cache is None:
+            tile_cache = TileCache()
+        self._tile_cache = tile_cache
+        self._compute_worker = compute_worker
         self._data = self._backup_data
         self._charts = dict()
+        self._chart_snapshots = dict()
         self._data_tiles = dict()
         self._query_str_dict = dict()
+        self._scheduler = CallbackScheduler()
         self._data_size_widget = data_size_widget
         if self._data_size_widget:
             temp_chart = data_size_indicator()
@@ -114,8 +145,10 @@ class DashBoard:
             self._charts[temp_chart.name].initiate_chart(self)
 
         if len(charts) > 0:
+            self._compute_data_stats(charts)
             for chart in charts:
                 self._charts[chart.name] = chart
+                self._chart_snapshots[chart.name] = copy.deepcopy(chart)
                 chart.initiate_chart(self)
 
         self._title = title
@@ -211,16 +244,47 @@ class DashBoard:
 
         """
         self._data_tiles = {}
+        self._data_cube = None
+        self._tile_cache.clear()
         if len(self._active_view) > 0:
             self._charts[self._active_view].datatile_loaded_state = False
             self._active_view = ""
 
         if len(charts) > 0:
+            self._compute_data_stats(charts)
             for chart in charts:
                 if chart not in self._charts:
                     self._charts[chart.name] = chart
+                    self._chart_snapshots[chart.name] = copy.deepcopy(chart)
                     chart.initiate_chart(self)
 
+    def _compute_data_stats(self, charts):
+        """
+        Compute the statistics of every column used by charts in one pass,
+        before the charts are initiated, and label the charts over
+        dictionary encoded columns with their categories.
+        """
+        columns = []
+        for chart in charts:
+            for col in (chart.x, getattr(chart, "y", None)):
+                if isinstance(col, str):
+                    columns.append(col)
+                elif isinstance(col, list):
+                    columns.extend(col)
+        self._data_stats.compute(columns)
+
+        for chart in charts:
+            if not isinstance(chart.x, str):
+                continue
+            label_map = self._data_stats.label_maps.get(chart.x)
+            if label_map is None:
+                continue
+            if "widget" in chart.chart_type:
+                if chart.label_map is None:
+                    chart.label_map = {v: k for k, v in label_map.items()}
+            elif not chart.x_label_map:
+                chart.x_label_map = dict(label_map)
+
     def _query(self, query_str, inplace=False):
         """
         Query the cudf.DataFrame, inplace or create a copy based on the
@@ -345,12 +409,13 @@ class DashBoard:
         loop=None,
         show=False,
         start=False,
+        multi_session=False,
         **kwargs,
     ):
+        # compile the kernels before the server accepts sessions
+        warmup()
         return get_server(
-            self._dashboard.generate_dashboard(
-                self._title, self._charts, self._theme
-            ),
+            self._get_panel_obj(multi_session),
             port,
             websocket_origin,
             loop,
@@ -359,6 +424,60 @@ class DashBoard:
             **kwargs,
         )
 
+    def _get_panel_obj(self, multi_session=False):
+        """
+        Dashboard layout to serve, or with multi_session a function called
+        by the bokeh server to lay out a session dashboard per session.
+        """
+        if multi_session:
+            return self._session_view
+        return self._dashboard.generate_dashboard(
+            self._title, self._charts, self._theme
+        )
+
+    def _session_view(self):
+        """
+        Layout of a new session dashboard.
+        """
+        session = self._session_copy()
+        return session._dashboard.generate_dashboard(
+            session._title, session._charts, session._theme
+        )
+
+    def _session_copy(self):
+        """
+        Dashboard of a single bokeh session.
+
+        The session dashboard initiates its own copies of the charts, taken
+        from snapshots of the charts before they were initiated by self, so
+        that no source, widget or other state is shared between sessions.
+        Its filter state (self._data, self._query_str_dict,
+        self._active_view, datatiles and scheduler) is its own too, while
+        the backing DataFrame, the column statistics, the data cube and the
+        tile cache of self are shared read-only, so that every session
+        costs one copy of the charts and of its filtered data, not of the
+        DataFrame.
+        """
+        charts = [
+            copy.deepcopy(chart) for chart in self._chart_snapshots.values()
+        ]
+        session = DashBoard(
+            charts=charts,
+            data=self._backup_data,
+            layout=type(self._dashboard),
+            theme=self._theme,
+            title=self._title,
+            data_size_widget=self._data_size_widget,
+            warnings=True,
+            data_cube_memory_budget=self._data_cube_memory_budget,
+            data_stats=self._data_stats,
+            tile_cache=self._tile_cache,
+            compute_worker=self._compute_worker,
+        )
+        session._data_cube = self._get_data_cube()
+        session._scheduler.max_fps = self._scheduler.max_fps
+        return session
+
     async def preview(self):
         """
         Preview(Async) all the charts in a jupyter cell, non interactive(no
@@ -403,7 +522,9 @@ class DashBoard:
 
         display(Image("temp.png"))
 
-    def app(self, notebook_url="", port: int = 0):
+    def app(
+        self, notebook_url="", port: int = 0, max_fps=None, multi_session=False
+    ):
         """
         Run the dashboard with a bokeh backend server within the notebook.
         Parameters
@@ -417,6 +538,17 @@ class DashBoard:
             Default is random open port. Recommended to set this value if
             running jupyter remotely and only few ports are exposed.
 
+        max_fps: float, optional
+            Maximum number of chart updates sent to the browser per second.
+            Interactions arriving faster are coalesced. Default is
+            unlimited.
+
+        multi_session: bool, optional
+            Serve every browser session its own dashboard, with its own
+            charts and filter state over the data, statistics and tile
+            cache of this dashboard, shared read-only. Default is False,
+            all sessions share this dashboard.
+
         Examples
         --------
 
@@ -437,24 +569,29 @@ class DashBoard:
         >>> d.app(notebook_url='localhost:8888')
 
         """
+        self._scheduler.max_fps = max_fps
         url = re.compile(r"https?://(www\.)?")
         notebook_url = url.sub("", notebook_url).strip().strip("/")
+        # compile the kernels before the server accepts sessions
+        warmup()
         if len(notebook_url) > 0:
             self.server = app(
-                self._dashboard.generate_dashboard(
-                    self._title, self._charts, self._theme
-                ),
+                self._get_panel_obj(multi_session),
                 notebook_url=notebook_url,
                 port=port,
             )
         else:
-            self.server = app(
-                self._dashboard.generate_dashboard(
-                    self._title, self._charts, self._theme
-                )
-            )
+            self.server = app(self._get_panel_obj(multi_session))
 
-    def show(self, notebook_url="", port=0, threaded=False, **kwargs):
+    def show(
+        self,
+        notebook_url="",
+        port=0,
+        threaded=False,
+        max_fps=None,
+        multi_session=False,
+        **kwargs,
+    ):
         """
         Run the dashboard with a bokeh backend server within the notebook.
         Parameters
@@ -465,6 +602,17 @@ class DashBoard:
             - Can use localhost instead of ip if running locally.
             - Has to be an open port.
 
+        max_fps: float, optional
+            Maximum number of chart updates sent to the browser per second.
+            Interactions arriving faster are coalesced. Default is
+            unlimited.
+
+        multi_session: bool, optional
+            Serve every browser session its own dashboard, with its own
+            charts and filter state over the data, statistics and tile
+            cache of this dashboard, shared read-only. Default is False,
+            all sessions share this dashboard.
+
         Examples
         --------
 
@@ -485,6 +633,7 @@ class DashBoard:
         >>> d.show(url='localhost:8889')
 
         """
+        self._scheduler.max_fps = max_fps
         url = re.compile(r"https?://(www\.)?")
         notebook_url = url.sub("", notebook_url).strip().strip("/")
         if len(notebook_url) > 0:
@@ -506,6 +655,7 @@ class DashBoard:
                     show=False,
                     start=True,
                     threaded=threaded,
+                    multi_session=multi_session,
                     **kwargs,
                 )
             except OSError:
@@ -516,8 +666,18 @@ class DashBoard:
                     show=False,
                     start=True,
                     threaded=threaded,
+                    multi_session=multi_session,
                     **kwargs,
                 )
+        elif multi_session:
+            self.server = self._get_server(
+                port=port,
+                show=True,
+                start=True,
+                threaded=threaded,
+                multi_session=True,
+                **kwargs,
+            )
         else:
             self.server = self._dashboard.generate_dashboard(
                 self._title, self._charts, self._theme
@@ -533,26 +693,116 @@ class DashBoard:
 
     def _reload_charts(self, data=None, include_cols=[], ignore_cols=[]):
         """
-        Reload charts with current self._data state.
+        Reload charts with current self._data state, answering from the
+        data cube where possible.
+        """
+        with hold_document():
+            self._scheduler.flush()
+            query_ranges = None
+            if data is None:
+                data = self._data
+                query_ranges = self._get_data_cube_query_ranges()
+            if len(include_cols) == 0:
+                include_cols = list(self._charts.keys())
+            # reloading charts as per current data state
+            fused_charts = []
+            for chart in self._charts.values():
+                if (
+                    chart.name not in ignore_cols
+                    and chart.name in include_cols
+                ):
+                    cube_result = None
+                    if query_ranges is not None:
+                        cube_result = self._data_cube.query(
+                            chart, query_ranges
+                        )
+                    if cube_result is not None:
+                        defer(
+                            chart.reset_chart,
+                            cube_result,
+                            merge_key=("reload", chart.name),
+                        )
+                    elif is_fused_aggregate(chart):
+                        fused_charts.append(chart)
+                    else:
+                        # compute the source here, off the event loop where
+                        # possible, and only defer patching it
+                        source = chart.compute_source(data)
+                        if source is not None:
+                            defer(
+                                chart.format_source_data,
+                                source,
+                                True,
+                                merge_key=("reload", chart.name),
+                            )
+                        else:
+                            defer(
+                                chart.reload_chart,
+                                data,
+                                True,
+                                merge_key=("reload", chart.name),
+                            )
+
+            # histograms and means of the remaining charts in a single scan
+            if len(fused_charts) > 0:
+                fused_results = calc_fused_aggregates(fused_charts, data)
+                for chart, result in zip(fused_charts, fused_results):
+                    defer(
+                        chart.reset_chart,
+                        result,
+                        merge_key=("reload", chart.name),
+                    )
+
+    def _get_data_cube(self):
+        """
+        Data cube over the range charts of the dashboard, calculated on
+        first use, None if the data cube is disabled.
         """
-        if data is None:
-            data = self._data
-        if len(include_cols) == 0:
-            include_cols = list(self._charts.keys())
-        # reloading charts as per current data state
-        for chart in self._charts.values():
-            if chart.name not in ignore_cols and chart.name in include_cols:
-                self._charts[chart.name].reload_chart(data, True)
+        if self._data_cube_memory_budget <= 0:
+            return None
+        if self._data_cube is None:
+            self._data_cube = DataCube(
+                self._charts.values(), self._data_cube_memory_budget
+            )
+            self._data_cube.calc_data_cube(self._backup_data)
+        return self._data_cube
+
+    def _get_data_cube_query_ranges(self):
+        """
+        Range filters of the current self._data state keyed by chart name,
+        None if the data cube is disabled or any of the filters is not a
+        dimension of the cube.
+        """
+        if self._get_data_cube() is None:
+            return None
+
+        query_ranges = {}
+        for name in self._query_str_dict:
+            # the active view's own selection is not part of self._data
+            if name == self._active_view:
+                continue
+            if name not in self._data_cube.dimensions:
+                return None
+            query_ranges[name] = self._charts[name].get_query_range()
+        return query_ranges
 
     def _calc_data_tiles(self, cumsum=True):
         """
         Calculate data tiles for all aggregate type charts.
         """
+        self._scheduler.flush()
         query_str = self._generate_query_str(self._charts[self._active_view])
 
-        # NO DATATILES for scatter types, as they are essentially all
-        # points in the dataset
+        # NO 2d DATATILES for scatter types, as they are essentially all
+        # points in the dataset, box selections use 3d summed-area tiles
         if "scatter" not in self._active_view:
+            dimensions = 2
+        elif self._charts[self._active_view].box_select_tile_bins > 0:
+            dimensions = 3
+        else:
+            dimensions = 0
+
+        if dimensions > 0:
             for chart in list(self._charts.values()):
                 if not chart.use_data_tiles:
                     # if chart.chart_type == 'view_dataframe':
@@ -560,35 +810,62 @@ class DashBoard:
                     # else:
                     self._data_tiles[chart.name] = None
                 elif self._active_view != chart.name:
-                    temp_query_str = self._generate_query_str(
-                        ignore_chart=chart
+                    self._data_tiles[chart.name] = self._calc_data_tile(
+                        chart, query_str, cumsum, dimensions
                     )
 
-                    if temp_query_str == query_str:
-                        self._data_tiles[chart.name] = DataTile(
-                            self._charts[self._active_view],
-                            chart,
-                            dtype="pandas",
-                            cumsum=cumsum,
-                        ).calc_data_tile(self._data)
-                    elif len(temp_query_str) == 0:
-                        self._data_tiles[chart.name] = DataTile(
-                            self._charts[self._active_view],
-                            chart,
-                            dtype="pandas",
-                            cumsum=cumsum,
-                        ).calc_data_tile(self._backup_data)
-                    else:
-                        self._data_tiles[chart.name] = DataTile(
-                            self._charts[self._active_view],
-                            chart,
-                            dtype="pandas",
-                            cumsum=cumsum,
-                        ).calc_data_tile(
-                            self._query(temp_query_str, inplace=False)
-                        )
+        active_chart = self._charts[self._active_view]
+        defer(setattr, active_chart, "datatile_loaded_state", True)
 
-        self._charts[self._active_view].datatile_loaded_state = True
+    def _calc_data_tile(self, chart, query_str, cumsum, dimensions):
+        """
+        Calculate the data tile of the active view for chart, using the
+        data filtered by every chart except the active view and chart.
+        Tiles are cached in the tile cache shared by the session
+        dashboards.
+        """
+        temp_query_str = self._generate_query_str(ignore_chart=chart)
+        key = (self._active_view, chart.name, temp_query_str)
+        return self._tile_cache.get(
+            key + (cumsum, dimensions),
+            lambda: self._compute_data_tile(
+                chart, query_str, temp_query_str, cumsum, dimensions
+            ),
+        )
+
+    def _compute_data_tile(
+        self, chart, query_str, temp_query_str, cumsum, dimensions
+    ):
+        """
+        Compute the data tile of the active view for chart, over the data
+        filtered by temp_query_str, in the compute worker process if the
+        dashboard has one.
+        """
+        if self._compute_worker is not None:
+            return self._compute_worker.calc_data_tile(
+                self._charts[self._active_view],
+                chart,
+                temp_query_str,
+                cumsum,
+                dimensions,
+            )
+
+        data_tile = DataTile(
+            self._charts[self._active_view],
+            chart,
+            dtype="pandas",
+            dimensions=dimensions,
+            cumsum=cumsum,
+        )
+
+        if temp_query_str == query_str:
+            return data_tile.calc_data_tile(self._data)
+        elif len(temp_query_str) == 0:
+            return data_tile.calc_data_tile(self._backup_data)
+        else:
+            return data_tile.calc_data_tile(
+                self._query(temp_query_str, inplace=False)
+            )
 
     def _query_datatiles_by_range(self, query_tuple):
         """
@@ -600,38 +877,75 @@ class DashBoard:
             (min_val, max_val) of the query
 
         """
-        for chart in self._charts.values():
-            if (
-                self._active_view != chart.name
-                and "widget" not in chart.chart_type
-            ):
-                chart.query_chart_by_range(
-                    self._charts[self._active_view],
-                    query_tuple,
-                    self._data_tiles[chart.name],
-                )
+        with hold_document():
+            for chart in self._charts.values():
+                if (
+                    self._active_view != chart.name
+                    and "widget" not in chart.chart_type
+                ):
+                    defer(
+                        chart.query_chart_by_range,
+                        self._charts[self._active_view],
+                        query_tuple,
+                        self._data_tiles[chart.name],
+                        supersedable=True,
+                        merge_key=("query", chart.name),
+                    )
 
     def _query_datatiles_by_indices(self, old_indices, new_indices):
         """
         Update each chart using the updated values after querying the
         datatiles using new_indices.
         """
-        for chart in self._charts.values():
-            if (
-                self._active_view != chart.name
-                and "widget" not in chart.chart_type
-            ):
-                chart.query_chart_by_indices(
-                    self._charts[self._active_view],
-                    old_indices,
-                    new_indices,
-                    self._data_tiles[chart.name],
-                )
+        with hold_document():
+            self._scheduler.flush()
+            for chart in self._charts.values():
+                if (
+                    self._active_view != chart.name
+                    and "widget" not in chart.chart_type
+                ):
+                    chart.query_chart_by_indices(
+                        self._charts[self._active_view],
+                        old_indices,
+                        new_indices,
+                        self._data_tiles[chart.name],
+                    )
+
+    def _query_datatiles_by_box(self, box, data):
+        """
+        Update each chart after a box selection on the active view, using
+        the summed-area datatiles where available.
+        Parameters
+        ----------
+        box: tuple
+            (xmin, xmax, ymin, ymax) of the box selection
+        data: cudf.DataFrame
+            data filtered by the box selection, used to reload the charts
+            without datatiles
+        """
+        with hold_document():
+            self._scheduler.flush()
+            for chart in self._charts.values():
+                if (
+                    self._active_view == chart.name
+                    or "widget" in chart.chart_type
+                ):
+                    continue
+                if self._data_tiles.get(chart.name) is not None:
+                    chart.query_chart_by_box(
+                        self._charts[self._active_view],
+                        box,
+                        self._data_tiles[chart.name],
+                    )
+                else:
+                    chart.reload_chart(data, True)
 
     def _reset_current_view(self, new_active_view: BaseChart):
         """
         Reset current view and assign new view as the active view.
         """
+        # coalesced updates of the other charts run before the switch
+        self._scheduler.flush()
         if len(self._active_view) == 0:
             self._active_view = new_active_view.name
             return -1
@@ -641,7 +955,8 @@ class DashBoard:
         )
 
         # resetting the loaded state
-        self._charts[self._active_view].datatile_loaded_state = False
+        active_chart = self._charts[self._active_view]
+        defer(setattr, active_chart, "datatile_loaded_state", False)
 
         # switching the active view
         self._active_view = new_active_view.name
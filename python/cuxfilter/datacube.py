@@ -0,0 +1,163 @@
+import numpy as np
+
+from .assets.numba_kernels import gpu_datatile
+
+CUBE_CHART_TYPES = ("bar", "line", "widget_range_slider")
+
+
+class DataCube:
+    """
+    N-dimensional cube of frequencies over the binned range dimensions of a
+    dashboard.
+
+    Every linearly binned bar, line and range slider chart contributes
+    one dimension, binned at the chart's tile_stride. When the full
+    resolution cube does not fit the memory budget, the widest dimensions
+    are coarsened by powers of two until it does. Any combination of range
+    filters aligned to the cube cells is then answered by summing a slice of
+    the cube, queries finer than the cube resolution return None so that the
+    caller falls back to scanning.
+    """
+
+    memory_budget: int = 0
+    dimensions: dict = None
+    cube: np.ndarray = None
+
+    def __init__(self, charts, memory_budget):
+        """
+        Parameters
+        ----------
+        charts: iterable of cuxfilter charts and widgets
+        memory_budget: maximum size of the cube in bytes
+        """
+        self.memory_budget = memory_budget
+        self.dimensions = {}
+        for chart in charts:
+            if (
+                chart.chart_type in CUBE_CHART_TYPES
+                and chart.bin_edges is None
+                and chart.tile_stride
+                and chart.max_value > chart.min_value
+            ):
+                self.dimensions[chart.name] = {
+                    "column": chart.x,
+                    "min_value": chart.min_value,
+                    "max_value": chart.max_value,
+                    "stride": chart.tile_stride,
+                    "bins": int(
+                        (chart.max_value - chart.min_value) / chart.tile_stride
+                    )
+                    + 1,
+                    "factor": 1,
+                }
+        self._fit_memory_budget()
+
+    @property
+    def shape(self):
+        return tuple(
+            -(-dim["bins"] // dim["factor"])
+            for dim in self.dimensions.values()
+        )
+
+    def _fit_memory_budget(self):
+        """
+        coarsen the widest dimension until the cube fits the memory budget,
+        itemsize of the cube cells is 8 bytes
+        """
+        names = list(self.dimensions)
+        while names and np.prod(self.shape, dtype=np.float64) * 8 > (
+            self.memory_budget
+        ):
+            shape = self.shape
+            widest = int(np.argmax(shape))
+            if shape[widest] == 1:
+                break
+            self.dimensions[names[widest]]["factor"] *= 2
+
+    def calc_data_cube(self, data):
+        """
+        calculate the cube over the unfiltered data
+        """
+        if len(self.dimensions) == 0:
+            self.cube = None
+            return
+        dims = self.dimensions.values()
+        self.cube = gpu_datatile.calc_data_cube(
+            data,
+            [dim["column"] for dim in dims],
+            [(dim["min_value"], dim["max_value"]) for dim in dims],
+            [dim["stride"] for dim in dims],
+            [dim["factor"] for dim in dims],
+        )
+
+    def _get_slice(self, name, query_range):
+        """
+        slice of the cube cells covered by query_range along the dimension
+        name, None if the range is not aligned to the cube cells
+        """
+        dim = self.dimensions[name]
+        if query_range is None:
+            return slice(None)
+        min_index = int(
+            round((query_range[0] - dim["min_value"]) / dim["stride"])
+        )
+        max_index = int(
+            round((query_range[1] - dim["min_value"]) / dim["stride"])
+        )
+        min_index = max(min_index, 0)
+        max_index = min(max_index, dim["bins"] - 1)
+        factor = dim["factor"]
+        if min_index % factor != 0 or (
+            (max_index + 1) % factor != 0 and max_index != dim["bins"] - 1
+        ):
+            return None
+        return slice(min_index // factor, max_index // factor + 1)
+
+    def query(self, chart, query_ranges):
+        """
+        Parameters
+        ----------
+        chart: passive chart to be updated
+        query_ranges: dict of chart name -> (min, max) of every active range
+            filter, None values for unfiltered dimensions
+
+        Returns
+        -------
+        ndarray of frequencies per bin for count histograms, a float for
+        the datasize indicator, or None if the cube cannot answer the query
+        """
+        if self.cube is None:
+            return None
+        if chart.chart_type == "datasize_indicator":
+            axis = None
+        elif (
+            chart.name in self.dimensions
+            and self.dimensions[chart.name]["factor"] == 1
+            and self.dimensions[chart.name]["stride"] == chart.stride
+            and chart.use_data_tiles
+            and chart.aggregate_fn == "count"
+            and chart.y in (None, chart.x)
+        ):
+            axis = list(self.dimensions).index(chart.name)
+        else:
+            return None
+
+        slices = []
+        for name in self.dimensions:
+            cube_slice = self._get_slice(name, query_ranges.get(name))
+            if cube_slice is None:
+                return None
+            slices.append(cube_slice)
+
+        if axis is None:
+            return float(self.cube[tuple(slices)].sum())
+
+        own_slice = slices[axis]
+        slices[axis] = slice(None)
+        other_axes = tuple(i for i in range(len(slices)) if i != axis)
+        result = self.cube[tuple(slices)].sum(axis=other_axes)
+        # bins outside the chart's own filter are empty
+        outside = np.ones(result.shape, dtype=bool)
+        outside[own_slice] = False
+        result[outside] = 0
+        return result
@@ -1,8 +1,11 @@
 import cudf
+import numpy as np
 import pyarrow as pa
+from pandas.api.types import is_integer_dtype
 from typing import Type
 
 from .dashboard import DashBoard
+from .column_stats import ColumnStats
 from .layouts import single_feature
 from .themes import light
 
@@ -14,6 +17,35 @@ def read_arrow(source):
     return pa_df
 
 
+def encode_categorical_columns(data, threshold=None):
+    """
+    dictionary encode the string and categorical columns of data as int32
+    codes, in place
+
+    Parameters
+    ----------
+    data: cudf.DataFrame
+    threshold: int, optional
+        only encode columns with at most threshold distinct values,
+        all string and categorical columns are encoded if None
+
+    Returns
+    -------
+    dict of column name -> {code: label} of the encoded columns
+    """
+    label_maps = {}
+    for col in data.columns:
+        if data[col].dtype != "object" and str(data[col].dtype) != "category":
+            continue
+        if threshold is not None and data[col].nunique() > threshold:
+            continue
+        categorical = data[col].astype("category")
+        labels = categorical.cat.categories.to_pandas().tolist()
+        data[col] = categorical.cat.codes.astype("int32")
+        label_maps[col] = dict(enumerate(labels))
+    return label_maps
+
+
 # class DataFrame:
 class DataFrame:
     """
@@ -21,9 +53,12 @@ class DataFrame:
     """
 
     data: Type[cudf.DataFrame] = None
+    label_maps: dict = None
+    _stats: Type[ColumnStats] = None
+    _compute_worker = None
 
     @classmethod
-    def from_arrow(cls, dataframe_location):
+    def from_arrow(cls, dataframe_location, encode_categories=False):
         """
         read an arrow file from disk as cuxfilter.DataFrame
 
@@ -31,6 +66,12 @@ class DataFrame:
         ----------
         dataframe_location: str or arrow in-memory table
 
+        encode_categories: bool or int, default False
+            dictionary encode the string and categorical columns as int32
+            codes, filters and datatiles over them then work on integers
+            and the labels are only used for display. If an int, only
+            columns with at most that many distinct values are encoded
+
         Returns
         -------
         cuxfilter.DataFrame object
@@ -50,10 +91,10 @@ class DataFrame:
             df = cudf.DataFrame.from_arrow(read_arrow(dataframe_location))
         else:
             df = cudf.DataFrame.from_arrow(dataframe_location)
-        return DataFrame(df)
+        return DataFrame.encoded(df, encode_categories)
 
     @classmethod
-    def from_dataframe(cls, dataframe):
+    def from_dataframe(cls, dataframe, encode_categories=False):
         """
         create a cuxfilter.DataFrame from cudf.DataFrame (zero-copy reference)
 
@@ -61,6 +102,13 @@ class DataFrame:
         ----------
         dataframe_location: cudf.DataFrame
 
+        encode_categories: bool or int, default False
+            dictionary encode the string and categorical columns as int32
+            codes, filters and datatiles over them then work on integers
+            and the labels are only used for display. If an int, only
+            columns with at most that many distinct values are encoded.
+            The encoded columns are replaced in a copy of dataframe
+
         Returns
         -------
         cuxfilter.DataFrame object
@@ -80,13 +128,109 @@ class DataFrame:
         >>> )
         >>> cux_df = cuxfilter.DataFrame.from_dataframe(cudf_df)
 
+        Dictionary encode a string column
+
+        >>> cudf_df['state'] = ['CA', 'NY', 'CA', 'TX', 'NY']
+        >>> cux_df = cuxfilter.DataFrame.from_dataframe(
+        >>>     cudf_df, encode_categories=True
+        >>> )
+        >>> cux_df.label_maps
+        {'state': {0: 'CA', 1: 'NY', 2: 'TX'}}
+
         """
-        return DataFrame(dataframe)
+        return DataFrame.encoded(dataframe, encode_categories)
 
-    def __init__(self, data):
+    @classmethod
+    def encoded(cls, data, encode_categories):
+        """
+        create a cuxfilter.DataFrame from data, dictionary encoding its
+        categorical columns as requested by encode_categories
+        """
+        if encode_categories is False or encode_categories is None:
+            return DataFrame(data)
+        threshold = None if encode_categories is True else encode_categories
+        data = data.copy(deep=False)
+        label_maps = encode_categorical_columns(data, threshold)
+        return DataFrame(data, label_maps)
+
+    def __init__(self, data, label_maps=None):
         # pn.extension()
         self.backup = data
         self.data = data
+        self.label_maps = {} if label_maps is None else label_maps
+
+    @property
+    def stats(self):
+        """
+        Lazily computed min, max, count and null count of the columns of
+        the dataframe, shared by every dashboard created from it.
+
+        Examples
+        --------
+        >>> cux_df.stats.compute(['key', 'val'])
+        >>> cux_df.stats.max('key')
+        4
+        """
+        if self._stats is None:
+            self._stats = ColumnStats(self.data, self.label_maps)
+        return self._stats
+
+    def optimize_dtypes(self):
+        """
+        Downcast every numeric column to the narrowest dtype that holds
+        all of its values exactly, in place. Integer columns are narrowed
+        from their min and max, float64 columns become float32 when no
+        value loses precision. Call before creating dashboards from the
+        dataframe.
+
+        Returns
+        -------
+        dict of column name -> {'from': dtype, 'to': dtype,
+            'bytes_saved': int} of the downcast columns
+
+        Examples
+        --------
+        >>> cux_df = cuxfilter.DataFrame.from_dataframe(
+        >>>     cudf.DataFrame({'key': [0, 1, 2, 3, 4]})
+        >>> )
+        >>> cux_df.optimize_dtypes()
+        {'key': {'from': 'int64', 'to': 'int8', 'bytes_saved': 35}}
+        """
+        report = {}
+        for col in self.data.columns:
+            dtype = np.dtype(self.data[col].dtype)
+            new_dtype = dtype
+            if is_integer_dtype(dtype):
+                col_min, col_max = self.stats.min(col), self.stats.max(col)
+                for candidate in (np.int8, np.int16, np.int32):
+                    info = np.iinfo(candidate)
+                    if info.min <= col_min and col_max <= info.max:
+                        new_dtype = np.dtype(candidate)
+                        break
+            elif dtype == np.float64:
+                column = self.data[col]
+                roundtrip = column.astype(np.float32).astype(np.float64)
+                # nulls and NaN are kept by the cast, but never compare
+                # equal to themselves
+                missing = column.isnull() | (column != column).fillna(False)
+                if (roundtrip.isnull() == column.isnull()).all() and (
+                    (roundtrip == column).fillna(False) | missing
+                ).all():
+                    new_dtype = np.dtype(np.float32)
+
+            if new_dtype.itemsize < dtype.itemsize:
+                self.data[col] = self.data[col].astype(new_dtype)
+                report[col] = {
+                    "from": dtype.name,
+                    "to": new_dtype.name,
+                    "bytes_saved": len(self.data)
+                    * (dtype.itemsize - new_dtype.itemsize),
+                }
+
+        if len(report) > 0:
+            # the cached statistics hold values of the original dtypes
+            self._stats = None
+        return report
 
     def dashboard(
         self,
@@ -96,6 +240,8 @@ class DataFrame:
         title="Dashboard",
         data_size_widget=True,
         warnings=False,
+        data_cube_memory_budget=0,
+        compute_process=False,
     ):
         """
         Creates a cuxfilter.DashBoard object
@@ -119,6 +265,18 @@ class DataFrame:
             flag to disable or enable runtime warnings related to layouts,
             default False
 
+        data_cube_memory_budget: int
+            maximum size in bytes of the precomputed N-dimensional cube of
+            frequencies over the range filtered charts, used to update count
+            histograms and the data size widget without scanning the data.
+            Dimensions are coarsened to fit the budget, default 0 (disabled)
+
+        compute_process: boolean
+            compute the datatiles in a separate process holding its own
+            copy of the data, shared by the dashboards of the dataframe,
+            so that the bokeh server stays responsive during heavy
+            interactions, default False
+
         Examples
         --------
         >>> import cudf
@@ -143,6 +301,92 @@ class DataFrame:
         cuxfilter.DashBoard object
 
         """
+        if compute_process and self._compute_worker is None:
+            from .compute_worker import ComputeWorker
+
+            self._compute_worker = ComputeWorker(self)
         return DashBoard(
-            charts, self.data, layout, theme, title, data_size_widget, warnings
+            charts,
+            self.data,
+            layout,
+            theme,
+            title,
+            data_size_widget,
+            warnings,
+            data_cube_memory_budget,
+            self.stats,
+            compute_worker=self._compute_worker if compute_process else None,
+        )
+
+    def serve(
+        self,
+        dashboard_fn,
+        workers=2,
+        port=0,
+        address="",
+        websocket_origin=None,
+        multi_session=False,
+        **kwargs,
+    ):
+        """
+        Serve the dashboard built by dashboard_fn from several processes,
+        scaling the callback throughput with the cores instead of running
+        every session on one interpreter.
+
+        The data is written once as Arrow to shared memory and mapped by
+        each worker process, which builds its dashboard with
+        dashboard_fn(cuxfilter.DataFrame) and serves it on the common
+        port. Each worker holds a copy of the data in GPU memory.
+
+        Parameters
+        ----------
+        dashboard_fn: function
+            module level function taking a cuxfilter.DataFrame and
+            returning a cuxfilter.DashBoard
+
+        workers: int
+            number of worker processes, default 2
+
+        port: int
+            port to serve on, default 0 (a free port)
+
+        address: str
+            address to serve on, default "" (all interfaces)
+
+        websocket_origin: str or list
+            hosts allowed to connect, default localhost:port
+
+        multi_session: boolean
+            serve every session its own dashboard within a worker,
+            default False
+
+        Examples
+        --------
+        >>> # dashboards.py
+        >>> from cuxfilter.charts import bokeh
+        >>> def build(cux_df):
+        >>>     return cux_df.dashboard([bokeh.bar('key')])
+
+        >>> import cuxfilter
+        >>> import dashboards
+        >>> cux_df = cuxfilter.DataFrame.from_arrow('./data.arrow')
+        >>> server = cux_df.serve(dashboards.build, workers=4, port=5006)
+        >>> server.join()
+
+        Returns
+        -------
+        cuxfilter.multiprocess.MultiProcessServer object
+
+        """
+        from .multiprocess import MultiProcessServer
+
+        return MultiProcessServer(
+            dashboard_fn,
+            self,
+            workers=workers,
+            port=port,
+            address=address,
+            websocket_origin=websocket_origin,
+            multi_session=multi_session,
+            **kwargs,
         )
@@ -1,6 +1,7 @@
 from typing import Type
 
 from .assets.numba_kernels import gpu_datatile
+from .assets.quantile_sketch import QUANTILE_AGGREGATES
 from .charts.core.core_chart import BaseChart
 
 
@@ -32,25 +33,30 @@ class DataTile:
         """
         calc data tiles base function
         """
+        if self.dimensions == 3:
+            return self._calc_3d_data_tile(data)
         if self.passive_chart.chart_type == "datasize_indicator":
             return self._calc_data_tile_for_size(data)
         elif self.passive_chart.chart_type == "3d_choropleth":
-            return self._calc_3d_choropleth_data_tile(data.copy())
+            return self._calc_3d_choropleth_data_tile(data)
+        elif self.passive_chart.aggregate_fn in QUANTILE_AGGREGATES:
+            return self._calc_quantile_data_tile(data)
         if self.dimensions == 2:
-            return self._calc_2d_data_tile(data.copy())
+            return self._calc_2d_data_tile(data)
 
     def _calc_data_tile_for_size(self, data):
         """
         calc data tiles for dataset size
         """
         return gpu_datatile.calc_data_tile_for_size(
-            data.copy(),
+            data.copy(deep=False),
             self.active_chart.x,
             self.active_chart.min_value,
             self.active_chart.max_value,
-            self.active_chart.stride,
+            self.active_chart.tile_stride,
             cumsum=self.cumsum,
             return_format=self.dtype,
+            bin_edges=self.active_chart.bin_edges,
         )
 
     def _calc_2d_data_tile(self, data):
@@ -66,6 +72,35 @@ class DataTile:
             return_format=self.dtype,
         )
 
+    def _calc_3d_data_tile(self, data):
+        """
+        calc summed-area data tiles for box selections on the active chart,
+        None if the passive chart aggregate can not be summed
+        """
+        if (
+            self.passive_chart.chart_type == "3d_choropleth"
+            or self.passive_chart.aggregate_fn not in ["count", "mean"]
+        ):
+            return None
+        return gpu_datatile.calc_box_data_tile(
+            data,
+            self.active_chart,
+            self.passive_chart,
+            cumsum=self.cumsum,
+        )
+
+    def _calc_quantile_data_tile(self, data):
+        """
+        calc data tile of mergeable quantile sketches
+        """
+        return gpu_datatile.calc_quantile_data_tile(
+            data,
+            self.active_chart,
+            self.passive_chart,
+            self.passive_chart.sketch_bins,
+            cumsum=self.cumsum,
+        )
+
     def _calc_3d_choropleth_data_tile(self, data):
         """
         calc multiple data tiles for color and elevation agg for 3d choropleth
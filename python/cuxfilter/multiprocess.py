@@ -0,0 +1,219 @@
+import multiprocessing
+import os
+import tempfile
+
+import cudf
+import pyarrow as pa
+from bokeh.application import Application
+from bokeh.application.handlers import FunctionHandler
+from bokeh.server.server import BaseServer
+from bokeh.server.tornado import BokehTornado
+from tornado.httpserver import HTTPServer
+from tornado.ioloop import IOLoop
+from tornado.netutil import bind_sockets
+
+from .assets.numba_kernels import warmup
+from .dataframe import DataFrame
+
+SHARED_MEMORY_DIR = "/dev/shm"
+
+
+class SharedDataFrame:
+    """
+    Arrow copy of the data of a cuxfilter.DataFrame in a file on the
+    shared memory filesystem, read by other processes without copying.
+
+    The Arrow buffers are memory-mapped by every process reading the
+    DataFrame, so the host copy of the data exists once however many
+    processes use it. Each process still copies it to the GPU once, device
+    memory can not be mapped into a CUDA context created by another
+    process. SharedDataFrame objects only hold the path of the file and
+    the label maps of the DataFrame, and are cheap to pickle.
+    """
+
+    path: str = None
+    label_maps: dict = None
+
+    def __init__(self, path, label_maps=None):
+        """
+        Parameters
+        ----------
+        path: path of the Arrow file holding the data
+        label_maps: dict of column name -> {code: label} of the dictionary
+            encoded columns of the data
+        """
+        self.path = path
+        self.label_maps = {} if label_maps is None else label_maps
+
+    @classmethod
+    def create(cls, dataframe, directory=None):
+        """
+        write the data of dataframe to a new shared memory file
+
+        Parameters
+        ----------
+        dataframe: cuxfilter.DataFrame
+        directory: directory of the file, defaults to SHARED_MEMORY_DIR
+            where it exists, else the temporary directory
+
+        Returns
+        -------
+        SharedDataFrame object
+        """
+        if directory is None and os.path.isdir(SHARED_MEMORY_DIR):
+            directory = SHARED_MEMORY_DIR
+        table = dataframe.data.to_arrow(preserve_index=False)
+        fd, path = tempfile.mkstemp(
+            prefix="cuxfilter-", suffix=".arrow", dir=directory
+        )
+        os.close(fd)
+        with pa.OSFile(path, "wb") as sink:
+            writer = pa.RecordBatchFileWriter(sink, table.schema)
+            writer.write_table(table)
+            writer.close()
+        return cls(path, dataframe.label_maps)
+
+    def read_table(self):
+        """
+        pyarrow.Table over the memory-mapped file
+        """
+        source = pa.memory_map(self.path)
+        return pa.RecordBatchFileReader(source).read_all()
+
+    def read(self):
+        """
+        cuxfilter.DataFrame of the shared data, copied to the GPU
+        """
+        data = cudf.DataFrame.from_arrow(self.read_table())
+        return DataFrame(data, self.label_maps)
+
+    def unlink(self):
+        """
+        remove the shared memory file, processes that have read it keep
+        their copy
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def _run_worker(
+    dashboard_fn, shared, sockets, websocket_origin, multi_session, kwargs
+):
+    """
+    serve the dashboard returned by dashboard_fn on sockets, in a worker
+    process
+    """
+    dashboard = dashboard_fn(shared.read())
+    # compile the kernels before the server accepts sessions
+    warmup()
+    panel_obj = dashboard._get_panel_obj(multi_session)
+
+    def modify_doc(doc):
+        layout = panel_obj() if multi_session else panel_obj
+        layout.server_doc(doc)
+
+    tornado_app = BokehTornado(
+        {"/": Application(FunctionHandler(modify_doc))},
+        extra_websocket_origins=websocket_origin,
+        **kwargs,
+    )
+    # accept the sessions on the listening sockets shared by the workers
+    http_server = HTTPServer(tornado_app)
+    http_server.add_sockets(sockets)
+    server = BaseServer(IOLoop.current(), tornado_app, http_server)
+    server.start()
+    server.io_loop.start()
+
+
+class MultiProcessServer:
+    """
+    Bokeh servers running the same dashboard in several processes.
+
+    The workers accept connections on one listening socket bound by the
+    parent process, and the kernel hands every connection to one of them,
+    balancing the sessions across the workers so that callbacks of
+    different sessions run on different cores. A session connecting to a
+    worker other than the one that served its page is created on that
+    worker, sessions need no affinity.
+
+    Workers are started with the spawn method, a CUDA context does not
+    survive a fork, and map the SharedDataFrame written by the parent.
+    """
+
+    port: int = None
+    workers: list = None
+
+    def __init__(
+        self,
+        dashboard_fn,
+        dataframe,
+        workers=2,
+        port=0,
+        address="",
+        websocket_origin=None,
+        multi_session=False,
+        **kwargs,
+    ):
+        """
+        Parameters
+        ----------
+        dashboard_fn: function(cuxfilter.DataFrame) -> cuxfilter.DashBoard
+            building the dashboard of a worker, defined at module level so
+            that it can be pickled
+        dataframe: cuxfilter.DataFrame
+        workers: number of worker processes, each holds a copy of the data
+            in GPU memory
+        port: port to serve on, a free port if 0
+        address: address to serve on, all interfaces if empty
+        websocket_origin: str or list of the hosts allowed to connect,
+            defaults to localhost:port
+        multi_session: whether the workers serve every session its own
+            dashboard, see DashBoard.show
+        **kwargs: keyword arguments of the bokeh tornado application,
+            bokeh.server.tornado.BokehTornado
+        """
+        sockets = bind_sockets(port, address)
+        self.port = sockets[0].getsockname()[1]
+        if websocket_origin is None:
+            websocket_origin = ["localhost:%d" % self.port]
+        elif isinstance(websocket_origin, str):
+            websocket_origin = [websocket_origin]
+        self._shared = SharedDataFrame.create(dataframe)
+
+        context = multiprocessing.get_context("spawn")
+        self.workers = []
+        for _ in range(workers):
+            worker = context.Process(
+                target=_run_worker,
+                args=(
+                    dashboard_fn,
+                    self._shared,
+                    sockets,
+                    websocket_origin,
+                    multi_session,
+                    kwargs,
+                ),
+                daemon=True,
+            )
+            worker.start()
+            self.workers.append(worker)
+        # the workers hold their own copies of the sockets
+        for sock in sockets:
+            sock.close()
+
+    def join(self):
+        """
+        wait for the workers to exit
+        """
+        for worker in self.workers:
+            worker.join()
+
+    def stop(self):
+        """
+        stop the workers and remove the shared data
+        """
+        for worker in self.workers:
+            if worker.is_alive():
+                worker.terminate()
+        self.join()
+        self._shared.unlink()
@@ -0,0 +1,61 @@
+import threading
+
+import numpy as np
+
+from cuxfilter.assets.numba_kernels.buffer_pool import BufferPool
+
+
+class TestBufferPool:
+    def test_reuse(self):
+        pool = BufferPool()
+        buffer = pool.zeros("out", (2, 3), np.float64)
+
+        assert buffer.shape == (2, 3)
+        assert np.array_equal(buffer.copy_to_host(), np.zeros((2, 3)))
+        assert pool.device_array("out", (2, 3), np.float64) is buffer
+        assert pool.device_array("out", (2, 3), np.int32) is not buffer
+        assert pool.device_array("out", 6, np.float64) is not buffer
+
+    def test_full(self):
+        pool = BufferPool()
+        pool.to_device("out", np.arange(4, dtype=np.float64))
+        buffer = pool.full("out", 4, np.float64, -1.0)
+
+        assert np.array_equal(buffer.copy_to_host(), [-1.0] * 4)
+
+    def test_max_buffers(self):
+        pool = BufferPool(max_buffers=2)
+        first = pool.device_array("a", 1, np.int32)
+        pool.device_array("b", 1, np.int32)
+        pool.device_array("c", 1, np.int32)
+
+        assert pool.device_array("a", 1, np.int32) is not first
+
+    def test_max_bytes(self):
+        pool = BufferPool(max_bytes=64)
+        first = pool.device_array("a", 4, np.float64)
+        pool.device_array("b", 4, np.float64)
+        assert pool.nbytes == 64
+
+        # over the budget, the least recently used buffer is released
+        pool.device_array("c", 4, np.float64)
+        assert pool.nbytes == 64
+        assert pool.device_array("a", 4, np.float64) is not first
+
+        # larger than the budget, not pooled
+        large = pool.device_array("d", 16, np.float64)
+        assert pool.device_array("d", 16, np.float64) is not large
+        assert pool.nbytes == 64
+
+    def test_threads(self):
+        pool = BufferPool()
+        buffers = []
+
+        def get_buffer():
+            buffers.append(pool.device_array("out", 1, np.int32))
+
+        thread = threading.Thread(target=get_buffer)
+        thread.start()
+        thread.join()
+
+        assert pool.device_array("out", 1, np.int32) is not buffers[0]
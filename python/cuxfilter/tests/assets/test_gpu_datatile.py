@@ -199,6 +199,35 @@ def test_calc_binwise_reduced_column(stride, test_arr, result):
     assert np.array_equal(test_res, result)
 
 
+@pytest.mark.parametrize("dtype", [np.int16, np.float32, np.float64])
+def test_calc_binwise_reduced_column_dtypes(dtype):
+    test_arr = cuda.to_device(np.array([0, 2, 4, 6, 8, 10], dtype=dtype))
+    test_res = gpu_datatile.get_binwise_reduced_column(
+        test_arr, 2, cuda.to_device(np.asarray([2.0, 8.0]))
+    ).copy_to_host()
+
+    assert test_res.dtype == np.int32
+    assert np.array_equal(test_res, [-1, 0, 1, 2, 3, -1])
+    # the input column is left unchanged
+    assert np.array_equal(test_arr.copy_to_host(), [0, 2, 4, 6, 8, 10])
+
+
+@pytest.mark.parametrize(
+    "bin_edges, result",
+    [
+        ([0.0, 1.0, 5.0, 10.0], [-1.0, 0.0, 1.0, 1.0, 2.0, 2.0, -1.0]),
+        ([0.0, 10.0], [-1.0, 0.0, 0.0, 0.0, 0.0, 0.0, -1.0]),
+    ],
+)
+def test_calc_binwise_reduced_column_by_edges(bin_edges, result):
+    test_arr = cuda.to_device(np.array([-1.0, 0.5, 1.0, 4.9, 5.0, 10.0, 11.0]))
+    test_res = gpu_datatile.get_binwise_reduced_column_by_edges(
+        test_arr, bin_edges
+    ).copy_to_host()
+
+    assert np.array_equal(test_res, np.array(result))
+
+
 @pytest.mark.parametrize(
     "result, return_format_str, return_format",
     [
@@ -284,3 +313,142 @@ def test_calc_data_tile():
     )
 
     assert return_result.equals(result)
+
+
+def test_calc_quantile_data_tile():
+    df = cudf.DataFrame(
+        {
+            "key": [0.0, 0.0, 1.0, 1.0],
+            "grp": [0.0, 0.0, 0.0, 0.0],
+            "lat": [1.0, 3.0, 5.0, 7.0],
+        }
+    )
+    active_chart, passive_chart = BaseChart(), BaseChart()
+    active_chart.x, active_chart.min_value = "key", 0.0
+    active_chart.max_value, active_chart.stride = 1.0, 1
+
+    passive_chart.x, passive_chart.y = "grp", "lat"
+    passive_chart.min_value, passive_chart.max_value = 0.0, 0.0
+    passive_chart.stride = 1
+
+    sketch = gpu_datatile.calc_quantile_data_tile(
+        df, active_chart, passive_chart, sketch_bins=4, cumsum=True
+    )
+
+    assert sketch.value_range == (1.0, 7.0)
+    assert np.array_equal(
+        sketch.counts,
+        np.array([[[1.0, 1.0, 0.0, 0.0]], [[1.0, 1.0, 1.0, 1.0]]]),
+    )
+    assert np.allclose(
+        sketch.get_quantile(sketch.query_by_range(0, 1), 0.5), [4.0]
+    )
+    assert sketch.counts.dtype == np.int32
+
+    # 2 cells of 8 bytes per sketch bin fit 3 sketch bins in 48 bytes
+    sketch = gpu_datatile.calc_quantile_data_tile(
+        df,
+        active_chart,
+        passive_chart,
+        sketch_bins=4,
+        cumsum=True,
+        max_bytes=48,
+    )
+
+    assert sketch.counts.shape == (2, 1, 3)
+    assert sketch.counts[-1].sum() == 4
+
+
+def test_calc_box_data_tile():
+    df = cudf.DataFrame(
+        {
+            "x": [0.0, 1.0, 1.0, 2.0],
+            "y": [0.0, 0.0, 2.0, 2.0],
+            "key": [0.0, 1.0, 1.0, 0.0],
+        }
+    )
+    active_chart, passive_chart = BaseChart(), BaseChart()
+    active_chart.x, active_chart.y = "x", "y"
+    active_chart.box_select_tile_bins = 3
+    active_chart.tile_x_range, active_chart.tile_y_range = (0, 2), (0, 2)
+
+    passive_chart.x, passive_chart.min_value = "key", 0.0
+    passive_chart.max_value, passive_chart.stride = 1.0, 1
+
+    result = gpu_datatile.calc_box_data_tile(
+        df, active_chart, passive_chart, cumsum=False
+    )
+
+    assert result.shape == (3, 3, 2)
+    assert result.sum() == 4.0
+    assert result[1, 2, 1] == 1.0
+
+    result = gpu_datatile.calc_box_data_tile(
+        df, active_chart, passive_chart, cumsum=True
+    )
+
+    assert np.array_equal(result[2, 2], [2.0, 2.0])
+    assert np.array_equal(result[1, 0], [1.0, 1.0])
+
+
+@pytest.mark.parametrize(
+    "aggregate_fn, result",
+    [
+        ("count", [2.0, 0.0, 1.0]),
+        ("sum", [4.0, 0.0, 5.0]),
+        ("mean", [2.0, np.nan, 5.0]),
+        ("min", [1.0, np.nan, 5.0]),
+        ("max", [3.0, np.nan, 5.0]),
+    ],
+)
+def test_calc_dense_aggregate(aggregate_fn, result):
+    codes = cuda.to_device(np.array([0, 2, 0, -1, 3], dtype=np.int32))
+    values = cuda.to_device(np.array([1.0, 5.0, 3.0, 7.0, 9.0]))
+
+    counts, aggregates = gpu_datatile.calc_dense_aggregate(
+        codes, 3, values, aggregate_fn
+    )
+
+    assert np.array_equal(counts, [2.0, 0.0, 1.0])
+    assert np.array_equal(aggregates, result, equal_nan=True)
+
+
+def test_calc_dense_groupby():
+    codes = [
+        cuda.to_device(np.array([0, 1, 1, -1, 1], dtype=np.int32)),
+        cuda.to_device(np.array([2, 0, 0, 1, 3], dtype=np.int32)),
+    ]
+
+    result = gpu_datatile.calc_dense_groupby(codes, (2, 3))
+
+    assert np.array_equal(result, [[0.0, 0.0, 1.0], [2.0, 0.0, 0.0]])
+
+
+def test_calc_binwise_reduced_column_int64():
+    base = 2**60
+    test_arr = cuda.to_device(
+        np.array([base, base + 1, base + 3, base + 4], dtype=np.int64)
+    )
+    a_range = gpu_datatile.get_kernel_range(test_arr, base, base + 3)
+    test_res = gpu_datatile.get_binwise_reduced_column(
+        test_arr, 1, a_range
+    ).copy_to_host()
+
+    assert a_range.dtype == np.int64
+    assert np.array_equal(test_res, [0, 1, 3, -1])
+
+
+def test_calc_binwise_reduced_column_datetime():
+    test_arr = cuda.to_device(
+        np.array(
+            ["2020-01-01", "2020-01-02", "2020-01-04"], dtype="datetime64[D]"
+        )
+    )
+    a_range = gpu_datatile.get_kernel_range(
+        test_arr, np.datetime64("2020-01-01"), np.datetime64("2020-01-04")
+    )
+    test_res = gpu_datatile.get_binwise_reduced_column(
+        test_arr, 1, a_range
+    ).copy_to_host()
+
+    assert np.array_equal(test_res, [0, 1, 3])
@@ -299,6 +299,102 @@ def test_calc_value_counts():
     )
 
 
+def test_calc_value_counts_fixed_range():
+    x = cuda.to_device(np.array([1, 5, 10, 15, 25, 27, 30, 23, 22, 35] * 5))
+
+    result = gpu_histogram.calc_value_counts(x, 4, x_range=(0, 40))
+
+    assert np.array_equal(result[0], np.array([0.0, 10.0, 20.0, 40.0]))
+    assert np.array_equal(result[1], np.array([10, 10, 20, 10]))
+
+
+def test_calc_min_max_columns():
+    df = cudf.DataFrame(
+        {
+            "key": [0, 1, 2, 3, 4],
+            "val": cudf.Series([1.0, None, -3.0, None, 5.0]),
+        }
+    )
+
+    result = gpu_histogram.calc_min_max_columns(df, ["key", "val"])
+
+    assert result == [(0, 4), (-3.0, 5.0)]
+
+
+def test_calc_min_max_columns_int64():
+    # not representable in float64, 2**62 + 1 rounds to 2**62
+    df = cudf.DataFrame(
+        {"key": np.array([2**62 + 2, 2**62 + 1, 2**62 + 3], dtype=np.int64)}
+    )
+
+    result = gpu_histogram.calc_min_max_columns(df, ["key"])
+
+    assert result == [(2**62 + 1, 2**62 + 3)]
+
+
+@pytest.mark.parametrize(
+    "binning, result",
+    [
+        ("linear", None),
+        ("quantile", [1.0, 2.0, 4.0, 100.0]),
+        ("log", [1.0, 4.6416, 21.5443, 100.0]),
+        ([50, 0, 10, 10], [0.0, 10.0, 50.0]),
+    ],
+)
+def test_calc_bin_edges(binning, result):
+    column = cudf.Series([1.0, 2.0, 3.0, 4.0, 5.0, 100.0, 1.0])
+
+    bin_edges = gpu_histogram.calc_bin_edges(column, binning, 3)
+
+    if result is None:
+        assert bin_edges is None
+    else:
+        assert np.allclose(bin_edges, result, atol=1e-4)
+
+
+def test_calc_value_counts_int64():
+    base = 2**60
+    x = cuda.to_device(
+        np.array([base, base + 1, base + 3, base + 3], dtype=np.int64)
+    )
+
+    result = gpu_histogram.calc_value_counts(x, 3)
+
+    assert np.array_equal(result[1], np.array([1, 1, 2]))
+
+
+def test_calc_value_counts_datetime():
+    dates = np.array(
+        ["2020-01-01", "2020-01-02", "2020-01-04", "2020-01-04"],
+        dtype="datetime64[D]",
+    )
+    x_range = (np.datetime64("2020-01-01"), np.datetime64("2020-01-04"))
+
+    result = gpu_histogram.calc_value_counts(
+        cuda.to_device(dates), 3, x_range=x_range
+    )
+    expected = gpu_histogram.calc_value_counts(
+        cuda.to_device(dates.astype(np.int64)),
+        3,
+        x_range=tuple(np.array(x_range).astype(np.int64)),
+    )
+
+    assert np.array_equal(result[0], expected[0])
+    assert np.array_equal(result[1], expected[1])
+    assert result[1].sum() == 4
+
+
+def test_calc_value_counts_by_edges():
+    x = cuda.to_device(np.array([1.0, 2.0, 3.0, 4.0, 5.0, 100.0, 1.0]))
+
+    result = gpu_histogram.calc_value_counts_by_edges(
+        x, [1.0, 2.0, 10.0, 100.0]
+    )
+
+    assert np.array_equal(result[0], np.array([0.0, 1.0, 2.0]))
+    assert np.array_equal(result[1], np.array([2.0, 4.0, 1.0]))
+
+
 @pytest.mark.parametrize(
     "aggregate_fn, result",
     [
@@ -332,6 +428,67 @@ def test_calc_groupby(aggregate_fn, result):
     assert np.array_equal(gpu_histogram.calc_groupby(bc, df), result)
 
 
+def test_calc_groupby_quantile_empty_bins():
+    df = cudf.DataFrame(
+        {
+            "key": [0.0, 0.0, 0.0, 1.0, 3.0, 3.0, 3.0],
+            "val": [1.0, 2.0, 3.0, 5.0, 2.0, 3.0, 4.0],
+        }
+    )
+    bc = BaseChart()
+    bc.x = "key"
+    bc.y = "val"
+    bc.stride = 1.0
+    bc.max_value = 3.0
+    bc.min_value = 0.0
+    bc.aggregate_fn = "median"
+    bc.quantile = 0.5
+    bc.sketch_bins = 128
+
+    bins, quantiles = gpu_histogram.calc_groupby(bc, df)
+
+    # every bin is returned, aligned with the quantile data tile queries
+    assert np.array_equal(bins, [0.0, 1.0, 2.0, 3.0])
+    assert np.isnan(quantiles[2])
+    assert np.allclose(quantiles[[0, 1, 3]], [2.0, 5.0, 3.0], atol=0.1)
+
+
+@pytest.mark.parametrize("source_bins, result", [(5, True), (3, False)])
+def test_is_fused_aggregate_mean(source_bins, result):
+    bc = BaseChart()
+    bc.chart_type = "bar"
+    bc.x, bc.y = "key", "val"
+    bc.max_value, bc.min_value = 4.0, 0.0
+    bc.stride = 1.0
+    bc.aggregate_fn = "mean"
+    bc.use_data_tiles = True
+    bc.get_source_y_axis = lambda: np.zeros(source_bins)
+
+    assert gpu_histogram.is_fused_aggregate(bc) is result
+
+
+def test_calc_fused_aggregates():
+    df = cudf.DataFrame(
+        {
+            "key": [float(i) for i in range(5)] * 5,
+            "val": [float(i * 2) for i in range(5, 0, -1)] * 5,
+        }
+    )
+    charts = []
+    for y in (None, "val"):
+        bc = BaseChart()
+        bc.x, bc.y = "key", y
+        bc.max_value, bc.min_value = 4.0, 0.0
+        bc.stride = 1.0
+        bc.aggregate_fn = "count" if y is None else "mean"
+        charts.append(bc)
+
+    result = gpu_histogram.calc_fused_aggregates(charts, df)
+
+    assert np.array_equal(result[0], np.array([5.0, 5.0, 5.0, 5.0, 5.0]))
+    assert np.array_equal(result[1], np.array([10.0, 8.0, 6.0, 4.0, 2.0]))
+
+
 def test_aggregated_column_unique():
     df = cudf.DataFrame(
         {
@@ -0,0 +1,59 @@
+import pytest
+import numpy as np
+
+from cuxfilter.assets.quantile_sketch import QuantileSketch
+
+
+def get_sketch(cumsum):
+    # 3 active bins, 2 passive bins, 5 sketch bins over values [0, 4]
+    counts = np.array(
+        [
+            [[1, 1, 1, 1, 1], [0, 0, 0, 0, 0]],
+            [[0, 0, 4, 0, 0], [2, 0, 0, 0, 0]],
+            [[0, 0, 0, 0, 0], [0, 0, 0, 0, 2]],
+        ],
+        dtype=np.float64,
+    )
+    if cumsum:
+        counts = np.cumsum(counts, axis=0)
+    return QuantileSketch(counts, (0.0, 4.0), 1.0, cumsum=cumsum)
+
+
+@pytest.mark.parametrize(
+    "min_index, max_index, result",
+    [
+        (0, 0, [[1, 1, 1, 1, 1], [0, 0, 0, 0, 0]]),
+        (1, 2, [[0, 0, 4, 0, 0], [2, 0, 0, 0, 2]]),
+        (0, 2, [[1, 1, 5, 1, 1], [2, 0, 0, 0, 2]]),
+    ],
+)
+@pytest.mark.parametrize("cumsum", [True, False])
+def test_query_by_range(min_index, max_index, result, cumsum):
+    sketch = get_sketch(cumsum)
+    assert np.array_equal(
+        sketch.query_by_range(min_index, max_index), np.array(result)
+    )
+
+
+@pytest.mark.parametrize(
+    "indices, result",
+    [
+        ([], [[1, 1, 5, 1, 1], [2, 0, 0, 0, 2]]),
+        ([0, 2], [[1, 1, 1, 1, 1], [0, 0, 0, 0, 2]]),
+    ],
+)
+@pytest.mark.parametrize("cumsum", [True, False])
+def test_query_by_indices(indices, result, cumsum):
+    sketch = get_sketch(cumsum)
+    assert np.array_equal(sketch.query_by_indices(indices), np.array(result))
+
+
+def test_get_quantile():
+    sketch = get_sketch(False)
+    counts = np.array(
+        [[1, 1, 1, 1, 1], [0, 0, 4, 0, 0], [2, 0, 0, 0, 2], [0, 0, 0, 0, 0]]
+    )
+    result = sketch.get_quantile(counts, 0.5)
+
+    assert np.allclose(result[:3], [2.0, 2.0, 0.5])
+    assert np.isnan(result[3])
@@ -0,0 +1,292 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cuxfilter.assets.scheduler import (
+    CallbackScheduler,
+    defer,
+    hold_document,
+    submit,
+)
+
+
+class TestCallbackScheduler:
+    def get_scheduler(self):
+        timers = []
+
+        def call_later(delay, callback):
+            timers.append(callback)
+            return True
+
+        return CallbackScheduler(interval=10, call_later=call_later), timers
+
+    def test_coalesce(self):
+        scheduler, timers = self.get_scheduler()
+        calls = []
+
+        for value in range(5):
+            scheduler.schedule("bar", calls.append, value)
+
+        # the first event runs at once, the rest wait for the interval
+        assert calls == [0]
+        assert len(timers) == 1
+        assert scheduler.pending == ["bar"]
+
+        timers[0]()
+
+        assert calls == [0, 4]
+        assert scheduler.pending == []
+
+    def test_order(self):
+        scheduler, timers = self.get_scheduler()
+        calls = []
+
+        scheduler.schedule("bar", calls.append, "bar_0")
+        scheduler.schedule("bar", calls.append, "bar_1")
+        scheduler.schedule("line", calls.append, "line_0")
+
+        assert calls == ["bar_0", "bar_1", "line_0"]
+
+        timers[0]()
+
+        assert calls == ["bar_0", "bar_1", "line_0"]
+
+    def test_without_event_loop(self):
+        scheduler = CallbackScheduler(
+            interval=10, call_later=lambda delay, callback: False
+        )
+        calls = []
+
+        for value in range(3):
+            scheduler.schedule("bar", calls.append, value)
+
+        assert calls == [0, 1, 2]
+
+    def test_flush(self):
+        scheduler, timers = self.get_scheduler()
+        calls = []
+
+        scheduler.schedule("bar", calls.append, 0)
+        scheduler.schedule("bar", calls.append, 1)
+        scheduler.flush()
+
+        assert calls == [0, 1]
+        assert scheduler.pending == []
+
+
+class TestExecutor:
+    def get_scheduler(self):
+        ticks = []
+        scheduler = CallbackScheduler(
+            interval=0,
+            call_later=lambda delay, callback: False,
+            next_tick=lambda: ticks.append,
+            executor=ThreadPoolExecutor(max_workers=1),
+        )
+        return scheduler, ticks
+
+    def run_ticks(self, scheduler, ticks):
+        while scheduler.busy or len(ticks) > 0:
+            if len(ticks) > 0:
+                ticks.pop(0)()
+            else:
+                time.sleep(0.001)
+
+    def test_off_event_loop(self):
+        scheduler, ticks = self.get_scheduler()
+        calls = []
+
+        def update(value):
+            calls.append(("compute", value, threading.current_thread()))
+            defer(calls.append, ("apply", value))
+
+        scheduler.schedule("bar", update, 0)
+        scheduler._running.future.result()
+
+        # computed on the executor, changes wait for the event loop
+        assert calls[0][:2] == ("compute", 0)
+        assert calls[0][2] is not threading.current_thread()
+        assert len(calls) == 1
+
+        self.run_ticks(scheduler, ticks)
+
+        assert calls[1] == ("apply", 0)
+
+    def test_stale_updates(self):
+        scheduler, ticks = self.get_scheduler()
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def update(value):
+            if value == 0:
+                started.set()
+                release.wait()
+            calls.append(value)
+            defer(calls.append, ("reload", value))
+            defer(calls.append, ("query", value), supersedable=True)
+
+        scheduler.schedule("bar", update, 0)
+        started.wait()
+        scheduler.schedule("bar", update, 1)
+        scheduler.schedule("bar", update, 2)
+        release.set()
+        self.run_ticks(scheduler, ticks)
+
+        # 1 is cancelled before it computes, the superseded query of 0 is
+        # discarded
+        assert calls == [0, ("reload", 0), 2, ("reload", 2), ("query", 2)]
+
+    def test_flush(self):
+        timers = []
+        ticks = []
+        scheduler = CallbackScheduler(
+            interval=10,
+            call_later=lambda delay, callback: timers.append(callback) or True,
+            next_tick=lambda: ticks.append,
+            executor=ThreadPoolExecutor(max_workers=1),
+        )
+        calls = []
+        release = threading.Event()
+
+        def update(value):
+            if value == 0:
+                release.wait()
+            calls.append(value)
+            defer(calls.append, ("apply", value))
+
+        scheduler.schedule("bar", update, 0)
+        scheduler.schedule("bar", update, 1)
+        # does not wait for 0 computing on the executor
+        scheduler.flush()
+
+        assert calls == []
+        assert scheduler.pending == []
+
+        release.set()
+        self.run_ticks(scheduler, ticks)
+
+        assert calls == [0, ("apply", 0), 1, ("apply", 1)]
+        assert len(timers) == 1
+
+    def test_apply_error(self):
+        scheduler, ticks = self.get_scheduler()
+        calls = []
+        release = threading.Event()
+
+        def update(value):
+            if value == 0:
+                release.wait()
+                raise ValueError(value)
+            calls.append(value)
+
+        scheduler.schedule("bar", update, 0)
+        scheduler.schedule("line", update, 1)
+        release.set()
+        scheduler._running.future.result()
+
+        with pytest.raises(ValueError):
+            ticks.pop(0)()
+
+        # the update queued behind the failed one still runs
+        self.run_ticks(scheduler, ticks)
+
+        assert calls == [1]
+        assert not scheduler.busy
+
+    def test_max_fps(self):
+        timers = []
+        ticks = []
+        scheduler = CallbackScheduler(
+            interval=0,
+            call_later=lambda delay, callback: timers.append(callback) or True,
+            next_tick=lambda: ticks.append,
+            executor=ThreadPoolExecutor(max_workers=1),
+            max_fps=1,
+        )
+        calls = []
+
+        def update(value):
+            defer(calls.append, value)
+
+        scheduler.schedule("bar", update, 0)
+        self.run_ticks(scheduler, ticks)
+        scheduler.schedule("bar", update, 1)
+        scheduler._running.future.result()
+        ticks.pop(0)()
+
+        # the second frame waits, and holds back the next update
+        assert calls == [0]
+        assert len(timers) == 1
+
+        scheduler.schedule("bar", update, 2)
+        scheduler.schedule("bar", update, 3)
+        # a second passes
+        scheduler._last_frame -= 1
+        timers.pop(0)()
+
+        assert calls == [0, 1]
+
+        scheduler._running.future.result()
+        ticks.pop(0)()
+        scheduler._last_frame -= 1
+        timers.pop(0)()
+
+        # 2 was coalesced while the frame of 1 was waiting
+        assert calls == [0, 1, 3]
+        assert not scheduler.busy
+
+    def test_merge(self):
+        scheduler, ticks = self.get_scheduler()
+        calls = []
+
+        def update(value):
+            defer(calls.append, ("reload", value), merge_key="line")
+            defer(calls.append, ("other", value))
+            defer(calls.append, ("query", value), merge_key="line")
+
+        scheduler.schedule("bar", update, 0)
+        self.run_ticks(scheduler, ticks)
+
+        assert calls == [("other", 0), ("query", 0)]
+
+
+def test_submit():
+    calls = []
+    ticks = []
+
+    submit(lambda: 1, calls.append, next_tick=lambda: None)
+
+    assert calls == [1]
+
+    submit(lambda: 2, calls.append, next_tick=lambda: ticks.append)
+    while len(ticks) == 0:
+        time.sleep(0.001)
+    ticks[0]()
+
+    assert calls == [1, 2]
+
+
+def test_hold_document(monkeypatch):
+    events = []
+
+    class Document:
+        session_context = object()
+
+        def hold(self, policy):
+            events.append(("hold", policy))
+
+        def unhold(self):
+            events.append("unhold")
+
+    monkeypatch.setattr("cuxfilter.assets.scheduler.curdoc", Document)
+
+    with hold_document():
+        events.append("patch")
+        with hold_document():
+            events.append("patch")
+
+    # nested holds send a single combined message
+    assert events == [("hold", "combine"), "patch", "patch", "unhold"]
@@ -0,0 +1,12 @@
+import numpy as np
+
+import cuxfilter
+from cuxfilter.assets.numba_kernels import warmup as warmup_module
+
+
+def test_warmup():
+    cuxfilter.warmup(dtypes=[np.int16])
+
+    assert np.dtype(np.int16) in warmup_module._warmed_up
+    # dtypes already compiled are skipped
+    cuxfilter.warmup(dtypes=[np.int16])
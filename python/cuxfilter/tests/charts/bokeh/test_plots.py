@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+from bokeh.models import ColumnDataSource
+
+from cuxfilter.charts.bokeh.plots import patch_source_column, to_typed_array
+
+
+@pytest.mark.parametrize(
+    "values, exact, dtype",
+    [
+        ([0, 1, 2], True, np.int32),
+        (np.array([0, 2**40]), True, np.float64),
+        ([0.0, 1.0, 16777216.0], True, np.float32),
+        ([0.0, 16777217.0], False, np.float64),
+        ([0.1, 0.2, np.nan], True, np.float64),
+        ([0.1, 0.2, np.nan], False, np.float32),
+        ([1e300, 0.5], False, np.float64),
+    ],
+)
+def test_to_typed_array(values, exact, dtype):
+    result = to_typed_array(values, exact=exact)
+
+    assert result.dtype == dtype
+    np.testing.assert_allclose(result, values, rtol=1e-6)
+
+
+def test_patch_source_column():
+    source = ColumnDataSource(
+        {"x": to_typed_array([0, 1, 2]), "y": to_typed_array([1.0, 2.0, 3.0])}
+    )
+
+    patch_source_column(source, "y", np.array([5.0, np.nan]))
+
+    assert source.data["y"].dtype == np.float32
+    np.testing.assert_array_equal(source.data["y"], [5.0, np.nan, 3.0])
+
+
+class Source:
+    def __init__(self, data):
+        self.data = data
+        self.patches = []
+
+    def patch(self, patches):
+        self.patches.append(patches)
+        for column, column_patches in patches.items():
+            for rows, values in column_patches:
+                self.data[column][rows] = values
+
+
+@pytest.mark.parametrize(
+    "values, patches",
+    [
+        (np.arange(20.0), []),
+        # two runs of changed rows
+        (
+            np.r_[0, 1, 7, 8, 4:19, 0],
+            [[(slice(2, 4), [7, 8]), (slice(19, 20), [0])]],
+        ),
+        # most rows changed
+        (np.zeros(20), [[(slice(20), np.zeros(20))]]),
+    ],
+)
+def test_patch_source_column_changes(values, patches):
+    source = Source({"y": np.arange(20.0)})
+
+    patch_source_column(source, "y", values)
+
+    assert len(source.patches) == len(patches)
+    for sent, expected in zip(source.patches, patches):
+        assert [rows for rows, _ in sent["y"]] == [
+            rows for rows, _ in expected
+        ]
+        for (_, sent_values), (_, expected_values) in zip(sent["y"], expected):
+            np.testing.assert_array_equal(sent_values, expected_values)
+    np.testing.assert_array_equal(source.data["y"], values)
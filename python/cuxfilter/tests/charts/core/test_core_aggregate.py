@@ -1,5 +1,6 @@
 import pytest
 import pandas as pd
+import numpy as np
 
 from cuxfilter.charts.core.aggregate.core_aggregate import BaseAggregateChart
 
@@ -145,3 +146,35 @@ class TestCoreAggregateChart:
         )
 
         assert all(self.result == result)
+
+    @pytest.mark.parametrize(
+        "aggregate_fn, box_indices, result",
+        [
+            ("count", (1, 1, 1, 1), [1.0, 1.0]),
+            ("count", (0, 1, 0, 1), [4.0, 4.0]),
+            ("count", None, [0.0, 0.0]),
+            ("mean", (0, 1, 1, 1), [2.0, 2.0]),
+        ],
+    )
+    def test_query_chart_by_box(self, aggregate_fn, box_indices, result):
+        active_chart = BaseAggregateChart()
+        active_chart.get_box_tile_indices = lambda *box: box_indices
+
+        passive_chart = BaseAggregateChart()
+        passive_chart.aggregate_fn = aggregate_fn
+        self.result = None
+
+        def reset_chart(datatile_result):
+            self.result = datatile_result
+
+        passive_chart.reset_chart = reset_chart
+
+        counts = np.cumsum(np.cumsum(np.ones((2, 2, 2)), axis=0), axis=1)
+        if aggregate_fn == "mean":
+            datatile = [counts * 2, counts]
+        else:
+            datatile = counts
+
+        passive_chart.query_chart_by_box(active_chart, (0, 1, 0, 1), datatile)
+
+        assert np.array_equal(self.result, result)
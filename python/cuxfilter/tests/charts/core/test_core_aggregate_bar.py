@@ -82,7 +82,23 @@ class TestBaseBar:
 
         bb.format_source_data = func1
         bb.calculate_source(self.df)
-        assert self.result == result
+        assert {
+            key: value.tolist() for key, value in self.result.items()
+        } == result
+
+    def test_compute_source(self):
+        bb = BaseBar(x="key", y="val")
+        bb.initiate_chart(self.dashboard)
+
+        def func1(dict_temp, patch_update=False):
+            raise AssertionError("compute_source must not format the source")
+
+        bb.format_source_data = func1
+        result = bb.compute_source(self.df.query("key >= 2"))
+        assert {key: value.tolist() for key, value in result.items()} == {
+            "X": [2.0, 3.0, 4.0],
+            "Y": [12.0, 13.0, 14.0],
+        }
 
     def test_add_range_slider_filter(self):
         bb = BaseBar(x="key")
@@ -111,7 +111,9 @@ class TestBaseCholorpleth:
         bc.format_source_data = func1
         bc.calculate_source(self.df)
 
-        assert self.result == result
+        assert {
+            key: value.tolist() for key, value in self.result.items()
+        } == result
 
     @pytest.mark.parametrize(
         "old, new", [([1], [1, 2]), ([], [1]), ([1], [2])]
@@ -131,7 +133,9 @@ class TestBaseCholorpleth:
 
         dashboard._query_datatiles_by_indices = func1
         fn_test = bc.get_selection_callback(dashboard)
-        fn_test(old, new)
+        fn_test([], old)
+        # queried from the selection queried last
+        fn_test([], new)
 
         assert fn_test.__name__ == "selection_callback"
         assert self.result == (old, new)
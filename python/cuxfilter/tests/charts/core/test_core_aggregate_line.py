@@ -81,7 +81,9 @@ class TestBaseLine:
 
         bl.format_source_data = func1
         bl.calculate_source(self.df)
-        assert self.result == result
+        assert {
+            key: value.tolist() for key, value in self.result.items()
+        } == result
 
     def test_add_range_slider_filter(self):
         bl = BaseLine(x="key")
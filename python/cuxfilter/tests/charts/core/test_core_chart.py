@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 
 from cuxfilter.charts.core.core_chart import BaseChart
 
@@ -37,6 +38,31 @@ class TestBaseChart:
         bc.stride = stride
         assert bc._stride == _stride
 
+    @pytest.mark.parametrize(
+        "tile_resolution, stride_type, tile_stride, index",
+        [(None, int, 2, 1), (11, int, 1, 3), (21, float, 0.5, 5)],
+    )
+    def test_tile_stride(
+        self, tile_resolution, stride_type, tile_stride, index
+    ):
+        bc = BaseChart()
+        bc.min_value, bc.max_value = 0.0, 10.0
+        bc.stride_type = stride_type
+        bc.stride = 2
+        bc.tile_resolution = tile_resolution
+
+        assert bc.tile_stride == tile_stride
+        assert bc.value_to_tile_index(2.6) == index
+
+    @pytest.mark.parametrize(
+        "value, index", [(-1.0, 0), (0.5, 0), (1.0, 1), (9.9, 2), (20.0, 2)]
+    )
+    def test_value_to_tile_index_by_edges(self, value, index):
+        bc = BaseChart()
+        bc.bin_edges = np.array([0.0, 1.0, 5.0, 10.0])
+
+        assert bc.value_to_tile_index(value) == index
+
     def test_set_dimensions(self):
         bc = BaseChart()
         bc.chart = 1
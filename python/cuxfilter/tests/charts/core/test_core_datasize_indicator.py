@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 import pandas as pd
 import cudf
 
@@ -60,7 +61,14 @@ class TestBaseDataSizeIndicator:
         bdsi.format_source_data = func1
         bdsi.calculate_source(self.df)
 
-        assert self.result == {"X": [1], "Y": [self.df.shape[0]]}
+        assert {key: value.tolist() for key, value in self.result.items()} == {
+            "X": [1],
+            "Y": [self.df.shape[0]],
+        }
+        # typed arrays, not lists of JSON numbers
+        assert all(
+            isinstance(value, np.ndarray) for value in self.result.values()
+        )
 
     @pytest.mark.parametrize(
         "query_tuple, result", [((1, 4), 4.0), ((0, 4), 5.0), ((1, 1), 1.0)]
@@ -129,6 +129,22 @@ class TestCoreNonAggregateChart:
         bnac.calculate_source(data)
         assert self.result.equals(_data)
 
+    @pytest.mark.parametrize(
+        "box, result",
+        [
+            ((1, 2, 2, 6), (1, 2, 1, 3)),
+            ((-1, 9, -2, 10), (0, 4, 0, 4)),
+            ((5, 6, 2, 6), None),
+        ],
+    )
+    def test_get_box_tile_indices(self, box, result):
+        bnac = BaseNonAggregate()
+        bnac.box_select_tile_bins = 5
+        bnac.tile_x_range = (0, 4)
+        bnac.tile_y_range = (0, 8)
+
+        assert bnac.get_box_tile_indices(*box) == result
+
     @pytest.mark.parametrize(
         "x_range, y_range, query",
         [
@@ -0,0 +1,61 @@
+import json
+
+import numpy as np
+
+from cuxfilter import benchmark
+from cuxfilter.charts.bokeh import plots
+
+SPEC = {
+    "rows": 1000,
+    "columns": {
+        "key": {"dtype": "int32", "min": 0, "max": 99},
+        "val": {"dtype": "float64", "min": 0, "max": 1},
+    },
+    "charts": [
+        {"type": "bokeh.bar", "args": ["key"]},
+        {"type": "bokeh.line", "args": ["val"]},
+        {"type": "panel_widgets.range_slider", "args": ["val"]},
+    ],
+    "interactions": [
+        {"chart": 0, "action": "value", "value": [10, 50]},
+        {"chart": 1, "action": "value", "value": [0.25, 0.75]},
+        {"chart": 2, "action": "value", "value": [0.5, 1]},
+    ],
+    "repeat": 2,
+    "warmup": False,
+}
+
+
+def test_synthetic_data():
+    df = benchmark.synthetic_data(100, SPEC["columns"])
+
+    assert len(df) == 100
+    assert df["key"].dtype == np.int32
+    assert 0 <= df["key"].min() and df["key"].max() <= 99
+    assert 0 <= df["val"].min() and df["val"].max() <= 1
+
+
+def test_run(tmpdir):
+    spec_file = tmpdir.join("spec.json")
+    spec_file.write(json.dumps(SPEC))
+    output_file = tmpdir.join("results.json")
+    patch_source_column = plots.patch_source_column
+    benchmark.main([str(spec_file), "-o", str(output_file)])
+    results = json.loads(output_file.read())
+
+    # the timed functions are unwrapped after the run
+    assert plots.patch_source_column is patch_source_column
+
+    assert results["rows"] == 1000
+    assert [result["chart"] for result in results["interactions"]] == [
+        "key_bar",
+        "val_line",
+        "val_widget_range_slider",
+    ]
+    for result in results["interactions"]:
+        assert result["total"]["count"] == 2
+        # every interaction switches the active view
+        assert result["stages"]["view_switch"]["count"] == 2
+        assert result["stages"]["tile_build"]["count"] == 2
+        # the other bar and line chart patch their sources
+        assert "patch" in result["stages"]
@@ -0,0 +1,78 @@
+import pytest
+import numpy as np
+
+from cuxfilter.column_stats import ColumnStats
+import cudf
+
+
+class TestColumnStats:
+
+    df = cudf.DataFrame(
+        {
+            "key": [0, 1, 2, 3, 4],
+            "val": [float(i + 10) for i in range(5)],
+            "null_val": cudf.Series([1.0, None, -3.0, None, 5.0]),
+        }
+    )
+
+    @pytest.mark.parametrize(
+        "column, min_value, max_value, count, null_count",
+        [
+            ("key", 0, 4, 5, 0),
+            ("val", 10.0, 14.0, 5, 0),
+            ("null_val", -3.0, 5.0, 3, 2),
+        ],
+    )
+    def test_stats(self, column, min_value, max_value, count, null_count):
+        stats = ColumnStats(self.df)
+
+        assert stats.min(column) == min_value
+        assert stats.max(column) == max_value
+        assert stats.count(column) == count
+        assert stats.null_count(column) == null_count
+
+    def test_stats_int64(self):
+        df = cudf.DataFrame(
+            {"key": np.array([2**62 + 1, 2**62 + 3], dtype=np.int64)}
+        )
+        stats = ColumnStats(df)
+
+        assert stats.min("key") == 2**62 + 1
+        assert stats.max("key") == 2**62 + 3
+        assert type(stats.min("key")) == int
+
+    def test_compute(self):
+        stats = ColumnStats(self.df)
+        stats.compute(["key", "val", "unknown"])
+
+        assert "key" in stats
+        assert "val" in stats
+        assert "unknown" not in stats
+        assert "null_val" not in stats
+        assert "distinct_count" not in stats["key"]
+        assert isinstance(stats.min("key"), np.integer)
+
+    def test_distinct_count(self):
+        stats = ColumnStats(self.df)
+
+        assert stats.distinct_count("key") == 5
+
+    def test_categories(self):
+        stats = ColumnStats(
+            cudf.DataFrame({"key": [3, 1, 3, 2, 1, 3], "val": [0.0] * 6})
+        )
+        categories = stats.categories("key")
+
+        assert categories["values"].tolist() == [1, 2, 3]
+        assert categories["counts"].tolist() == [2, 1, 3]
+        assert stats.distinct_count("key") == 3
+        assert stats.categories("key") is categories
+
+    def test_binned_categories(self):
+        stats = ColumnStats(self.df)
+
+        assert stats.binned_categories("val", 10.0, 2.0).tolist() == [
+            10.0,
+            12.0,
+            14.0,
+        ]
@@ -0,0 +1,50 @@
+import cudf
+import numpy as np
+import pandas as pd
+
+import cuxfilter
+from cuxfilter.charts import bokeh
+from cuxfilter.compute_worker import ChartSpec, from_arrow, to_arrow
+
+
+def test_arrow_round_trip():
+    tile = pd.DataFrame(np.arange(6, dtype=np.float64).reshape(2, 3))
+    tile = tile[tile.index.isin([1])]
+    result = from_arrow(to_arrow({"a": [tile, tile], "b": None}))
+
+    assert list(result) == ["a", "b"]
+    assert result["b"] is None
+    for value in result["a"]:
+        pd.testing.assert_frame_equal(value, tile)
+
+
+def test_chart_spec():
+    chart = bokeh.bar("key", "val", aggregate_fn="mean")
+    spec = ChartSpec(chart)
+
+    assert spec.x == "key"
+    assert spec.y == "val"
+    assert spec.aggregate_fn == "mean"
+    assert spec.box_select_tile_bins is None
+
+
+def test_compute_process():
+    df = cudf.DataFrame(
+        {"key": [0, 1, 2, 3, 4], "val": [float(i + 10) for i in range(5)]}
+    )
+    cux_df = cuxfilter.DataFrame.from_dataframe(df)
+    tiles = []
+    for compute_process in (False, True):
+        bac = bokeh.line("key", "val")
+        bac1 = bokeh.bar("val")
+        dashboard = cux_df.dashboard(
+            charts=[bac, bac1],
+            layout=cuxfilter.layouts.double_feature,
+            compute_process=compute_process,
+        )
+        dashboard._active_view = bac.name
+        dashboard._calc_data_tiles()
+        tiles.append(dashboard._data_tiles[bac1.name])
+
+    pd.testing.assert_frame_equal(tiles[0], tiles[1])
+    cux_df._compute_worker.stop()
@@ -44,6 +44,14 @@ class TestDashBoard:
             "key_chart_3",
         ]
 
+    def test_label_maps(self):
+        df = cudf.DataFrame({"key": [0, 1, 2], "state": ["NY", "CA", "NY"]})
+        cux_df = cuxfilter.DataFrame.from_dataframe(df, encode_categories=True)
+        bac = bokeh.bar("state")
+        cux_df.dashboard(charts=[bac])
+
+        assert bac.x_label_map == {0: "CA", 1: "NY"}
+
     @pytest.mark.parametrize(
         "query, inplace, result1, result2",
         [
@@ -251,3 +259,46 @@ class TestDashBoard:
         assert dashboard._data.equals(
             df.query(dashboard._query_str_dict["key_line"])
         )
+
+    def test_session_copy(self):
+        df = cudf.DataFrame(
+            {"key": [0, 1, 2, 3, 4], "val": [float(i + 10) for i in range(5)]}
+        )
+        cux_df = cuxfilter.DataFrame.from_dataframe(df)
+        bac = bokeh.line("key", "val")
+        bac1 = bokeh.bar("val")
+        dashboard = cux_df.dashboard(
+            charts=[bac, bac1],
+            title="test_title",
+            layout=cuxfilter.layouts.double_feature,
+        )
+        session = dashboard._session_copy()
+        session_bac = session._charts[bac.name]
+        session_bac1 = session._charts[bac1.name]
+
+        assert session._backup_data is dashboard._backup_data
+        assert session._data_stats is dashboard._data_stats
+        assert session._tile_cache is dashboard._tile_cache
+        assert list(session._charts.keys()) == list(dashboard._charts.keys())
+        assert session_bac is not bac
+        assert session_bac.source is not bac.source
+        assert session_bac.filter_widget is not bac.filter_widget
+        assert session.title == "test_title"
+
+        session._active_view = bac.name
+        session._calc_data_tiles()
+        session._query_datatiles_by_range(query_tuple=(1, 2))
+        session_bac.filter_widget.value = (1, 2)
+
+        # reset active view
+        session._reset_current_view(new_active_view=session_bac1)
+
+        assert session._active_view == bac1.name
+        assert session._query_str_dict == {"key_line": "1<=key<=2"}
+        assert session._data.equals(
+            df.query(session._query_str_dict["key_line"])
+        )
+        assert bac.filter_widget.value != (1, 2)
+        assert dashboard._active_view == ""
+        assert dashboard._query_str_dict == {}
+        assert dashboard._data.equals(df)
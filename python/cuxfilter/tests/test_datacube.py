@@ -0,0 +1,71 @@
+import pytest
+import numpy as np
+
+from cuxfilter.datacube import DataCube
+from cuxfilter.charts import bokeh
+
+
+def get_chart(x, chart_fn=bokeh.bar):
+    chart = chart_fn(x)
+    chart.min_value = 0
+    chart.max_value = 3
+    chart.stride = 1
+    return chart
+
+
+class TestDataCube:
+
+    bac = get_chart("key")
+    bac1 = get_chart("val")
+    dsi = bokeh.bar("size")
+    dsi.chart_type = "datasize_indicator"
+
+    def get_data_cube(self, memory_budget=1024):
+        data_cube = DataCube([self.bac, self.bac1], memory_budget)
+        # 4 key bins x 4 val bins
+        data_cube.cube = np.arange(16, dtype=np.float64).reshape(4, 4)
+        return data_cube
+
+    def test_variables(self):
+        data_cube = DataCube([self.bac, self.bac1, self.dsi], 1024)
+
+        assert list(data_cube.dimensions) == [self.bac.name, self.bac1.name]
+        assert data_cube.shape == (4, 4)
+        assert data_cube.dimensions[self.bac.name]["factor"] == 1
+
+    @pytest.mark.parametrize(
+        "memory_budget, shape", [(128, (4, 4)), (64, (2, 4)), (8, (1, 1))]
+    )
+    def test_fit_memory_budget(self, memory_budget, shape):
+        data_cube = DataCube([self.bac, self.bac1], memory_budget)
+
+        assert data_cube.shape == shape
+
+    @pytest.mark.parametrize(
+        "query_ranges, result",
+        [
+            ({}, [24, 28, 32, 36]),
+            ({"key_bar": (1, 2)}, [12, 14, 16, 18]),
+            ({"key_bar": (1, 2), "val_bar": (0, 1)}, [12, 14, 0, 0]),
+        ],
+    )
+    def test_query(self, query_ranges, result):
+        data_cube = self.get_data_cube()
+
+        assert np.array_equal(
+            data_cube.query(self.bac1, query_ranges), np.array(result)
+        )
+
+    def test_query_datasize(self):
+        data_cube = self.get_data_cube()
+
+        assert data_cube.query(self.dsi, {"key_bar": (0, 1)}) == 28.0
+
+    def test_query_exceeds_resolution(self):
+        data_cube = DataCube([self.bac, self.bac1], 64)
+        data_cube.cube = np.ones(data_cube.shape)
+
+        assert data_cube.query(self.bac1, {"key_bar": (1, 2)}) is None
+        assert data_cube.query(self.bac1, {"key_bar": (2, 3)}) is not None
+        # coarsened dimensions can not be answered at full resolution
+        assert data_cube.query(self.bac, {}) is None
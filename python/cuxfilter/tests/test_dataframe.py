@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 
 from cuxfilter import DataFrame
 import cuxfilter
@@ -29,3 +30,96 @@ class TestDataFrame:
         )
         assert dashboard._theme == cuxfilter.themes.light
         assert dashboard.data_size_widget is True
+
+    def test_stats(self):
+        df = cudf.DataFrame(
+            {"key": [0, 1, 2, 3, 4], "val": [float(i + 10) for i in range(5)]}
+        )
+        cux_df = DataFrame.from_dataframe(df)
+
+        dashboard = cux_df.dashboard(charts=[])
+
+        assert cux_df.stats is cux_df.stats
+        assert dashboard._data_stats is cux_df.stats
+        assert cux_df.stats.max("val") == 14.0
+
+    @pytest.mark.parametrize(
+        "encode_categories, label_maps",
+        [
+            (False, {}),
+            (True, {"state": {0: "CA", 1: "NY", 2: "TX"}, "city": {0: "a"}}),
+            (2, {"city": {0: "a"}}),
+        ],
+    )
+    def test_encode_categories(self, encode_categories, label_maps):
+        df = cudf.DataFrame(
+            {
+                "key": [0, 1, 2, 3],
+                "state": ["NY", "CA", "TX", "NY"],
+                "city": ["a", "a", "a", "a"],
+            }
+        )
+        cux_df = DataFrame.from_dataframe(
+            df, encode_categories=encode_categories
+        )
+
+        assert cux_df.label_maps == label_maps
+        assert cux_df.stats.label_maps == label_maps
+        if "state" in label_maps:
+            assert cux_df.data["state"].to_pandas().tolist() == [1, 0, 2, 1]
+        # the original dataframe is left untouched
+        assert df["state"].to_pandas().tolist() == ["NY", "CA", "TX", "NY"]
+
+    def test_optimize_dtypes(self):
+        df = cudf.DataFrame(
+            {
+                "key": [0, 1, 2, 3, 4],
+                "wide": [0, 1, 2, 3, 100000],
+                "val": [float(i + 10) for i in range(5)],
+                "precise": [0.1, 0.2, 0.3, 0.4, 0.5],
+            }
+        )
+        cux_df = DataFrame.from_dataframe(df)
+        stats = cux_df.stats
+
+        report = cux_df.optimize_dtypes()
+
+        assert report == {
+            "key": {"from": "int64", "to": "int8", "bytes_saved": 35},
+            "wide": {"from": "int64", "to": "int32", "bytes_saved": 20},
+            "val": {"from": "float64", "to": "float32", "bytes_saved": 20},
+        }
+        assert cux_df.data["precise"].dtype == np.float64
+        assert cux_df.data["key"].to_pandas().tolist() == [0, 1, 2, 3, 4]
+        assert cux_df.stats is not stats
+
+    def test_optimize_dtypes_nan(self):
+        df = cudf.DataFrame(
+            {
+                "val": np.array([0.5, np.nan, 1.5, 2.5, 4.0]),
+                "precise": np.array([0.1, np.nan, 0.3, 0.4, 0.5]),
+            }
+        )
+        cux_df = DataFrame.from_dataframe(df)
+
+        report = cux_df.optimize_dtypes()
+
+        assert report == {
+            "val": {"from": "float64", "to": "float32", "bytes_saved": 20}
+        }
+        assert cux_df.data["precise"].dtype == np.float64
+
+    def test_optimize_dtypes_stats(self):
+        df = cudf.DataFrame({"key": [-100, 0, 50, 100, 20]})
+        cux_df = DataFrame.from_dataframe(df)
+        cux_df.optimize_dtypes()
+        col_min, col_max = cux_df.stats.min("key"), cux_df.stats.max("key")
+
+        assert cux_df.data["key"].dtype == np.int8
+        # the range of the column does not fit in int8
+        assert col_max - col_min == 200
+        assert type(col_min) is int
+
+        bac = cuxfilter.charts.bokeh.bar("key", data_points=10)
+        cux_df.dashboard([bac])
+        assert bac.stride == 20
@@ -0,0 +1,27 @@
+import os
+
+import cudf
+
+import cuxfilter
+from cuxfilter.multiprocess import SharedDataFrame
+
+
+class TestSharedDataFrame:
+    def test_read(self, tmpdir):
+        df = cudf.DataFrame(
+            {
+                "key": [0, 1, 2, 3, 4],
+                "val": [float(i + 10) for i in range(5)],
+                "state": ["CA", "NY", "CA", "TX", "NY"],
+            }
+        )
+        cux_df = cuxfilter.DataFrame.from_dataframe(df, encode_categories=True)
+        shared = SharedDataFrame.create(cux_df, directory=str(tmpdir))
+
+        result = shared.read()
+        assert result.data.equals(cux_df.data)
+        assert result.label_maps == cux_df.label_maps
+        assert shared.read_table().num_rows == 5
+
+        shared.unlink()
+        assert not os.path.exists(shared.path)
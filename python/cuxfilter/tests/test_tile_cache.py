@@ -0,0 +1,61 @@
+import numpy as np
+
+from cuxfilter.tile_cache import TileCache
+
+
+class TestTileCache:
+    def test_get(self):
+        cache = TileCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {"tile": len(calls)}
+
+        tile = cache.get(("a", "b", ""), compute)
+        assert tile == {"tile": 1}
+        assert cache.get(("a", "b", ""), compute) is tile
+        assert len(calls) == 1
+        assert ("a", "b", "") in cache
+
+        assert cache.get(("a", "b", "x > 1"), compute) == {"tile": 2}
+        assert len(cache) == 2
+
+    def test_max_tiles(self):
+        cache = TileCache(max_tiles=2)
+        cache.get(0, lambda: 0)
+        cache.get(1, lambda: 1)
+        # 0 is now the most recently used tile, 1 is released first
+        cache.get(0, lambda: None)
+        cache.get(2, lambda: 2)
+
+        assert len(cache) == 2
+        assert 0 in cache
+        assert 1 not in cache
+        assert 2 in cache
+
+    def test_max_bytes(self):
+        cache = TileCache(max_bytes=100)
+        cache.get(0, lambda: np.zeros(5))
+        cache.get(1, lambda: [np.zeros(5), np.zeros(2)])
+        assert cache.nbytes == 96
+
+        # 0 is released first to make room for 2
+        cache.get(2, lambda: np.zeros(1))
+        assert 0 not in cache
+        assert cache.nbytes == 64
+
+        # larger than the cache, returned but not kept
+        tile = cache.get(3, lambda: np.zeros(20))
+        assert tile.shape == (20,)
+        assert 3 not in cache
+        assert 1 in cache and 2 in cache
+
+    def test_clear(self):
+        cache = TileCache()
+        cache.get(0, lambda: 0)
+        cache.clear()
+
+        assert len(cache) == 0
+        assert 0 not in cache
+        assert cache.nbytes == 0
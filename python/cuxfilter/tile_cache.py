@@ -0,0 +1,103 @@
+import threading
+from collections import OrderedDict
+
+
+def tile_nbytes(tile):
+    """
+    host memory held by a data tile: an ndarray, a pandas DataFrame, a
+    QuantileSketch, or a list or dict of those
+    """
+    if isinstance(tile, (list, tuple)):
+        return sum(tile_nbytes(value) for value in tile)
+    if isinstance(tile, dict):
+        return sum(tile_nbytes(value) for value in tile.values())
+    if hasattr(tile, "memory_usage"):
+        return int(tile.memory_usage(index=True).sum())
+    if hasattr(tile, "nbytes"):
+        return int(tile.nbytes)
+    if hasattr(tile, "counts"):
+        return tile_nbytes(tile.counts)
+    return 0
+
+
+class TileCache:
+    """
+    Cache of the data tiles of a dashboard, shared read-only by the
+    dashboards of every bokeh session over the same data.
+
+    A tile is keyed by the active chart, the passive chart it was computed
+    for, the query of the remaining filters and the tile layout, so that
+    sessions in the same filter state reuse the tiles computed by the first
+    one, and a dashboard switching back to an active view reuses its
+    earlier tiles. At most max_tiles tiles holding at most max_bytes of
+    host memory are kept, the least recently used ones are released first.
+    A single tile larger than max_bytes is returned but not kept.
+    """
+
+    max_tiles: int = 32
+    max_bytes: int = 1 << 30
+
+    def __init__(self, max_tiles=32, max_bytes=1 << 30):
+        """
+        Parameters
+        ----------
+        max_tiles: maximum number of tiles kept in the cache
+        max_bytes: maximum host memory of the tiles kept in the cache
+        """
+        self.max_tiles = max_tiles
+        self.max_bytes = max_bytes
+        self._tiles = OrderedDict()
+        self._sizes = {}
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._tiles)
+
+    @property
+    def nbytes(self):
+        """
+        host memory held by the cached tiles
+        """
+        return self._nbytes
+
+    def __contains__(self, key):
+        return key in self._tiles
+
+    def get(self, key, compute):
+        """
+        tile cached for key, calling compute() to calculate it on a miss.
+        Cached tiles must not be modified
+        """
+        with self._lock:
+            if key in self._tiles:
+                self._tiles.move_to_end(key)
+                return self._tiles[key]
+
+        tile = compute()
+        nbytes = tile_nbytes(tile)
+        if nbytes > self.max_bytes:
+            return tile
+        with self._lock:
+            if key in self._tiles:
+                self._nbytes -= self._sizes[key]
+            self._tiles[key] = tile
+            self._tiles.move_to_end(key)
+            self._sizes[key] = nbytes
+            self._nbytes += nbytes
+            while (
+                len(self._tiles) > self.max_tiles
+                or self._nbytes > self.max_bytes
+            ):
+                old_key, _ = self._tiles.popitem(last=False)
+                self._nbytes -= self._sizes.pop(old_key)
+        return tile
+
+    def clear(self):
+        """
+        release every cached tile
+        """
+        with self._lock:
+            self._tiles.clear()
+            self._sizes.clear()
+            self._nbytes = 0